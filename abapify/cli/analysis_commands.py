@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Comandos de análise SAP para a CLI do ABAPify.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from abapify.cli.generate_commands import OUTPUT_DIR
+from abapify.utils.config import SAP_ENVIRONMENTS
+
+
+@click.command("analyze-table")
+@click.option(
+    "--table-name",
+    "-t",
+    required=True,
+    help="Nome da tabela a ser analisada",
+)
+@click.option(
+    "--environment",
+    "-e",
+    type=click.Choice(SAP_ENVIRONMENTS),
+    help="Ambiente SAP",
+)
+@click.option(
+    "--include-relationships",
+    is_flag=True,
+    help="Incluir análise de relacionamentos",
+)
+@click.option(
+    "--output",
+    "-o",
+    help="Arquivo de saída para salvar análise (JSON)",
+)
+def analyze_table_command(
+    table_name: str,
+    environment: Optional[str],
+    include_relationships: bool,
+    output: Optional[str]
+):
+    """Analisa estrutura de uma tabela SAP."""
+    from abapify.cli.sap_commands import analyze_table_structure
+    analyze_table_structure(
+        table_name=table_name,
+        environment=environment or "DEV",
+        include_relationships=include_relationships,
+        output_file=output
+    )
+
+
+@click.command("sap-generate")
+@click.option(
+    "--type",
+    "-t",
+    required=True,
+    type=click.Choice(["alv", "report", "class"]),
+    help="Tipo de código a gerar",
+)
+@click.option(
+    "--description",
+    "-d",
+    required=True,
+    help="Descrição do código a ser gerado",
+)
+@click.option(
+    "--tables",
+    "-tb",
+    multiple=True,
+    help="Tabelas a serem utilizadas",
+)
+@click.option(
+    "--environment",
+    "-e",
+    type=click.Choice(SAP_ENVIRONMENTS),
+    help="Ambiente SAP para análise",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=OUTPUT_DIR,
+    default="./output",
+    help="Diretório de saída",
+)
+@click.option(
+    "--filename",
+    "-f",
+    help="Nome do arquivo de saída",
+)
+def sap_generate_command(
+    type: str,
+    description: str,
+    tables: tuple[str, ...],
+    environment: Optional[str],
+    output: Path,
+    filename: Optional[str]
+):
+    """Gera código ABAP com análise automática SAP."""
+    from abapify.cli.sap_commands import generate_sap_aware_code
+    generate_sap_aware_code(
+        code_type=type,
+        description=description,
+        tables=list(tables),
+        output_dir=output,
+        filename=filename,
+        sap_environment=environment or "DEV"
+    )
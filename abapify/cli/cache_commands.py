@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Comandos de gerenciamento do cache para a CLI do ABAPify.
+"""
+
+import click
+
+from abapify.utils.cache import clear_cache, get_cache_dir
+from abapify.utils.console import get_console
+from abapify.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@click.group()
+def cache():
+    """Comandos de gerenciamento do cache do ABAPify."""
+    pass
+
+
+@cache.command("clear")
+def clear_cache_command():
+    """Remove as respostas dos modelos e as análises SAP armazenadas em cache."""
+    try:
+        removed = clear_cache()
+        get_console().print(f"[green]Cache limpo:[/] {removed} arquivo(s) removido(s) de {get_cache_dir()}")
+    except Exception as e:
+        logger.error(f"Erro ao limpar cache: {str(e)}")
+        get_console().print(f"[bold red]Erro ao limpar cache:[/] {str(e)}")
@@ -5,240 +5,456 @@
 Implementação dos comandos da CLI.
 """
 
+import atexit
 import os
-from typing import List, Optional, Tuple
+import re
+import sys
+from concurrent.futures import Future, wait
+from functools import cache, lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
-from rich.console import Console
-from rich.prompt import Prompt, Confirm
-from rich.panel import Panel
-
-from abapify.core.generator import AbapGenerator
 from abapify.utils.config import get_config_value
-from abapify.utils.logger import get_logger
+from abapify.utils.console import get_console
+from abapify.utils.filenames import default_filename
+
+if TYPE_CHECKING:
+    from abapify.core.generator import AbapGenerator
+
+
+@cache
+def _log():
+    """Obtém o logger do módulo, criado apenas quando necessário."""
+    from abapify.utils.logger import get_logger
+    
+    return get_logger(__name__)
+
+
+# Marcação Rich removida das mensagens quando a saída não é um terminal
+_MARKUP_RE = re.compile(r"\[/?[^\]]+\]")
+
+# Tipos de programa oferecidos pelo assistente personalizado
+_PROGRAM_TYPES = ("Report", "Class", "Function Group", "Interface", "Enhancement")
+
+# Perguntas básicas do assistente: (campo, pergunta, opções do Prompt, cabeçalho)
+_WIZARD_BASIC = (
+    ("specification", "Descrição detalhada do que o programa deve fazer", {},
+     "\n[cyan]Especificação do Programa:[/cyan]"),
+    ("program_type", "Tipo de programa", {"choices": _PROGRAM_TYPES, "default": "Report"}, None),
+    ("main_features", "Liste as principais funcionalidades (separadas por vírgula)", {},
+     "\n[cyan]Funcionalidades Principais:[/cyan]"),
+    ("entities", "Tabelas/Entidades envolvidas (separadas por vírgula)", {"default": ""}, None),
+    ("integrations", "Integrações necessárias (APIs, RFCs, etc.)", {"default": "Nenhuma"}, None),
+    ("business_rules", "Regras de negócio específicas", {"default": ""}, None),
+)
+
+# Requisitos avançados do assistente: (campo, pergunta, valor padrão)
+_WIZARD_ADVANCED = (
+    ("performance_requirements", "Requisitos de performance", "Padrão"),
+    ("security_requirements", "Requisitos de segurança", "Verificações de autorização padrão"),
+    ("usability_requirements", "Requisitos de usabilidade", "Interface intuitiva"),
+)
+
+# Tipos de artefato aceitos em lotes e seus rótulos nas mensagens
+_BATCH_KINDS = {
+    "alv": "relatório ALV",
+    "report": "relatório ABAP",
+    "class": "classe ABAP",
+    "function_module": "módulo de função ABAP",
+    "structure": "estrutura ABAP",
+    "test": "teste unitário ABAP",
+    "custom_program": "programa personalizado",
+    "enhancement": "enhancement ABAP",
+}
+
+# Funções de caminho pré-vinculadas, usadas a cada gravação
+_join = os.path.join
+_abspath = os.path.abspath
+
+# Diretórios de saída já garantidos neste processo
+_ENSURED_DIRS: set = set()
+
+# Gravações em segundo plano ainda não aguardadas
+_PENDING_SAVES: List[Future] = []
+
 
-console = Console()
-logger = get_logger(__name__)
+def _dir_key(output_dir: Union[str, Path]) -> Path:
+    """Normaliza o diretório de saída; caminhos já resolvidos pelo Click são usados como estão."""
+    if isinstance(output_dir, Path) and output_dir.is_absolute():
+        return output_dir
+    return Path(_abspath(output_dir))
 
 
-def _ensure_output_dir(output_dir: str) -> None:
+def _ensure_output_dir(output_dir: Union[str, Path]) -> None:
     """Garante que o diretório de saída existe."""
-    os.makedirs(output_dir, exist_ok=True)
+    key = _dir_key(output_dir)
+    if key in _ENSURED_DIRS:
+        return
+    key.mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRS.add(key)
 
 
-def _save_code(code: str, output_dir: str, filename: str) -> str:
+def _save_code(code: str, output_dir: Union[str, Path], filename: str) -> str:
     """Salva o código gerado no arquivo de saída."""
     _ensure_output_dir(output_dir)
-    file_path = os.path.join(output_dir, filename)
+    file_path = _join(output_dir, filename)
     
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(code)
+    # Grava o conteúdo inteiro de uma vez, sem camadas de buffer de texto
+    data = memoryview(code.encode("utf-8"))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    try:
+        fd = os.open(file_path, flags, 0o644)
+    except FileNotFoundError:
+        # O diretório foi removido depois de garantido; recria e tenta novamente
+        _ENSURED_DIRS.discard(_dir_key(output_dir))
+        _ensure_output_dir(output_dir)
+        fd = os.open(file_path, flags, 0o644)
+    try:
+        while data:
+            written = os.write(fd, data)
+            data = data[written:]
+    finally:
+        os.close(fd)
     
     return file_path
 
 
-def generate_alv(
-    description: str, tables: Tuple[str, ...], output_dir: str, filename: str
-) -> None:
-    """Gera um relatório ALV."""
+def _report_error(message: str) -> None:
+    """Reporta uma mensagem de erro no stderr e no log."""
+    sys.stderr.write(message + "\n")
+    _log().error(message)
+
+
+@cache
+def _io_pool():
+    """Obtém o pool de threads usado para gravar arquivos em segundo plano."""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    atexit.register(drain_pending_saves)
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="abapify-io")
+
+
+def _save_and_report(code: str, output_dir: Union[str, Path], filename: str, label: str) -> Optional[str]:
+    """Salva o código gerado e reporta o resultado; retorna o caminho ou None em caso de erro."""
     try:
-        console.print(f"[bold green]Gerando relatório ALV:[/] {description}")
-        
-        generator = AbapGenerator()
-        code = generator.generate_alv(description, list(tables))
-        
         file_path = _save_code(code, output_dir, filename)
-        
-        console.print(f"[bold green]Código gerado com sucesso:[/] {file_path}")
+        _emit("[bold green]Código gerado com sucesso:[/] {}", file_path)
+        return file_path
     except Exception as e:
-        logger.error(f"Erro ao gerar relatório ALV: {str(e)}")
-        console.print(f"[bold red]Erro ao gerar relatório ALV:[/] {str(e)}")
+        _report_error(f"Erro ao gerar {label}: {e}")
+        return None
 
 
-def generate_report(
-    description: str, tables: Tuple[str, ...], output_dir: str, filename: str
+def _save_code_async(code: str, output_dir: Union[str, Path], filename: str, label: str) -> Future:
+    """
+    Agenda a gravação do código gerado em segundo plano.
+
+    A gravação é aguardada ao final do comando Click em execução ou,
+    fora da CLI, na finalização do processo.
+
+    Args:
+        code: Código gerado.
+        output_dir: Diretório de saída.
+        filename: Nome do arquivo de saída.
+        label: Descrição do artefato usada nas mensagens.
+
+    Returns:
+        Future: Gravação agendada.
+    """
+    import click
+    
+    future = _io_pool().submit(_save_and_report, code, output_dir, filename, label)
+    _PENDING_SAVES.append(future)
+    
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None:
+        root = ctx.find_root()
+        if not root.meta.get("abapify.drain_saves"):
+            root.meta["abapify.drain_saves"] = True
+            root.call_on_close(drain_pending_saves)
+    
+    return future
+
+
+def drain_pending_saves() -> None:
+    """Aguarda a conclusão de todas as gravações em segundo plano."""
+    while _PENDING_SAVES:
+        pending = _PENDING_SAVES[:]
+        del _PENDING_SAVES[:len(pending)]
+        wait(pending)
+
+
+@cache
+def _plain(template: str) -> str:
+    """Remove a marcação Rich de um modelo de mensagem."""
+    return _MARKUP_RE.sub("", template)
+
+
+def _emit(template: str, *args) -> None:
+    """
+    Exibe uma mensagem de progresso.
+
+    Em terminais a mensagem é renderizada pelo Rich; quando a saída é
+    redirecionada, o modelo sem marcação é escrito diretamente.
+
+    Args:
+        template: Modelo da mensagem com marcação Rich e campos "{}".
+        *args: Valores dos campos do modelo.
+    """
+    if sys.stdout.isatty():
+        get_console().print(template.format(*args))
+    else:
+        sys.stdout.write(_plain(template).format(*args) + "\n")
+
+
+@lru_cache(maxsize=1)
+def _get_generator() -> "AbapGenerator":
+    """Obtém a instância compartilhada do AbapGenerator, criada sob demanda."""
+    from abapify.core.generator import AbapGenerator
+    
+    return AbapGenerator()
+
+
+@cache
+def _custom_program_banner():
+    """Obtém o painel de abertura do assistente de programa personalizado."""
+    from rich.panel import Panel
+    
+    return Panel.fit(
+        "[bold blue]Assistente de Programa Personalizado[/bold blue]",
+        border_style="blue"
+    )
+
+
+def _generate_code(method: str, *args, **kwargs) -> str:
+    """
+    Executa um método de geração do AbapGenerator.
+
+    Respostas repetidas são reaproveitadas pelo cache de respostas do
+    LLMClient, que considera provedor, modelo, temperatura e max_tokens.
+    """
+    generator = _get_generator()
+    return getattr(generator, method)(*args, **kwargs)
+
+
+def _run_generation(
+    label: str, subject: str, method: str, output_dir: Union[str, Path], filename: str, *args, **kwargs
 ) -> None:
-    """Gera um relatório ABAP."""
+    """
+    Executa uma geração e salva o resultado, reportando o progresso no console.
+
+    Args:
+        label: Descrição do artefato usada nas mensagens (ex.: "classe ABAP").
+        subject: Texto exibido ao lado do rótulo na mensagem inicial.
+        method: Nome do método do AbapGenerator a ser chamado.
+        output_dir: Diretório de saída.
+        filename: Nome do arquivo de saída.
+        *args: Argumentos posicionais do método de geração.
+        **kwargs: Argumentos nomeados do método de geração.
+    """
     try:
-        console.print(f"[bold green]Gerando relatório ABAP:[/] {description}")
+        _emit("[bold green]Gerando {}:[/] {}", label, subject)
         
-        generator = AbapGenerator()
-        code = generator.generate_report(description, list(tables))
+        code = _generate_code(method, *args, **kwargs)
         
-        file_path = _save_code(code, output_dir, filename)
-        
-        console.print(f"[bold green]Código gerado com sucesso:[/] {file_path}")
+        _save_code_async(code, output_dir, filename, label)
     except Exception as e:
-        logger.error(f"Erro ao gerar relatório ABAP: {str(e)}")
-        console.print(f"[bold red]Erro ao gerar relatório ABAP:[/] {str(e)}")
+        _report_error(f"Erro ao gerar {label}: {e}")
+
+
+def generate_alv(
+    description: str, tables: Tuple[str, ...], output_dir: Union[str, Path], filename: str
+) -> None:
+    """Gera um relatório ALV."""
+    _run_generation(
+        "relatório ALV", description, "generate_alv", output_dir, filename,
+        description, list(tables)
+    )
+
+
+def generate_report(
+    description: str, tables: Tuple[str, ...], output_dir: Union[str, Path], filename: str
+) -> None:
+    """Gera um relatório ABAP."""
+    _run_generation(
+        "relatório ABAP", description, "generate_report", output_dir, filename,
+        description, list(tables)
+    )
 
 
 def generate_class(
-    description: str, methods: Tuple[str, ...], output_dir: str, filename: str
+    description: str, methods: Tuple[str, ...], output_dir: Union[str, Path], filename: str
 ) -> None:
     """Gera uma classe ABAP."""
-    try:
-        console.print(f"[bold green]Gerando classe ABAP:[/] {description}")
-        
-        generator = AbapGenerator()
-        code = generator.generate_class(description, list(methods))
-        
-        file_path = _save_code(code, output_dir, filename)
-        
-        console.print(f"[bold green]Código gerado com sucesso:[/] {file_path}")
-    except Exception as e:
-        logger.error(f"Erro ao gerar classe ABAP: {str(e)}")
-        console.print(f"[bold red]Erro ao gerar classe ABAP:[/] {str(e)}")
+    _run_generation(
+        "classe ABAP", description, "generate_class", output_dir, filename,
+        description, list(methods)
+    )
 
 
 def generate_function_module(
-    description: str, params: Tuple[str, ...], output_dir: str, filename: str
+    description: str, params: Tuple[str, ...], output_dir: Union[str, Path], filename: str
 ) -> None:
     """Gera um módulo de função ABAP."""
-    try:
-        console.print(f"[bold green]Gerando módulo de função ABAP:[/] {description}")
-        
-        generator = AbapGenerator()
-        code = generator.generate_function_module(description, list(params))
-        
-        file_path = _save_code(code, output_dir, filename)
-        
-        console.print(f"[bold green]Código gerado com sucesso:[/] {file_path}")
-    except Exception as e:
-        logger.error(f"Erro ao gerar módulo de função ABAP: {str(e)}")
-        console.print(f"[bold red]Erro ao gerar módulo de função ABAP:[/] {str(e)}")
+    _run_generation(
+        "módulo de função ABAP", description, "generate_function_module", output_dir, filename,
+        description, list(params)
+    )
 
 
 def generate_structure(
-    description: str, fields: Tuple[str, ...], output_dir: str, filename: str
+    description: str, fields: Tuple[str, ...], output_dir: Union[str, Path], filename: str
 ) -> None:
     """Gera uma estrutura ABAP."""
-    try:
-        console.print(f"[bold green]Gerando estrutura ABAP:[/] {description}")
-        
-        generator = AbapGenerator()
-        code = generator.generate_structure(description, list(fields))
-        
-        file_path = _save_code(code, output_dir, filename)
-        
-        console.print(f"[bold green]Código gerado com sucesso:[/] {file_path}")
-    except Exception as e:
-        logger.error(f"Erro ao gerar estrutura ABAP: {str(e)}")
-        console.print(f"[bold red]Erro ao gerar estrutura ABAP:[/] {str(e)}")
+    _run_generation(
+        "estrutura ABAP", description, "generate_structure", output_dir, filename,
+        description, list(fields)
+    )
 
 
-def generate_test(target: str, output_dir: str, filename: str) -> None:
+def generate_test(target: str, output_dir: Union[str, Path], filename: str) -> None:
     """Gera um teste unitário ABAP."""
-    try:
-        console.print(f"[bold green]Gerando teste unitário ABAP:[/] {target}")
-        
-        generator = AbapGenerator()
-        code = generator.generate_test(target)
-        
-        file_path = _save_code(code, output_dir, filename)
-        
-        console.print(f"[bold green]Código gerado com sucesso:[/] {file_path}")
-    except Exception as e:
-        logger.error(f"Erro ao gerar teste unitário ABAP: {str(e)}")
-        console.print(f"[bold red]Erro ao gerar teste unitário ABAP:[/] {str(e)}")
+    _run_generation(
+        "teste unitário ABAP", target, "generate_test", output_dir, filename,
+        target
+    )
+
 
+def _stream_code(kind: str, **kwargs) -> str:
+    """
+    Gera um artefato exibindo o código no console à medida que é produzido.
 
-def generate_custom_program(output_dir: str, filename: Optional[str] = None) -> None:
+    Args:
+        kind: Tipo do artefato (ex.: "custom_program").
+        **kwargs: Argumentos nomeados do método generate_* equivalente.
+
+    Returns:
+        str: Código completo gerado.
+    """
+    chunks = []
+    for chunk in _get_generator().generate_stream(kind, **kwargs):
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
+        chunks.append(chunk)
+    sys.stdout.write("\n")
+    return "".join(chunks)
+
+
+def generate_custom_program(
+    output_dir: Union[str, Path], filename: Optional[str] = None, stream: bool = False
+) -> None:
     """Gera um programa ABAP customizado com assistente interativo."""
+    from rich.prompt import Confirm, Prompt
+    
     try:
-        console.print(Panel.fit(
-            "[bold blue]Assistente de Programa Personalizado[/bold blue]",
-            border_style="blue"
-        ))
-        
-        # Coleta informações básicas
-        console.print("\n[cyan]Especificação do Programa:[/cyan]")
-        specification = Prompt.ask("Descrição detalhada do que o programa deve fazer")
-        
-        program_type = Prompt.ask(
-            "Tipo de programa",
-            choices=["Report", "Class", "Function Group", "Interface", "Enhancement"],
-            default="Report"
-        )
-        
-        # Funcionalidades principais
-        console.print(f"\n[cyan]Funcionalidades Principais:[/cyan]")
-        main_features = Prompt.ask("Liste as principais funcionalidades (separadas por vírgula)")
+        get_console().print(_custom_program_banner())
         
-        # Entidades envolvidas
-        entities = Prompt.ask("Tabelas/Entidades envolvidas (separadas por vírgula)", default="")
-        
-        # Integrações
-        integrations = Prompt.ask("Integrações necessárias (APIs, RFCs, etc.)", default="Nenhuma")
-        
-        # Regras de negócio
-        business_rules = Prompt.ask("Regras de negócio específicas", default="")
+        # Coleta as respostas do assistente
+        answers = {}
+        for field, question, options, header in _WIZARD_BASIC:
+            if header:
+                get_console().print(header)
+            answers[field] = Prompt.ask(question, **options)
         
         # Requisitos avançados (opcional)
         advanced_config = Confirm.ask("\nDeseja configurar requisitos avançados?", default=False)
         
-        performance_req = "Padrão"
-        security_req = "Verificações de autorização padrão"
-        usability_req = "Interface intuitiva"
+        for field, question, default in _WIZARD_ADVANCED:
+            answers[field] = Prompt.ask(question, default=default) if advanced_config else default
         
-        if advanced_config:
-            performance_req = Prompt.ask("Requisitos de performance", default="Padrão")
-            security_req = Prompt.ask("Requisitos de segurança", default="Verificações de autorização padrão")
-            usability_req = Prompt.ask("Requisitos de usabilidade", default="Interface intuitiva")
+        specification = answers["specification"]
         
         # Gera nome do arquivo se não fornecido
         if not filename:
-            safe_spec = specification.lower().replace(' ', '_')[:30]
-            filename = f"z_custom_{safe_spec}.abap"
+            filename = default_filename("z_custom_", specification, 30)
         
         # Gera o código
-        console.print(f"\n[bold yellow]Gerando programa personalizado...[/bold yellow]")
+        _emit("\n[bold yellow]Gerando programa personalizado...[/bold yellow]")
         
-        generator = AbapGenerator()
-        code = generator.generate_custom_program(
-            specification=specification,
-            program_type=program_type,
-            main_features=main_features,
-            entities=entities,
-            integrations=integrations,
-            business_rules=business_rules,
-            performance_requirements=performance_req,
-            security_requirements=security_req,
-            usability_requirements=usability_req,
-        )
+        if stream:
+            code = _stream_code("custom_program", **answers)
+        else:
+            code = _generate_code("generate_custom_program", **answers)
         
         file_path = _save_code(code, output_dir, filename)
         
-        console.print(f"\n[bold green]✅ Programa personalizado gerado com sucesso![/]")
-        console.print(f"[green]Arquivo:[/] {file_path}")
+        _emit("\n[bold green]✅ Programa personalizado gerado com sucesso![/]")
+        _emit("[green]Arquivo:[/] {}", file_path)
         
     except Exception as e:
-        logger.error(f"Erro ao gerar programa personalizado: {str(e)}")
-        console.print(f"[bold red]Erro ao gerar programa personalizado:[/] {str(e)}")
+        _report_error(f"Erro ao gerar programa personalizado: {e}")
 
 
 def generate_enhancement(
     base_object: str, 
     enhancement_type: str, 
     functionality: str, 
-    output_dir: str, 
+    output_dir: Union[str, Path], 
     filename: str,
     enhancement_points: str = ""
 ) -> None:
     """Gera um enhancement ABAP."""
-    try:
-        console.print(f"[bold green]Gerando enhancement ABAP:[/] {enhancement_type}")
-        
-        generator = AbapGenerator()
-        code = generator.generate_enhancement(
-            base_object=base_object,
-            enhancement_type=enhancement_type,
-            functionality=functionality,
-            enhancement_points=enhancement_points,
-        )
-        
-        file_path = _save_code(code, output_dir, filename)
-        
-        console.print(f"[bold green]Código gerado com sucesso:[/] {file_path}")
-    except Exception as e:
-        logger.error(f"Erro ao gerar enhancement ABAP: {str(e)}")
-        console.print(f"[bold red]Erro ao gerar enhancement ABAP:[/] {str(e)}")
\ No newline at end of file
+    _run_generation(
+        "enhancement ABAP", enhancement_type, "generate_enhancement", output_dir, filename,
+        base_object=base_object,
+        enhancement_type=enhancement_type,
+        functionality=functionality,
+        enhancement_points=enhancement_points,
+    )
+
+
+def generate_batch(specs: List[Dict[str, Any]], output_dir: Union[str, Path]) -> int:
+    """
+    Gera vários artefatos ABAP com chamadas simultâneas ao provedor.
+
+    Cada especificação é um dicionário com as chaves "kind" (tipo do
+    artefato, ex.: "class"), "args" (argumentos nomeados do método de
+    geração) e, opcionalmente, "filename" (nome simples, sem diretórios).
+    Itens inválidos são reportados e ignorados; os demais são enviados em
+    um único AbapGenerator.generate_bundle. As gravações ocorrem em
+    segundo plano e são aguardadas antes do retorno.
+
+    Args:
+        specs: Lista de especificações de geração.
+        output_dir: Diretório de saída.
+
+    Returns:
+        int: Número de artefatos gerados com sucesso.
+    """
+    valid = []
+    for index, spec in enumerate(specs, 1):
+        if not isinstance(spec, dict):
+            sys.stderr.write(f"Especificação inválida no item {index}: {spec!r}\n")
+            continue
+        
+        kind = spec.get("kind")
+        label = _BATCH_KINDS.get(kind) if isinstance(kind, str) else None
+        if label is None:
+            sys.stderr.write(f"Tipo de artefato inválido no item {index}: {kind}\n")
+            continue
+        
+        filename = spec.get("filename") or f"z_{kind}_{index}.abap"
+        if not isinstance(filename, str) or filename in (".", "..") or any(sep in filename for sep in "/\\"):
+            sys.stderr.write(f"Nome de arquivo inválido no item {index}: {filename}\n")
+            continue
+        
+        valid.append((label, filename, {"kind": kind, "args": spec.get("args", {})}))
+    
+    if not valid:
+        return 0
+    
+    for label, filename, _ in valid:
+        _emit("[bold green]Gerando {}:[/] {}", label, filename)
+    codes = _get_generator().generate_bundle(
+        [request for _, _, request in valid], return_exceptions=True
+    )
+    
+    generated = []
+    for (label, filename, _), code in zip(valid, codes):
+        if isinstance(code, Exception):
+            _report_error(f"Erro ao gerar {label}: {code}")
+            continue
+        generated.append(_save_code_async(code, output_dir, filename, label))
+    
+    drain_pending_saves()
+    return sum(1 for future in generated if future.result() is not None)
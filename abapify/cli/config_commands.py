@@ -5,20 +5,139 @@
 Comandos de configuração para a CLI do ABAPify.
 """
 
+import functools
+import hashlib
 import os
-from typing import Optional
+from contextlib import closing
+from itertools import islice
+from typing import Callable, Dict, List, Optional
 
 import click
-from rich.console import Console
-from rich.prompt import Prompt, Confirm
-from rich.table import Table
-from rich.panel import Panel
 
-from abapify.utils.config import save_config, list_config, get_config_value, get_sap_environments
-from abapify.utils.logger import get_logger
+from abapify.utils.config import (
+    LLM_PROVIDERS,
+    SAP_ENVIRONMENTS,
+    config_batch,
+    get_config_value,
+    get_sap_environments,
+    list_config,
+    save_config,
+)
+from abapify.utils.console import get_console
+
+# Configurações exibidas na categoria "Outras Configurações"
+_OTHER_KEYS = frozenset({"OUTPUT_DIR"})
+
+# Categorias de "config show": (título, estilo, largura da coluna, prefixo removido)
+_CATEGORIES = (
+    ("Configurações LLM", "cyan", 25, ""),
+    ("Configurações SAP", "yellow", 30, "SAP_"),
+    ("Outras Configurações", "green", 25, ""),
+)
+
+# Converte "_" em espaço nos nomes exibidos
+_UNDERSCORE_TABLE = str.maketrans("_", " ")
+
+
+@functools.cache
+def _log():
+    """Obtém o logger do módulo, criado apenas quando necessário."""
+    from abapify.utils.logger import get_logger
+    
+    return get_logger(__name__)
+
+
+def _sap_environments() -> List[str]:
+    """
+    Obtém os ambientes SAP configurados, reaproveitando o resultado no contexto Click.
+
+    Returns:
+        List[str]: Ambientes configurados.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return get_sap_environments()
+    
+    obj = ctx.find_root().ensure_object(dict)
+    if "sap_envs" not in obj:
+        obj["sap_envs"] = get_sap_environments()
+    return obj["sap_envs"]
 
-console = Console()
-logger = get_logger(__name__)
+
+def _invalidate_sap_environments() -> None:
+    """Descarta os ambientes SAP armazenados no contexto Click após uma gravação."""
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None:
+        ctx.find_root().ensure_object(dict).pop("sap_envs", None)
+
+
+@functools.cache
+def _setup_banner():
+    """Obtém o painel de abertura do assistente de configuração."""
+    from rich.panel import Panel
+    
+    return Panel.fit(
+        "[bold blue]Assistente de Configuração do ABAPify[/bold blue]",
+        border_style="blue"
+    )
+
+
+@functools.cache
+def _sap_banner():
+    """Obtém o painel de abertura da configuração SAP."""
+    from rich.panel import Panel
+    
+    return Panel.fit(
+        "[bold yellow]Configuração SAP[/bold yellow]",
+        border_style="yellow"
+    )
+
+
+@functools.cache
+def _display(key: str, prefix: str = "") -> str:
+    """
+    Obtém o nome de exibição de uma chave de configuração.
+
+    O conjunto de chaves é fixo, então cada nome é calculado uma única vez
+    por processo e reaproveitado nas exibições seguintes.
+
+    Args:
+        key: Chave da configuração (ex.: "SAP_DEV_ASHOST").
+        prefix: Prefixo removido antes da formatação (ex.: "SAP_").
+
+    Returns:
+        str: Nome de exibição (ex.: "Dev Ashost").
+    """
+    return key.removeprefix(prefix).translate(_UNDERSCORE_TABLE).title()
+
+
+def _render(title: str, key_style: str, key_width: int, prefix: str, data: dict):
+    """
+    Monta a tabela de uma categoria de configurações.
+
+    Tabelas Rich acumulam as células nas próprias colunas, por isso uma
+    nova instância é criada a cada exibição em vez de reaproveitada.
+
+    Args:
+        title: Título da tabela.
+        key_style: Estilo da coluna de nomes.
+        key_width: Largura da coluna de nomes.
+        prefix: Prefixo removido dos nomes exibidos.
+        data: Configurações da categoria.
+
+    Returns:
+        Table: Tabela preenchida.
+    """
+    from rich.table import Table
+    
+    table = Table(title=title, show_header=True)
+    table.add_column("Configuração", style=key_style, width=key_width)
+    table.add_column("Valor", style="white")
+    
+    for key, value in data.items():
+        table.add_row(_display(key, prefix), value or "[dim]Não configurado[/dim]")
+    
+    return table
 
 
 @click.group()
@@ -30,7 +149,7 @@ def config():
 @config.command("set")
 @click.option(
     "--provider",
-    type=click.Choice(["arcee", "groq", "openai"]),
+    type=click.Choice(LLM_PROVIDERS),
     help="Define o provedor padrão de IA"
 )
 @click.option("--arcee-token", help="Token da API Arcee")
@@ -54,230 +173,270 @@ def set_config(
         
         if provider:
             config_updates["DEFAULT_PROVIDER"] = provider
-            console.print(f"[green]Provedor padrão definido como:[/] {provider}")
+            get_console().print(f"[green]Provedor padrão definido como:[/] {provider}")
         
         if arcee_token:
             config_updates["ARCEE_TOKEN"] = arcee_token
-            console.print("[green]Token Arcee configurado[/]")
+            get_console().print("[green]Token Arcee configurado[/]")
         
         if groq_key:
             config_updates["GROQ_API_KEY"] = groq_key
-            console.print("[green]Chave Groq configurada[/]")
+            get_console().print("[green]Chave Groq configurada[/]")
         
         if openai_key:
             config_updates["OPENAI_API_KEY"] = openai_key
-            console.print("[green]Chave OpenAI configurada[/]")
+            get_console().print("[green]Chave OpenAI configurada[/]")
         
         if output_dir:
             config_updates["OUTPUT_DIR"] = output_dir
-            console.print(f"[green]Diretório de saída definido como:[/] {output_dir}")
+            get_console().print(f"[green]Diretório de saída definido como:[/] {output_dir}")
         
         if temperature is not None:
             if 0.0 <= temperature <= 1.0:
-                config_updates["DEFAULT_TEMPERATURE"] = str(temperature)
-                console.print(f"[green]Temperatura padrão definida como:[/] {temperature}")
+                config_updates["DEFAULT_TEMPERATURE"] = format(temperature, "g")
+                get_console().print(f"[green]Temperatura padrão definida como:[/] {temperature}")
             else:
-                console.print("[red]Erro: Temperatura deve estar entre 0.0 e 1.0[/]")
+                get_console().print("[red]Erro: Temperatura deve estar entre 0.0 e 1.0[/]")
                 return
         
         if max_tokens:
-            config_updates["DEFAULT_MAX_TOKENS"] = str(max_tokens)
-            console.print(f"[green]Máximo de tokens definido como:[/] {max_tokens}")
+            config_updates["DEFAULT_MAX_TOKENS"] = format(max_tokens, "d")
+            get_console().print(f"[green]Máximo de tokens definido como:[/] {max_tokens}")
+        
+        # Descarta valores iguais aos atuais para não reescrever o .env sem necessidade
+        config_updates = {
+            key: value for key, value in config_updates.items()
+            if get_config_value(key) != value
+        }
         
         if config_updates:
             save_config(config_updates)
-            console.print("\n[bold green]Configurações salvas com sucesso![/]")
+            get_console().print("\n[bold green]Configurações salvas com sucesso![/]")
         else:
-            console.print("[yellow]Nenhuma configuração foi alterada.[/]")
+            get_console().print("[yellow]Nenhuma configuração foi alterada.[/]")
     
     except Exception as e:
-        logger.error(f"Erro ao definir configurações: {str(e)}")
-        console.print(f"[bold red]Erro ao definir configurações:[/] {str(e)}")
+        _log().error(f"Erro ao definir configurações: {str(e)}")
+        get_console().print(f"[bold red]Erro ao definir configurações:[/] {str(e)}")
 
 
 @config.command("show")
 def show_config():
     """Exibe as configurações atuais."""
+    from rich.console import Group
+    
     try:
         config_data = list_config()
         
-        # Separar configurações por categoria
-        llm_config = {k: v for k, v in config_data.items() 
-                     if not k.startswith("SAP_") and k not in ["OUTPUT_DIR"]}
-        sap_config = {k: v for k, v in config_data.items() if k.startswith("SAP_")}
-        other_config = {k: v for k, v in config_data.items() 
-                       if k in ["OUTPUT_DIR"] or (not k.startswith("SAP_") and k not in llm_config)}
-        
-        # Tabela LLM
-        if llm_config:
-            table_llm = Table(title="Configurações LLM", show_header=True)
-            table_llm.add_column("Configuração", style="cyan", width=25)
-            table_llm.add_column("Valor", style="white")
-            
-            for key, value in llm_config.items():
-                display_name = key.replace("_", " ").title()
-                table_llm.add_row(display_name, value or "[dim]Não configurado[/dim]")
-            
-            console.print(table_llm)
-            console.print()
+        # Separar configurações por categoria em uma única passagem
+        llm_config, sap_config, other_config = {}, {}, {}
+        for key, value in config_data.items():
+            if key.startswith("SAP_"):
+                sap_config[key] = value
+            elif key in _OTHER_KEYS:
+                # Sem valor definido, a categoria não é exibida
+                if value:
+                    other_config[key] = value
+            else:
+                llm_config[key] = value
         
-        # Tabela SAP
-        if sap_config:
-            table_sap = Table(title="Configurações SAP", show_header=True)
-            table_sap.add_column("Configuração", style="yellow", width=30)
-            table_sap.add_column("Valor", style="white")
-            
-            for key, value in sap_config.items():
-                display_name = key.replace("SAP_", "").replace("_", " ").title()
-                table_sap.add_row(display_name, value or "[dim]Não configurado[/dim]")
-            
-            console.print(table_sap)
-            console.print()
+        # Monta uma tabela por categoria não vazia e exibe todas de uma vez
+        renderables = []
+        for spec, data in zip(_CATEGORIES, (llm_config, sap_config, other_config)):
+            if data:
+                if renderables:
+                    renderables.append("")
+                renderables.append(_render(*spec, data))
         
-        # Tabela outras configurações
-        if other_config:
-            table_other = Table(title="Outras Configurações", show_header=True)
-            table_other.add_column("Configuração", style="green", width=25)
-            table_other.add_column("Valor", style="white")
-            
-            for key, value in other_config.items():
-                display_name = key.replace("_", " ").title()
-                table_other.add_row(display_name, value or "[dim]Não configurado[/dim]")
-            
-            console.print(table_other)
+        if renderables:
+            get_console().print(Group(*renderables))
     
     except Exception as e:
-        logger.error(f"Erro ao exibir configurações: {str(e)}")
-        console.print(f"[bold red]Erro ao exibir configurações:[/] {str(e)}")
+        _log().error(f"Erro ao exibir configurações: {str(e)}")
+        get_console().print(f"[bold red]Erro ao exibir configurações:[/] {str(e)}")
 
 
 @config.command("setup")
 def setup_config():
     """Assistente interativo para configuração inicial."""
-    console.print(Panel.fit(
-        "[bold blue]Assistente de Configuração do ABAPify[/bold blue]",
-        border_style="blue"
-    ))
+    from rich.prompt import Confirm, Prompt
+    
+    get_console().print(_setup_banner())
     
     try:
-        config_updates = {}
-        
-        # Configuração do provedor LLM
-        console.print("\n[cyan]Escolha o provedor de IA padrão:[/cyan]")
-        provider = Prompt.ask(
-            "Provedor",
-            choices=["arcee", "groq", "openai"],
-            default="arcee"
-        )
-        config_updates["DEFAULT_PROVIDER"] = provider
-        
-        # Configuração das chaves de API
-        console.print(f"\n[cyan]Configure as credenciais para {provider}:[/cyan]")
-        
-        if provider == "arcee":
-            token = Prompt.ask("Token Arcee", password=True)
-            if token:
-                config_updates["ARCEE_TOKEN"] = token
-        elif provider == "groq":
-            key = Prompt.ask("Chave API Groq", password=True)
-            if key:
-                config_updates["GROQ_API_KEY"] = key
-        elif provider == "openai":
-            key = Prompt.ask("Chave API OpenAI", password=True)
-            if key:
-                config_updates["OPENAI_API_KEY"] = key
-        
-        # Configuração SAP
-        if Confirm.ask("\nDeseja configurar integração SAP?", default=True):
-            setup_sap_config(config_updates)
-        
-        # Outras configurações opcionais
-        if Confirm.ask("\nDeseja configurar opções avançadas?", default=False):
-            output_dir = Prompt.ask("Diretório de saída", default="./output")
-            config_updates["OUTPUT_DIR"] = output_dir
+        # Grava o .env uma única vez, ao final do assistente
+        with config_batch():
+            config_updates = {}
+            
+            # Configuração do provedor LLM
+            get_console().print("\n[cyan]Escolha o provedor de IA padrão:[/cyan]")
+            provider = Prompt.ask(
+                "Provedor",
+                choices=LLM_PROVIDERS,
+                default="arcee"
+            )
+            config_updates["DEFAULT_PROVIDER"] = provider
             
-            temperature = Prompt.ask("Temperatura (0.0-1.0)", default="0.7")
-            try:
-                temp_float = float(temperature)
-                if 0.0 <= temp_float <= 1.0:
-                    config_updates["DEFAULT_TEMPERATURE"] = temperature
-            except ValueError:
-                console.print("[yellow]Temperatura inválida, usando padrão (0.7)[/yellow]")
+            # Configuração das chaves de API
+            get_console().print(f"\n[cyan]Configure as credenciais para {provider}:[/cyan]")
             
-            max_tokens = Prompt.ask("Máximo de tokens", default="4096")
-            try:
-                config_updates["DEFAULT_MAX_TOKENS"] = str(int(max_tokens))
-            except ValueError:
-                console.print("[yellow]Valor inválido para tokens, usando padrão (4096)[/yellow]")
-        
-        # Salva as configurações
-        save_config(config_updates)
+            if provider == "arcee":
+                token = Prompt.ask("Token Arcee", password=True)
+                if token:
+                    config_updates["ARCEE_TOKEN"] = token
+            elif provider == "groq":
+                key = Prompt.ask("Chave API Groq", password=True)
+                if key:
+                    config_updates["GROQ_API_KEY"] = key
+            elif provider == "openai":
+                key = Prompt.ask("Chave API OpenAI", password=True)
+                if key:
+                    config_updates["OPENAI_API_KEY"] = key
+            elif provider == "vllm":
+                config_updates["VLLM_BASE_URL"] = Prompt.ask("URL do servidor vLLM", default="http://localhost:8000/v1")
+                model = ""
+                while not model:
+                    model = Prompt.ask("Modelo servido pelo vLLM (obrigatório)").strip()
+                config_updates["VLLM_MODEL"] = model
+            
+            # Configuração SAP
+            if Confirm.ask("\nDeseja configurar integração SAP?", default=True):
+                setup_sap_config(config_updates)
+            
+            # Outras configurações opcionais
+            if Confirm.ask("\nDeseja configurar opções avançadas?", default=False):
+                output_dir = Prompt.ask("Diretório de saída", default="./output")
+                config_updates["OUTPUT_DIR"] = output_dir
+            
+                temperature = Prompt.ask("Temperatura (0.0-1.0)", default="0.7")
+                try:
+                    temp_float = float(temperature)
+                    if 0.0 <= temp_float <= 1.0:
+                        config_updates["DEFAULT_TEMPERATURE"] = temperature
+                except ValueError:
+                    get_console().print("[yellow]Temperatura inválida, usando padrão (0.7)[/yellow]")
+            
+                max_tokens = Prompt.ask("Máximo de tokens", default="4096")
+                try:
+                    config_updates["DEFAULT_MAX_TOKENS"] = str(int(max_tokens))
+                except ValueError:
+                    get_console().print("[yellow]Valor inválido para tokens, usando padrão (4096)[/yellow]")
+            
+            # Salva as configurações
+            save_config(config_updates)
+        _invalidate_sap_environments()
         
-        console.print("\n[bold green]✅ Configuração concluída com sucesso![/]")
-        console.print("Execute [cyan]abapify config show[/cyan] para ver as configurações.")
+        get_console().print("\n[bold green]✅ Configuração concluída com sucesso![/]")
+        get_console().print("Execute [cyan]abapify config show[/cyan] para ver as configurações.")
     
     except Exception as e:
-        logger.error(f"Erro no assistente de configuração: {str(e)}")
-        console.print(f"[bold red]Erro no assistente de configuração:[/] {str(e)}")
+        _log().error(f"Erro no assistente de configuração: {str(e)}")
+        get_console().print(f"[bold red]Erro no assistente de configuração:[/] {str(e)}")
 
 
 @config.command("sap")
 @click.option(
     "--environment",
-    type=click.Choice(["DEV", "QAS", "PRD"]),
+    type=click.Choice(SAP_ENVIRONMENTS),
     help="Ambiente SAP a configurar"
 )
 def setup_sap_config_command(environment: Optional[str]):
     """Configuração específica para SAP."""
-    console.print(Panel.fit(
-        "[bold yellow]Configuração SAP[/bold yellow]",
-        border_style="yellow"
-    ))
+    from rich.prompt import Prompt
+    
+    get_console().print(_sap_banner())
     
     config_updates = {}
     
     if not environment:
         environment = Prompt.ask(
             "Ambiente SAP",
-            choices=["DEV", "QAS", "PRD"],
+            choices=SAP_ENVIRONMENTS,
             default="DEV"
         )
     
-    setup_sap_environment(environment, config_updates)
+    try:
+        with config_batch():
+            setup_sap_environment(environment, config_updates)
+            if config_updates:
+                save_config(config_updates)
+    except Exception as e:
+        _log().error(f"Erro na configuração SAP: {str(e)}")
+        get_console().print(f"[bold red]Erro na configuração SAP:[/] {str(e)}")
+        return
     
     if config_updates:
-        save_config(config_updates)
-        console.print(f"\n[bold green]✅ Configuração SAP {environment} salva![/]")
+        _invalidate_sap_environments()
+        get_console().print(f"\n[bold green]✅ Configuração SAP {environment} salva![/]")
     else:
-        console.print("[yellow]Nenhuma configuração foi alterada.[/yellow]")
+        get_console().print("[yellow]Nenhuma configuração foi alterada.[/yellow]")
 
 
 def setup_sap_config(config_updates: dict):
     """Assistente de configuração SAP."""
-    console.print("\n[yellow]Configuração SAP[/yellow]")
+    from rich.prompt import Confirm, Prompt
+    
+    get_console().print("\n[yellow]Configuração SAP[/yellow]")
     
     # Ambiente padrão
     default_env = Prompt.ask(
         "Ambiente SAP padrão",
-        choices=["DEV", "QAS", "PRD"],
+        choices=SAP_ENVIRONMENTS,
         default="DEV"
     )
     config_updates["SAP_DEFAULT_ENVIRONMENT"] = default_env
     
+    # Mesma chave e mesmo resultado para senhas repetidas entre ambientes
+    encrypt_password = _password_encrypter()
+    
     # Configurar ambiente
-    setup_sap_environment(default_env, config_updates)
+    setup_sap_environment(default_env, config_updates, encrypt_password)
     
     # Configurar outros ambientes
     if Confirm.ask(f"\nDeseja configurar outros ambientes além de {default_env}?", default=False):
-        for env in ["DEV", "QAS", "PRD"]:
+        for env in SAP_ENVIRONMENTS:
             if env != default_env:
                 if Confirm.ask(f"Configurar ambiente {env}?", default=False):
-                    setup_sap_environment(env, config_updates)
+                    setup_sap_environment(env, config_updates, encrypt_password)
+
+
+def _password_encrypter() -> Callable[[str, str], str]:
+    """
+    Cria a função de criptografia de senhas de uma sessão de configuração.
+
+    Um único SAPAuthenticator é criado no primeiro uso e senhas repetidas
+    (identificadas pelo hash SHA-256) reaproveitam o valor já criptografado.
+
+    Returns:
+        Callable[[str, str], str]: Função (ambiente, senha) -> senha criptografada.
+    """
+    auth = None
+    seen: Dict[bytes, str] = {}
+    
+    def encrypt(environment: str, password: str) -> str:
+        nonlocal auth
+        digest = hashlib.sha256(password.encode()).digest()
+        if digest not in seen:
+            if auth is None:
+                from abapify.sap.auth import SAPAuthenticator
+                auth = SAPAuthenticator()
+            seen[digest] = auth.save_encrypted_password(environment, password)
+        return seen[digest]
+    
+    return encrypt
 
 
-def setup_sap_environment(environment: str, config_updates: dict):
+def setup_sap_environment(
+    environment: str,
+    config_updates: dict,
+    encrypt_password: Optional[Callable[[str, str], str]] = None
+):
     """Configura um ambiente SAP específico."""
-    console.print(f"\n[cyan]Configuração do ambiente {environment}:[/cyan]")
+    from rich.prompt import Confirm, Prompt
+    
+    encrypt_password = encrypt_password or _password_encrypter()
+    
+    get_console().print(f"\n[cyan]Configuração do ambiente {environment}:[/cyan]")
     
     prefix = f"SAP_{environment}_"
     
@@ -310,10 +469,7 @@ def setup_sap_environment(environment: str, config_updates: dict):
         password = Prompt.ask(f"Senha ({environment})", password=True)
         if password:
             # Criptografa a senha
-            from abapify.sap.auth import SAPAuthenticator
-            auth = SAPAuthenticator()
-            encrypted_password = auth.save_encrypted_password(environment, password)
-            config_updates[f"{prefix}PASSWD_ENCRYPTED"] = encrypted_password
+            config_updates[f"{prefix}PASSWD_ENCRYPTED"] = encrypt_password(environment, password)
         
         # Configurações opcionais RFC
         if Confirm.ask(f"Configurar SAP Router para {environment}?", default=False):
@@ -347,10 +503,7 @@ def setup_sap_environment(environment: str, config_updates: dict):
         password = Prompt.ask(f"Senha ({environment})", password=True)
         if password:
             # Criptografa a senha
-            from abapify.sap.auth import SAPAuthenticator
-            auth = SAPAuthenticator()
-            encrypted_password = auth.save_encrypted_password(environment, password)
-            config_updates[f"{prefix}PASSWD_ENCRYPTED"] = encrypted_password
+            config_updates[f"{prefix}PASSWD_ENCRYPTED"] = encrypt_password(environment, password)
         
         use_ssl = Confirm.ask(f"Usar SSL para {environment}?", default=True)
         config_updates[f"{prefix}USE_SSL"] = "true" if use_ssl else "false"
@@ -370,62 +523,76 @@ def setup_sap_environment(environment: str, config_updates: dict):
 @config.command("test-sap")
 @click.option(
     "--environment",
-    type=click.Choice(["DEV", "QAS", "PRD"]),
+    type=click.Choice(SAP_ENVIRONMENTS),
     help="Ambiente SAP a testar"
 )
 def test_sap_connection(environment: Optional[str]):
     """Testa conectividade SAP."""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    from rich.console import Group
+    from rich.prompt import Prompt
+    from rich.table import Table
+    
     try:
         if not environment:
-            environments = get_sap_environments()
+            environments = _sap_environments()
             if not environments:
-                console.print("[red]Nenhum ambiente SAP configurado.[/red]")
-                console.print("Execute [cyan]abapify config sap[/cyan] para configurar.")
+                get_console().print("[red]Nenhum ambiente SAP configurado.[/red]")
+                get_console().print("Execute [cyan]abapify config sap[/cyan] para configurar.")
                 return
             environment = Prompt.ask(
                 "Ambiente SAP para testar",
                 choices=environments,
                 default=environments[0]
             )
-        console.print(f"[cyan]Testando conectividade SAP {environment}...[/cyan]")
+        get_console().print(f"[cyan]Testando conectividade SAP {environment}...[/cyan]")
         # Importa e testa conexão
         from abapify.sap import SAPConnection
-        with console.status(f"[cyan]Conectando ao SAP {environment}...[/cyan]"):
-            connection = SAPConnection(environment=environment)
-            results = connection.test_connection()
-        # Exibe resultados
-        table = Table(title=f"Teste de Conectividade SAP {environment}", show_header=True)
-        table.add_column("Tipo", style="cyan")
-        table.add_column("Status", style="white")
-        for conn_type, status in results.items():
-            status_text = "[green]✅ Conectado[/green]" if status else "[red]❌ Falhou[/red]"
-            table.add_row(conn_type.upper(), status_text)
-        console.print(table)
-        # Se pelo menos uma conexão funcionou, obtém informações do sistema
-        if any(results.values()):
-            try:
-                with console.status("[cyan]Obtendo informações do sistema...[/cyan]"):
-                    system_info = connection.get_system_info()
-                console.print(f"\n[bold green]Informações do Sistema SAP {environment}:[/bold green]")
-                info_table = Table(show_header=False)
-                info_table.add_column("Campo", style="cyan", width=20)
-                info_table.add_column("Valor", style="white")
-                for key, value in system_info.items():
-                    display_key = key.replace('_', ' ').title()
-                    info_table.add_row(display_key, str(value))
-                console.print(info_table)
-            except Exception as e:
-                console.print(f"[yellow]Aviso: Não foi possível obter informações do sistema: {str(e)}[/yellow]")
-        connection.close()
+        with closing(SAPConnection(environment=environment)) as connection:
+            with get_console().status(f"[cyan]Conectando ao SAP {environment}...[/cyan]"):
+                results = connection.test_connection(parallel=True)
+            if not results:
+                get_console().print("[yellow]Nenhum tipo de conexão configurado.[/yellow]")
+                return
+            # Se pelo menos uma conexão funcionou, obtém informações do sistema
+            # enquanto a tabela de status é montada
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                system_info_future = (
+                    executor.submit(connection.get_system_info) if any(results.values()) else None
+                )
+                # Exibe resultados
+                table = Table(title=f"Teste de Conectividade SAP {environment}", show_header=True)
+                table.add_column("Tipo", style="cyan")
+                table.add_column("Status", style="white")
+                for conn_type, status in results.items():
+                    status_text = "[green]✅ Conectado[/green]" if status else "[red]❌ Falhou[/red]"
+                    table.add_row(conn_type.upper(), status_text)
+                renderables = [table]
+                if system_info_future is not None:
+                    try:
+                        with get_console().status("[cyan]Obtendo informações do sistema...[/cyan]"):
+                            system_info = system_info_future.result()
+                        renderables.append(f"\n[bold green]Informações do Sistema SAP {environment}:[/bold green]")
+                        info_table = Table(show_header=False)
+                        info_table.add_column("Campo", style="cyan", width=20)
+                        info_table.add_column("Valor", style="white")
+                        for key, value in system_info.items():
+                            display_key = key.replace('_', ' ').title()
+                            info_table.add_row(display_key, str(value))
+                        renderables.append(info_table)
+                    except Exception as e:
+                        renderables.append(f"[yellow]Aviso: Não foi possível obter informações do sistema: {str(e)}[/yellow]")
+        get_console().print(Group(*renderables))
     except Exception as e:
-        logger.error(f"Erro ao testar conexão SAP: {str(e)}")
-        console.print(f"[bold red]Erro ao testar conexão SAP:[/] {str(e)}")
+        _log().error(f"Erro ao testar conexão SAP: {str(e)}")
+        get_console().print(f"[bold red]Erro ao testar conexão SAP:[/] {str(e)}")
 
 
 @config.command("list-sap-tables")
 @click.option(
    "--environment",
-   type=click.Choice(["DEV", "QAS", "PRD"]),
+   type=click.Choice(SAP_ENVIRONMENTS),
    help="Ambiente SAP"
 )
 @click.option(
@@ -435,48 +602,48 @@ def test_sap_connection(environment: Optional[str]):
 )
 @click.option(
    "--limit",
-   type=int,
+   type=click.IntRange(min=1),
    default=50,
    help="Limite de resultados (default: 50)"
 )
 def list_sap_tables(environment: Optional[str], pattern: str, limit: int):
    """Lista tabelas customizadas do SAP."""
+   from rich.table import Table
+   
    try:
        if not environment:
-           environments = get_sap_environments()
+           environments = _sap_environments()
            if not environments:
-               console.print("[red]Nenhum ambiente SAP configurado.[/red]")
+               get_console().print("[red]Nenhum ambiente SAP configurado.[/red]")
                return
            
            environment = environments[0]
        
-       console.print(f"[cyan]Buscando tabelas no SAP {environment}...[/cyan]")
+       get_console().print(f"[cyan]Buscando tabelas no SAP {environment}...[/cyan]")
        
        from abapify.sap import SAPConnection, MetadataAnalyzer
        
-       with console.status(f"[cyan]Conectando e buscando tabelas...[/cyan]"):
-           connection = SAPConnection(environment=environment)
-           analyzer = MetadataAnalyzer(connection)
-           
-           tables = analyzer.search_custom_tables(pattern)[:limit]
+       with get_console().status(f"[cyan]Conectando e buscando tabelas...[/cyan]"):
+           with closing(SAPConnection(environment=environment)) as connection:
+               analyzer = MetadataAnalyzer(connection)
+               
+               tables = analyzer.search_custom_tables(pattern, limit=limit)
        
        if tables:
-           console.print(f"\n[bold green]Encontradas {len(tables)} tabelas com padrão '{pattern}':[/bold green]")
+           get_console().print(f"\n[bold green]Encontradas {min(len(tables), limit)} tabelas com padrão '{pattern}':[/bold green]")
            
            table = Table(show_header=True)
            table.add_column("Nome da Tabela", style="cyan")
            table.add_column("Tipo", style="yellow")
            
-           for table_name in tables:
+           for table_name in islice(tables, limit):
                table.add_row(table_name, "Customizada")
            
-           console.print(table)
+           get_console().print(table)
        else:
-           console.print(f"[yellow]Nenhuma tabela encontrada com padrão '{pattern}'[/yellow]")
-       
-       connection.close()
+           get_console().print(f"[yellow]Nenhuma tabela encontrada com padrão '{pattern}'[/yellow]")
        
    except Exception as e:
-       logger.error(f"Erro ao listar tabelas SAP: {str(e)}")
-       console.print(f"[bold red]Erro ao listar tabelas SAP:[/] {str(e)}")
+       _log().error(f"Erro ao listar tabelas SAP: {str(e)}")
+       get_console().print(f"[bold red]Erro ao listar tabelas SAP:[/] {str(e)}")
         
\ No newline at end of file
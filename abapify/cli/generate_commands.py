@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Comandos de geração de código para a CLI do ABAPify.
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from abapify.utils.config import SAP_ENVIRONMENTS
+from abapify.utils.console import get_console
+from abapify.utils.filenames import default_filename
+
+# Tipos de enhancement aceitos pelo comando generate-enhancement
+_ENHANCEMENT_TYPES = ("BADI", "Enhancement Point", "Customer Exit", "User Exit")
+_ENHANCEMENT_CHOICE = click.Choice(_ENHANCEMENT_TYPES)
+
+# Diretório de saída: normalizado uma única vez pelo Click
+OUTPUT_DIR = click.Path(
+    file_okay=False, dir_okay=True, writable=True, resolve_path=True, path_type=Path
+)
+
+
+@click.command("generate-alv")
+@click.option(
+    "--description",
+    "-d",
+    required=True,
+    help="Descrição do relatório ALV a ser gerado",
+)
+@click.option(
+    "--tables",
+    "-t",
+    multiple=True,
+    help="Tabelas a serem utilizadas no relatório",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=OUTPUT_DIR,
+    default="./output",
+    help="Diretório de saída para o código gerado",
+)
+@click.option(
+    "--filename",
+    "-f",
+    help="Nome do arquivo de saída (sem extensão)",
+)
+@click.option(
+    "--sap-environment",
+    type=click.Choice(SAP_ENVIRONMENTS),
+    help="Ambiente SAP para análise de metadados",
+)
+@click.option(
+    "--analyze-tables",
+    is_flag=True,
+    help="Analisa automaticamente as tabelas no SAP",
+)
+def alv_command(
+    description: str, 
+    tables: tuple[str, ...], 
+    output: Path, 
+    filename: Optional[str],
+    sap_environment: Optional[str],
+    analyze_tables: bool
+):
+    """Gera um relatório ALV com base na descrição fornecida."""
+    filename = filename or default_filename("z_alv_", description)
+    
+    # Se análise SAP está habilitada, usa geração SAP-aware
+    if analyze_tables and tables:
+        from abapify.cli.sap_commands import generate_sap_aware_alv
+        generate_sap_aware_alv(
+            description=description,
+            tables=list(tables),
+            output_dir=output,
+            filename=filename,
+            sap_environment=sap_environment or "DEV"
+        )
+    else:
+        from abapify.cli.commands import generate_alv
+        generate_alv(description, tables, output, filename)
+
+
+@click.command("generate-report")
+@click.option(
+    "--description",
+    "-d",
+    required=True,
+    help="Descrição do relatório a ser gerado",
+)
+@click.option(
+    "--tables",
+    "-t",
+    multiple=True,
+    help="Tabelas a serem utilizadas no relatório",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=OUTPUT_DIR,
+    default="./output",
+    help="Diretório de saída para o código gerado",
+)
+@click.option(
+    "--filename",
+    "-f",
+    help="Nome do arquivo de saída (sem extensão)",
+)
+@click.option(
+    "--sap-environment",
+    type=click.Choice(SAP_ENVIRONMENTS),
+    help="Ambiente SAP para análise de metadados",
+)
+@click.option(
+    "--analyze-tables",
+    is_flag=True,
+    help="Analisa automaticamente as tabelas no SAP",
+)
+def report_command(
+    description: str, 
+    tables: tuple[str, ...], 
+    output: Path, 
+    filename: Optional[str],
+    sap_environment: Optional[str],
+    analyze_tables: bool
+):
+    """Gera um relatório ABAP com base na descrição fornecida."""
+    filename = filename or default_filename("z_report_", description)
+    
+    # Se análise SAP está habilitada, usa geração SAP-aware
+    if analyze_tables and tables:
+        from abapify.cli.sap_commands import generate_sap_aware_report
+        generate_sap_aware_report(
+            description=description,
+            tables=list(tables),
+            output_dir=output,
+            filename=filename,
+            sap_environment=sap_environment or "DEV"
+        )
+    else:
+        from abapify.cli.commands import generate_report
+        generate_report(description, tables, output, filename)
+
+
+# Comandos de geração com descrição e uma lista de itens:
+# (comando, função em abapify.cli.commands, prefixo do arquivo, ajuda da descrição,
+#  (opção de itens, abreviação, ajuda), abreviação de --filename, ajuda do comando)
+_SIMPLE_GENERATE_COMMANDS = (
+    (
+        "generate-class", "generate_class", "zcl_", "Descrição da classe a ser gerada",
+        ("methods", "-m", "Métodos a serem incluídos na classe"), "-f",
+        "Gera uma classe ABAP com base na descrição fornecida.",
+    ),
+    (
+        "generate-function", "generate_function_module", "z_fm_",
+        "Descrição do módulo de função a ser gerado",
+        ("params", "-p", "Parâmetros a serem incluídos no módulo de função"), "-f",
+        "Gera um módulo de função ABAP com base na descrição fornecida.",
+    ),
+    (
+        "generate-structure", "generate_structure", "zstruct_",
+        "Descrição da estrutura a ser gerada",
+        ("fields", "-f", "Campos a serem incluídos na estrutura"), "-fn",
+        "Gera uma estrutura ABAP com base na descrição fornecida.",
+    ),
+)
+
+
+def _build_simple_generate_command(
+    name: str,
+    function_name: str,
+    prefix: str,
+    description_help: str,
+    items: tuple[str, str, str],
+    filename_flag: str,
+    help_text: str,
+) -> click.Command:
+    """
+    Monta um comando de geração baseado em descrição e itens.
+
+    Args:
+        name: Nome do comando (ex.: "generate-class").
+        function_name: Função de abapify.cli.commands que executa a geração.
+        prefix: Prefixo do nome de arquivo padrão.
+        description_help: Ajuda da opção --description.
+        items: Nome, abreviação e ajuda da opção de itens (múltipla).
+        filename_flag: Abreviação da opção --filename.
+        help_text: Ajuda do comando.
+
+    Returns:
+        click.Command: Comando montado.
+    """
+    item_name, item_flag, item_help = items
+    
+    def callback(description: str, output: Path, filename: Optional[str], **kwargs):
+        from abapify.cli import commands
+        filename = filename or default_filename(prefix, description)
+        getattr(commands, function_name)(description, kwargs[item_name], output, filename)
+    
+    return click.Command(
+        name,
+        callback=callback,
+        help=help_text,
+        params=[
+            click.Option(["--description", "-d"], required=True, help=description_help),
+            click.Option([f"--{item_name}", item_flag], multiple=True, help=item_help),
+            click.Option(
+                ["--output", "-o"],
+                type=OUTPUT_DIR,
+                default="./output",
+                help="Diretório de saída para o código gerado",
+            ),
+            click.Option(
+                ["--filename", filename_flag],
+                help="Nome do arquivo de saída (sem extensão)",
+            ),
+        ],
+    )
+
+
+class_command, function_command, structure_command = (
+    _build_simple_generate_command(*spec) for spec in _SIMPLE_GENERATE_COMMANDS
+)
+
+
+@click.command("generate-test")
+@click.option(
+    "--target",
+    "-t",
+    required=True,
+    help="Nome da classe ou módulo de função a ser testado",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=OUTPUT_DIR,
+    default="./output",
+    help="Diretório de saída para o código gerado",
+)
+@click.option(
+    "--filename",
+    "-f",
+    help="Nome do arquivo de saída (sem extensão)",
+)
+def test_command(target: str, output: Path, filename: Optional[str]):
+    """Gera um teste unitário ABAP para a classe ou módulo especificado."""
+    filename = filename or default_filename("zcl_test_", target)
+    from abapify.cli.commands import generate_test
+    generate_test(target, output, filename)
+
+
+@click.command("generate-program")
+@click.option(
+    "--output",
+    "-o",
+    type=OUTPUT_DIR,
+    default="./output",
+    help="Diretório de saída para o código gerado",
+)
+@click.option(
+    "--filename",
+    "-f",
+    help="Nome do arquivo de saída (sem extensão)",
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Exibe o código à medida que é gerado",
+)
+def program_command(output: Path, filename: Optional[str], stream: bool):
+    """Gera um programa ABAP personalizado usando assistente interativo."""
+    from abapify.cli.commands import generate_custom_program
+    generate_custom_program(output, filename, stream=stream)
+
+
+@click.command("generate-enhancement")
+@click.option(
+    "--base-object",
+    "-b",
+    required=True,
+    help="Objeto base a ser melhorado",
+)
+@click.option(
+    "--type",
+    "-t",
+    required=True,
+    type=_ENHANCEMENT_CHOICE,
+    help="Tipo de enhancement",
+)
+@click.option(
+    "--functionality",
+    "-func",
+    required=True,
+    help="Funcionalidade a ser adicionada",
+)
+@click.option(
+    "--enhancement-points",
+    "-ep",
+    help="Pontos específicos de enhancement",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=OUTPUT_DIR,
+    default="./output",
+    help="Diretório de saída para o código gerado",
+)
+@click.option(
+    "--filename",
+    "-f",
+    help="Nome do arquivo de saída (sem extensão)",
+)
+def enhancement_command(
+    base_object: str,
+    type: str,
+    functionality: str,
+    enhancement_points: Optional[str],
+    output: Path,
+    filename: Optional[str]
+):
+    """Gera um enhancement ABAP."""
+    filename = filename or default_filename("z_enh_", base_object, 15)
+    from abapify.cli.commands import generate_enhancement
+    generate_enhancement(
+        base_object=base_object,
+        enhancement_type=type,
+        functionality=functionality,
+        output_dir=output,
+        filename=filename,
+        enhancement_points=enhancement_points or "",
+    )
+
+
+@click.command("batch")
+@click.argument("spec_file", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--output",
+    "-o",
+    type=OUTPUT_DIR,
+    default="./output",
+    help="Diretório de saída para o código gerado",
+)
+def batch_command(spec_file: str, output: Path):
+    """Gera vários artefatos a partir de um arquivo JSON de especificações.
+
+    O arquivo deve conter uma lista de objetos com "kind" (alv, report, class,
+    function_module, structure, test, custom_program ou enhancement), "args"
+    e, opcionalmente, "filename".
+    """
+    try:
+        with open(spec_file, "r", encoding="utf-8") as f:
+            specs = json.load(f)
+    except (OSError, ValueError) as e:
+        get_console().print(f"[bold red]Erro ao ler arquivo de lote:[/] {str(e)}")
+        sys.exit(1)
+    
+    if not isinstance(specs, list):
+        get_console().print("[bold red]Erro:[/] o arquivo de lote deve conter uma lista de especificações")
+        sys.exit(1)
+    
+    from abapify.cli.commands import generate_batch
+    generated = generate_batch(specs, output)
+    get_console().print(f"\n[bold green]{generated} de {len(specs)} artefato(s) gerado(s).[/]")
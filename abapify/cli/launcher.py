@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Ponto de entrada leve da CLI do ABAPify.
+
+Responde a --version sem importar Click, Rich ou as configurações; os demais
+comandos são repassados à CLI completa.
+"""
+
+import sys
+from typing import List, Optional
+
+# Versão exibida pela CLI
+VERSION = "2.0.0"
+
+# Opções atendidas sem carregar a CLI completa
+_VERSION_FLAGS = ("-v", "--version")
+
+
+def run(argv: Optional[List[str]] = None) -> None:
+    """
+    Executa a CLI do ABAPify.
+
+    Args:
+        argv: Argumentos da linha de comando (padrão: sys.argv[1:]).
+    """
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) == 1 and args[0] in _VERSION_FLAGS:
+        sys.stdout.write(f"abapify, version {VERSION}\n")
+        return
+
+    from abapify.cli.main import main
+    main(args=args, prog_name="abapify")
+
+
+if __name__ == "__main__":
+    run()
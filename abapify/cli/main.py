@@ -5,462 +5,202 @@
 Interface de linha de comando principal para o ABAPify.
 """
 
+import functools
+import importlib
 import os
 import sys
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 import click
-from rich.console import Console
-from rich.traceback import install
 
-from abapify.cli.commands import (
-    generate_alv,
-    generate_class,
-    generate_function_module,
-    generate_report,
-    generate_test,
-    generate_structure,
-    generate_custom_program,
-    generate_enhancement,
-)
-from abapify.cli.config_commands import config
+from abapify.cli.launcher import VERSION
 from abapify.utils.config import load_config
-from abapify.utils.logger import setup_logger
-
-# Instala um formatador de exceções melhorado
-install()
-
-# Console para saída rica
-console = Console()
+from abapify.utils.console import get_console
+
+# Subcomandos carregados sob demanda: nome -> ("módulo:atributo", ajuda curta).
+# A ajuda curta permite listar os comandos em --help sem importar seus módulos.
+_LAZY_COMMANDS: Dict[str, Tuple[str, str]] = {
+    "analyze-table": (
+        "abapify.cli.analysis_commands:analyze_table_command",
+        "Analisa estrutura de uma tabela SAP.",
+    ),
+    "batch": (
+        "abapify.cli.generate_commands:batch_command",
+        "Gera vários artefatos a partir de um arquivo JSON de especificações.",
+    ),
+    "cache": (
+        "abapify.cli.cache_commands:cache",
+        "Comandos de gerenciamento do cache do ABAPify.",
+    ),
+    "config": (
+        "abapify.cli.config_commands:config",
+        "Comandos de configuração do ABAPify.",
+    ),
+    "generate-alv": (
+        "abapify.cli.generate_commands:alv_command",
+        "Gera um relatório ALV com base na descrição fornecida.",
+    ),
+    "generate-class": (
+        "abapify.cli.generate_commands:class_command",
+        "Gera uma classe ABAP com base na descrição fornecida.",
+    ),
+    "generate-enhancement": (
+        "abapify.cli.generate_commands:enhancement_command",
+        "Gera um enhancement ABAP.",
+    ),
+    "generate-function": (
+        "abapify.cli.generate_commands:function_command",
+        "Gera um módulo de função ABAP com base na descrição fornecida.",
+    ),
+    "generate-program": (
+        "abapify.cli.generate_commands:program_command",
+        "Gera um programa ABAP personalizado usando assistente interativo.",
+    ),
+    "generate-report": (
+        "abapify.cli.generate_commands:report_command",
+        "Gera um relatório ABAP com base na descrição fornecida.",
+    ),
+    "generate-structure": (
+        "abapify.cli.generate_commands:structure_command",
+        "Gera uma estrutura ABAP com base na descrição fornecida.",
+    ),
+    "generate-test": (
+        "abapify.cli.generate_commands:test_command",
+        "Gera um teste unitário ABAP para a classe ou módulo especificado.",
+    ),
+    "sap-generate": (
+        "abapify.cli.analysis_commands:sap_generate_command",
+        "Gera código ABAP com análise automática SAP.",
+    ),
+}
+
+
+@functools.cache
+def _bootstrap() -> None:
+    """
+    Prepara o ambiente de execução dos comandos (uma única vez por processo).
+
+    Configura o logger e, apenas em terminais interativos, instala o formatador
+    de exceções do Rich; ABAPIFY_RICH_TB=0 o desativa. Variáveis locais não são
+    exibidas, pois podem conter credenciais.
+    """
+    from abapify.utils.logger import setup_logger
+    
+    setup_logger()
+    if sys.stderr.isatty() and os.environ.get("ABAPIFY_RICH_TB", "1") != "0":
+        from rich.traceback import install
+        install(show_locals=False)
 
-# Configura o logger
-logger = setup_logger()
 
+class AbapifyGroup(click.Group):
+    """
+    Grupo principal do ABAPify.
 
-@click.group()
-@click.version_option(version="2.0.0")
-def main():
+    Guarda os argumentos recebidos na linha de comando e importa o módulo de
+    cada subcomando apenas quando ele é resolvido, de modo que uma invocação
+    só carrega as definições do comando executado.
+    """
+    
+    def __init__(
+        self, *args, lazy_commands: Optional[Dict[str, Tuple[str, str]]] = None, **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+    
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        ctx.meta["abapify.args"] = tuple(args)
+        return super().parse_args(ctx, args)
+    
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+    
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            module_name, attr = self.lazy_commands[cmd_name][0].split(":")
+            command = getattr(importlib.import_module(module_name), attr)
+            self.add_command(command, cmd_name)
+        return command
+    
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """Lista os subcomandos usando a ajuda curta registrada para os ainda não carregados."""
+        names = self.list_commands(ctx)
+        if not names:
+            return
+        
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = []
+        for name in names:
+            command = self.commands.get(name)
+            if command is None:
+                stub = click.Command(name, help=self.lazy_commands[name][1])
+                help_text = stub.get_short_help_str(limit)
+            elif command.hidden:
+                continue
+            else:
+                help_text = command.get_short_help_str(limit)
+            rows.append((name, help_text))
+        
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+def _option_for(command: click.Command, arg: str) -> Optional[click.Option]:
+    """Obtém a opção do comando correspondente a um argumento como "-d" ou "--tables"."""
+    for param in command.params:
+        if isinstance(param, click.Option) and arg in (*param.opts, *param.secondary_opts):
+            return param
+    return None
+
+
+def _is_help_request(ctx: click.Context) -> bool:
+    """
+    Verifica se a invocação apenas exibe a ajuda de um subcomando.
+
+    Os argumentos são percorridos comando a comando; valores consumidos por
+    opções (ex.: "-d --help") não contam como pedido de ajuda.
+    """
+    args = ctx.meta.get("abapify.args", ())
+    command: click.Command = ctx.command
+    index = 0
+    while index < len(args):
+        arg = args[index]
+        index += 1
+        if arg == "--":
+            return False
+        if arg in ctx.help_option_names:
+            return True
+        if arg.startswith("-"):
+            option = _option_for(command, arg)
+            if option is not None and not option.is_flag and not option.count:
+                index += option.nargs
+        elif isinstance(command, click.Group):
+            command = command.get_command(ctx, arg)
+            if command is None:
+                return False
+    return False
+
+
+@click.group(cls=AbapifyGroup, lazy_commands=_LAZY_COMMANDS)
+@click.version_option(VERSION, "-v", "--version", prog_name="abapify")
+@click.pass_context
+def main(ctx: click.Context):
     """ABAPify - Gerador de código ABAP baseado em IA - Enhanced Edition."""
+    # Pedidos de ajuda não precisam das configurações
+    if _is_help_request(ctx):
+        return
+    
+    _bootstrap()
+    
     # Tenta carregar configurações
     try:
         load_config()
     except Exception as e:
-        console.print(f"[bold red]Erro ao carregar configurações:[/] {str(e)}")
-        console.print("[yellow]Execute 'abapify config setup' para configurar o sistema.[/yellow]")
+        get_console().print(f"[bold red]Erro ao carregar configurações:[/] {str(e)}")
+        get_console().print("[yellow]Execute 'abapify config setup' para configurar o sistema.[/yellow]")
         # Não sai para permitir comandos de configuração
 
 
-# Adiciona comandos de configuração
-main.add_command(config)
-
-
-@main.command("generate-alv")
-@click.option(
-    "--description",
-    "-d",
-    required=True,
-    help="Descrição do relatório ALV a ser gerado",
-)
-@click.option(
-    "--tables",
-    "-t",
-    multiple=True,
-    help="Tabelas a serem utilizadas no relatório",
-)
-@click.option(
-    "--output",
-    "-o",
-    default="./output",
-    help="Diretório de saída para o código gerado",
-)
-@click.option(
-    "--filename",
-    "-f",
-    help="Nome do arquivo de saída (sem extensão)",
-)
-@click.option(
-    "--sap-environment",
-    type=click.Choice(["DEV", "QAS", "PRD"]),
-    help="Ambiente SAP para análise de metadados",
-)
-@click.option(
-    "--analyze-tables",
-    is_flag=True,
-    help="Analisa automaticamente as tabelas no SAP",
-)
-def alv_command(
-    description: str, 
-    tables: tuple[str, ...], 
-    output: str, 
-    filename: Optional[str],
-    sap_environment: Optional[str],
-    analyze_tables: bool
-):
-    """Gera um relatório ALV com base na descrição fornecida."""
-    filename = filename or f"z_alv_{description.lower().replace(' ', '_')[:20]}.abap"
-    
-    # Se análise SAP está habilitada, usa geração SAP-aware
-    if analyze_tables and tables:
-        from abapify.cli.sap_commands import generate_sap_aware_alv
-        generate_sap_aware_alv(
-            description=description,
-            tables=list(tables),
-            output_dir=output,
-            filename=filename,
-            sap_environment=sap_environment or "DEV"
-        )
-    else:
-        generate_alv(description, tables, output, filename)
-
-
-@main.command("generate-report")
-@click.option(
-    "--description",
-    "-d",
-    required=True,
-    help="Descrição do relatório a ser gerado",
-)
-@click.option(
-    "--tables",
-    "-t",
-    multiple=True,
-    help="Tabelas a serem utilizadas no relatório",
-)
-@click.option(
-    "--output",
-    "-o",
-    default="./output",
-    help="Diretório de saída para o código gerado",
-)
-@click.option(
-    "--filename",
-    "-f",
-    help="Nome do arquivo de saída (sem extensão)",
-)
-@click.option(
-    "--sap-environment",
-    type=click.Choice(["DEV", "QAS", "PRD"]),
-    help="Ambiente SAP para análise de metadados",
-)
-@click.option(
-    "--analyze-tables",
-    is_flag=True,
-    help="Analisa automaticamente as tabelas no SAP",
-)
-def report_command(
-    description: str, 
-    tables: tuple[str, ...], 
-    output: str, 
-    filename: Optional[str],
-    sap_environment: Optional[str],
-    analyze_tables: bool
-):
-    """Gera um relatório ABAP com base na descrição fornecida."""
-    filename = filename or f"z_report_{description.lower().replace(' ', '_')[:20]}.abap"
-    
-    # Se análise SAP está habilitada, usa geração SAP-aware
-    if analyze_tables and tables:
-        from abapify.cli.sap_commands import generate_sap_aware_report
-        generate_sap_aware_report(
-            description=description,
-            tables=list(tables),
-            output_dir=output,
-            filename=filename,
-            sap_environment=sap_environment or "DEV"
-        )
-    else:
-        generate_report(description, tables, output, filename)
-
-
-@main.command("generate-class")
-@click.option(
-    "--description",
-    "-d",
-    required=True,
-    help="Descrição da classe a ser gerada",
-)
-@click.option(
-    "--methods",
-    "-m",
-    multiple=True,
-    help="Métodos a serem incluídos na classe",
-)
-@click.option(
-    "--output",
-    "-o",
-    default="./output",
-    help="Diretório de saída para o código gerado",
-)
-@click.option(
-    "--filename",
-    "-f",
-    help="Nome do arquivo de saída (sem extensão)",
-)
-def class_command(
-    description: str, methods: tuple[str, ...], output: str, filename: Optional[str]
-):
-    """Gera uma classe ABAP com base na descrição fornecida."""
-    filename = filename or f"zcl_{description.lower().replace(' ', '_')[:20]}.abap"
-    generate_class(description, methods, output, filename)
-
-
-@main.command("generate-function")
-@click.option(
-    "--description",
-    "-d",
-    required=True,
-    help="Descrição do módulo de função a ser gerado",
-)
-@click.option(
-    "--params",
-    "-p",
-    multiple=True,
-    help="Parâmetros a serem incluídos no módulo de função",
-)
-@click.option(
-    "--output",
-    "-o",
-    default="./output",
-    help="Diretório de saída para o código gerado",
-)
-@click.option(
-    "--filename",
-    "-f",
-    help="Nome do arquivo de saída (sem extensão)",
-)
-def function_command(
-    description: str, params: tuple[str, ...], output: str, filename: Optional[str]
-):
-    """Gera um módulo de função ABAP com base na descrição fornecida."""
-    filename = filename or f"z_fm_{description.lower().replace(' ', '_')[:20]}.abap"
-    generate_function_module(description, params, output, filename)
-
-
-@main.command("generate-structure")
-@click.option(
-    "--description",
-    "-d",
-    required=True,
-    help="Descrição da estrutura a ser gerada",
-)
-@click.option(
-    "--fields",
-    "-f",
-    multiple=True,
-    help="Campos a serem incluídos na estrutura",
-)
-@click.option(
-    "--output",
-    "-o",
-    default="./output",
-    help="Diretório de saída para o código gerado",
-)
-@click.option(
-    "--filename",
-    "-fn",
-    help="Nome do arquivo de saída (sem extensão)",
-)
-def structure_command(
-    description: str, fields: tuple[str, ...], output: str, filename: Optional[str]
-):
-    """Gera uma estrutura ABAP com base na descrição fornecida."""
-    filename = filename or f"zstruct_{description.lower().replace(' ', '_')[:20]}.abap"
-    generate_structure(description, fields, output, filename)
-
-
-@main.command("generate-test")
-@click.option(
-    "--target",
-    "-t",
-    required=True,
-    help="Nome da classe ou módulo de função a ser testado",
-)
-@click.option(
-    "--output",
-    "-o",
-    default="./output",
-    help="Diretório de saída para o código gerado",
-)
-@click.option(
-    "--filename",
-    "-f",
-    help="Nome do arquivo de saída (sem extensão)",
-)
-def test_command(target: str, output: str, filename: Optional[str]):
-    """Gera um teste unitário ABAP para a classe ou módulo especificado."""
-    filename = filename or f"zcl_test_{target.lower().replace(' ', '_')[:20]}.abap"
-    generate_test(target, output, filename)
-
-
-@main.command("generate-program")
-@click.option(
-    "--output",
-    "-o",
-    default="./output",
-    help="Diretório de saída para o código gerado",
-)
-@click.option(
-    "--filename",
-    "-f",
-    help="Nome do arquivo de saída (sem extensão)",
-)
-def program_command(output: str, filename: Optional[str]):
-    """Gera um programa ABAP personalizado usando assistente interativo."""
-    generate_custom_program(output, filename)
-
-
-@main.command("generate-enhancement")
-@click.option(
-    "--base-object",
-    "-b",
-    required=True,
-    help="Objeto base a ser melhorado",
-)
-@click.option(
-    "--type",
-    "-t",
-    required=True,
-    type=click.Choice(["BADI", "Enhancement Point", "Customer Exit", "User Exit"]),
-    help="Tipo de enhancement",
-)
-@click.option(
-    "--functionality",
-    "-func",
-    required=True,
-    help="Funcionalidade a ser adicionada",
-)
-@click.option(
-    "--enhancement-points",
-    "-ep",
-    help="Pontos específicos de enhancement",
-)
-@click.option(
-    "--output",
-    "-o",
-    default="./output",
-    help="Diretório de saída para o código gerado",
-)
-@click.option(
-    "--filename",
-    "-f",
-    help="Nome do arquivo de saída (sem extensão)",
-)
-def enhancement_command(
-    base_object: str,
-    type: str,
-    functionality: str,
-    enhancement_points: Optional[str],
-    output: str,
-    filename: Optional[str]
-):
-    """Gera um enhancement ABAP."""
-    filename = filename or f"z_enh_{base_object.lower().replace(' ', '_')[:15]}.abap"
-    generate_enhancement(
-        base_object=base_object,
-        enhancement_type=type,
-        functionality=functionality,
-        output_dir=output,
-        filename=filename,
-        enhancement_points=enhancement_points or "",
-    )
-
-
-# Novos comandos SAP
-@main.command("analyze-table")
-@click.option(
-    "--table-name",
-    "-t",
-    required=True,
-    help="Nome da tabela a ser analisada",
-)
-@click.option(
-    "--environment",
-    "-e",
-    type=click.Choice(["DEV", "QAS", "PRD"]),
-    help="Ambiente SAP",
-)
-@click.option(
-    "--include-relationships",
-    is_flag=True,
-    help="Incluir análise de relacionamentos",
-)
-@click.option(
-    "--output",
-    "-o",
-    help="Arquivo de saída para salvar análise (JSON)",
-)
-def analyze_table_command(
-    table_name: str,
-    environment: Optional[str],
-    include_relationships: bool,
-    output: Optional[str]
-):
-    """Analisa estrutura de uma tabela SAP."""
-    from abapify.cli.sap_commands import analyze_table_structure
-    analyze_table_structure(
-        table_name=table_name,
-        environment=environment or "DEV",
-        include_relationships=include_relationships,
-        output_file=output
-    )
-
-
-@main.command("sap-generate")
-@click.option(
-    "--type",
-    "-t",
-    required=True,
-    type=click.Choice(["alv", "report", "class"]),
-    help="Tipo de código a gerar",
-)
-@click.option(
-    "--description",
-    "-d",
-    required=True,
-    help="Descrição do código a ser gerado",
-)
-@click.option(
-    "--tables",
-    "-tb",
-    multiple=True,
-    help="Tabelas a serem utilizadas",
-)
-@click.option(
-    "--environment",
-    "-e",
-    type=click.Choice(["DEV", "QAS", "PRD"]),
-    help="Ambiente SAP para análise",
-)
-@click.option(
-    "--output",
-    "-o",
-    default="./output",
-    help="Diretório de saída",
-)
-@click.option(
-    "--filename",
-    "-f",
-    help="Nome do arquivo de saída",
-)
-def sap_generate_command(
-    type: str,
-    description: str,
-    tables: tuple[str, ...],
-    environment: Optional[str],
-    output: str,
-    filename: Optional[str]
-):
-    """Gera código ABAP com análise automática SAP."""
-    from abapify.cli.sap_commands import generate_sap_aware_code
-    generate_sap_aware_code(
-        code_type=type,
-        description=description,
-        tables=list(tables),
-        output_dir=output,
-        filename=filename,
-        sap_environment=environment or "DEV"
-    )
-
-
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,21 +5,32 @@
 Comandos específicos para integração SAP.
 """
 
+import heapq
 import json
 import os
-from typing import List, Optional
+from contextlib import closing
+from functools import cache
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+from abapify.utils.cache import cache_key, read_cache_entry, write_cache_entry
+from abapify.utils.config import get_config_value
+from abapify.utils.console import get_console
+from abapify.utils.filenames import default_filename
 
-from abapify.sap import SAPConnection, MetadataAnalyzer
-from abapify.sap.models import SAPAnalysisResult
-from abapify.core.generator import AbapGenerator
-from abapify.utils.logger import get_logger
+if TYPE_CHECKING:
+    from abapify.sap.models import SAPAnalysisResult, SAPTable
 
-console = Console()
-logger = get_logger(__name__)
+# Subdiretório do cache com as análises de metadados SAP
+_SAP_CACHE_NAMESPACE = "sap"
+
+
+@cache
+def _log():
+    """Obtém o logger do módulo, criado apenas quando necessário."""
+    from abapify.utils.logger import get_logger
+    
+    return get_logger(__name__)
 
 
 def analyze_table_structure(
@@ -38,20 +49,25 @@ def analyze_table_structure(
         output_file: Arquivo para salvar análise.
     """
     try:
-        console.print(f"[bold cyan]Analisando tabela {table_name} no ambiente {environment}[/bold cyan]")
+        from rich.table import Table
+        
+        from abapify.sap import SAPConnection, MetadataAnalyzer
         
-        with console.status("[cyan]Conectando ao SAP...[/cyan]"):
+        get_console().print(f"[bold cyan]Analisando tabela {table_name} no ambiente {environment}[/bold cyan]")
+        
+        with get_console().status("[cyan]Conectando ao SAP...[/cyan]"):
             connection = SAPConnection(environment=environment)
-            analyzer = MetadataAnalyzer(connection)
         
-        with console.status(f"[cyan]Analisando estrutura da tabela {table_name}...[/cyan]"):
-            table = analyzer.analyze_table(table_name, include_relationships)
+        with closing(connection):
+            analyzer = MetadataAnalyzer(connection)
+            with get_console().status(f"[cyan]Analisando estrutura da tabela {table_name}...[/cyan]"):
+                table = analyzer.analyze_table(table_name, include_relationships)
         
         # Exibe informações da tabela
-        console.print(f"\n[bold green]Tabela: {table.name}[/bold green]")
-        console.print(f"[yellow]Descrição:[/yellow] {table.description}")
-        console.print(f"[yellow]Tipo:[/yellow] {table.table_type}")
-        console.print(f"[yellow]Classe de Entrega:[/yellow] {table.delivery_class}")
+        get_console().print(f"\n[bold green]Tabela: {table.name}[/bold green]")
+        get_console().print(f"[yellow]Descrição:[/yellow] {table.description}")
+        get_console().print(f"[yellow]Tipo:[/yellow] {table.table_type}")
+        get_console().print(f"[yellow]Classe de Entrega:[/yellow] {table.delivery_class}")
         
         # Tabela de campos
         fields_table = Table(title="Campos da Tabela", show_header=True)
@@ -71,25 +87,23 @@ def analyze_table_structure(
                 field.description
             )
         
-        console.print(fields_table)
+        get_console().print(fields_table)
         
         # Relacionamentos
         if include_relationships and table.foreign_keys:
-            console.print(f"\n[bold yellow]Relacionamentos encontrados: {len(table.foreign_keys)}[/bold yellow]")
+            get_console().print(f"\n[bold yellow]Relacionamentos encontrados: {len(table.foreign_keys)}[/bold yellow]")
             for fk in table.foreign_keys:
-                console.print(f"  • {fk.get('from_table')} → {fk.get('to_table')}")
+                get_console().print(f"  • {fk.get('from_table')} → {fk.get('to_table')}")
         
         # Salva em arquivo se especificado
         if output_file:
             with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(table.dict(), f, indent=2, ensure_ascii=False, default=str)
-            console.print(f"\n[green]Análise salva em: {output_file}[/green]")
-        
-        connection.close()
+                f.write(table.model_dump_json(indent=2))
+            get_console().print(f"\n[green]Análise salva em: {output_file}[/green]")
         
     except Exception as e:
-        logger.error(f"Erro ao analisar tabela {table_name}: {str(e)}")
-        console.print(f"[bold red]Erro ao analisar tabela:[/] {str(e)}")
+        _log().error(f"Erro ao analisar tabela {table_name}: {str(e)}")
+        get_console().print(f"[bold red]Erro ao analisar tabela:[/] {str(e)}")
 
 
 def generate_sap_aware_alv(
@@ -110,31 +124,19 @@ def generate_sap_aware_alv(
         sap_environment: Ambiente SAP.
     """
     try:
-        console.print(f"[bold green]Gerando ALV SAP-aware:[/] {description}")
+        from abapify.core.generator import AbapGenerator
         
-        # Conecta ao SAP e analisa tabelas
-        with console.status(f"[cyan]Analisando tabelas no SAP {sap_environment}...[/cyan]"):
-            connection = SAPConnection(environment=sap_environment)
-            analyzer = MetadataAnalyzer(connection)
-            
-            # Analisa todas as tabelas
-            analyzed_tables = analyzer.analyze_multiple_tables(tables)
-            
-            # Busca tabelas relacionadas
-            related_tables = set()
-            for table_name in tables:
-                related = analyzer.find_related_tables(table_name, max_depth=1)
-                related_tables.update(related)
-            
-            # Detecta padrões de nomenclatura
-            custom_objects = analyzer.analyze_custom_objects("Z*")
-            patterns = analyzer.detect_naming_patterns(custom_objects)
+        get_console().print(f"[bold green]Gerando ALV SAP-aware:[/] {description}")
+        
+        # Analisa tabelas no SAP (ou recupera a análise recente do cache)
+        with get_console().status(f"[cyan]Analisando tabelas no SAP {sap_environment}...[/cyan]"):
+            analyzed_tables, related_tables, patterns = _analyze_for_alv(tables, sap_environment)
         
         # Constrói contexto enriquecido
-        context = _build_sap_context(analyzed_tables, list(related_tables), patterns)
+        context = _build_sap_context(analyzed_tables, related_tables, patterns)
         
         # Gera código com contexto SAP
-        with console.status("[cyan]Gerando código ABAP otimizado...[/cyan]"):
+        with get_console().status("[cyan]Gerando código ABAP otimizado...[/cyan]"):
             generator = AbapGenerator(use_enhanced_prompts=True)
             
             # Prompt enriquecido com contexto SAP
@@ -160,15 +162,13 @@ Gere um relatório ALV otimizado considerando:
         # Salva código gerado
         _save_code(code, output_dir, filename)
         
-        console.print(f"[bold green]ALV SAP-aware gerado com sucesso:[/] {os.path.join(output_dir, filename)}")
-        console.print(f"[yellow]Tabelas analisadas:[/] {len(analyzed_tables)}")
-        console.print(f"[yellow]Tabelas relacionadas encontradas:[/] {len(related_tables)}")
-        
-        connection.close()
+        get_console().print(f"[bold green]ALV SAP-aware gerado com sucesso:[/] {os.path.join(output_dir, filename)}")
+        get_console().print(f"[yellow]Tabelas analisadas:[/] {len(analyzed_tables)}")
+        get_console().print(f"[yellow]Tabelas relacionadas encontradas:[/] {len(related_tables)}")
         
     except Exception as e:
-        logger.error(f"Erro ao gerar ALV SAP-aware: {str(e)}")
-        console.print(f"[bold red]Erro ao gerar ALV SAP-aware:[/] {str(e)}")
+        _log().error(f"Erro ao gerar ALV SAP-aware: {str(e)}")
+        get_console().print(f"[bold red]Erro ao gerar ALV SAP-aware:[/] {str(e)}")
 
 
 def generate_sap_aware_report(
@@ -189,21 +189,19 @@ def generate_sap_aware_report(
         sap_environment: Ambiente SAP.
     """
     try:
-        console.print(f"[bold green]Gerando relatório SAP-aware:[/] {description}")
+        from abapify.core.generator import AbapGenerator
         
-        # Conecta ao SAP e analisa tabelas
-        with console.status(f"[cyan]Analisando tabelas no SAP {sap_environment}...[/cyan]"):
-            connection = SAPConnection(environment=sap_environment)
-            analyzer = MetadataAnalyzer(connection)
-            
-            # Gera análise completa
-            analysis_result = analyzer.generate_full_analysis(tables, include_custom_objects=True)
+        get_console().print(f"[bold green]Gerando relatório SAP-aware:[/] {description}")
+        
+        # Gera análise completa no SAP (ou recupera a análise recente do cache)
+        with get_console().status(f"[cyan]Analisando tabelas no SAP {sap_environment}...[/cyan]"):
+            analysis_result = _full_analysis(tables, sap_environment)
         
         # Constrói contexto enriquecido
         context = _build_comprehensive_sap_context(analysis_result)
         
         # Gera código com contexto SAP
-        with console.status("[cyan]Gerando código ABAP otimizado...[/cyan]"):
+        with get_console().status("[cyan]Gerando código ABAP otimizado...[/cyan]"):
             generator = AbapGenerator(use_enhanced_prompts=True)
             
             # Prompt enriquecido com análise completa
@@ -226,14 +224,12 @@ Gere um relatório ABAP completo considerando:
         # Salva código gerado
         _save_code(code, output_dir, filename)
         
-        console.print(f"[bold green]Relatório SAP-aware gerado:[/] {os.path.join(output_dir, filename)}")
+        get_console().print(f"[bold green]Relatório SAP-aware gerado:[/] {os.path.join(output_dir, filename)}")
         _display_analysis_summary(analysis_result)
         
-        connection.close()
-        
     except Exception as e:
-        logger.error(f"Erro ao gerar relatório SAP-aware: {str(e)}")
-        console.print(f"[bold red]Erro ao gerar relatório SAP-aware:[/] {str(e)}")
+        _log().error(f"Erro ao gerar relatório SAP-aware: {str(e)}")
+        get_console().print(f"[bold red]Erro ao gerar relatório SAP-aware:[/] {str(e)}")
 
 
 def generate_sap_aware_code(
@@ -256,86 +252,183 @@ def generate_sap_aware_code(
         sap_environment: Ambiente SAP.
     """
     if not filename:
-        filename = f"z_{code_type}_{description.lower().replace(' ', '_')[:20]}.abap"
+        filename = default_filename(f"z_{code_type}_", description)
     
     if code_type == "alv":
         generate_sap_aware_alv(description, tables, output_dir, filename, sap_environment)
     elif code_type == "report":
         generate_sap_aware_report(description, tables, output_dir, filename, sap_environment)
     else:
-        console.print(f"[red]Tipo de código não suportado para geração SAP-aware: {code_type}[/red]")
+        get_console().print(f"[red]Tipo de código não suportado para geração SAP-aware: {code_type}[/red]")
+
+
+def _sap_cache_ttl() -> float:
+    """Obtém por quantos segundos uma análise SAP em cache é reaproveitada."""
+    value = get_config_value("ABAPIFY_SAP_CACHE_TTL", "3600")
+    try:
+        return float(value)
+    except ValueError:
+        _log().warning(f"ABAPIFY_SAP_CACHE_TTL inválido ({value}); usando 3600 segundos")
+        return 3600.0
+
+
+def _analyze_for_alv(
+    tables: List[str], environment: str
+) -> Tuple[List["SAPTable"], List[str], Dict[str, Any]]:
+    """
+    Analisa as tabelas de um ALV: estrutura, tabelas relacionadas e padrões de nomenclatura.
+
+    O resultado fica em cache em disco por ambiente e conjunto de tabelas; enquanto
+    a entrada for recente, nenhuma conexão com o SAP é aberta.
+
+    Args:
+        tables: Lista de tabelas.
+        environment: Ambiente SAP.
+
+    Returns:
+        Tuple: Tabelas analisadas, tabelas relacionadas e padrões detectados.
+    """
+    from abapify.sap.models import SAPTable
+    
+    key = cache_key("alv", environment, list(tables))
+    cached = read_cache_entry(_SAP_CACHE_NAMESPACE, key, ttl=_sap_cache_ttl())
+    if cached is not None:
+        data = json.loads(cached)
+        analyzed_tables = [SAPTable.model_validate(table) for table in data["tables"]]
+        return analyzed_tables, data["related"], data["patterns"]
+    
+    from abapify.sap import SAPConnection, MetadataAnalyzer
+    
+    with closing(SAPConnection(environment=environment)) as connection:
+        analyzer = MetadataAnalyzer(connection)
+        
+        # Analisa todas as tabelas
+        analyzed_tables = analyzer.analyze_multiple_tables(tables)
+        
+        # Busca tabelas relacionadas
+        related_tables = set()
+        for table_name in tables:
+            related = analyzer.find_related_tables(table_name, max_depth=1)
+            related_tables.update(related)
+        
+        # Detecta padrões de nomenclatura
+        custom_objects = analyzer.analyze_custom_objects("Z*")
+        patterns = analyzer.detect_naming_patterns(custom_objects)
+    
+    related_tables = sorted(related_tables)
+    write_cache_entry(_SAP_CACHE_NAMESPACE, key, json.dumps({
+        "tables": [table.model_dump(mode="json") for table in analyzed_tables],
+        "related": related_tables,
+        "patterns": patterns,
+    }))
+    return analyzed_tables, related_tables, patterns
+
+
+def _full_analysis(tables: List[str], environment: str) -> "SAPAnalysisResult":
+    """
+    Gera a análise SAP completa das tabelas, com cache em disco por ambiente e conjunto de tabelas.
+
+    Args:
+        tables: Lista de tabelas.
+        environment: Ambiente SAP.
+
+    Returns:
+        SAPAnalysisResult: Resultado da análise.
+    """
+    from abapify.sap.models import SAPAnalysisResult
+    
+    key = cache_key("full", environment, list(tables))
+    cached = read_cache_entry(_SAP_CACHE_NAMESPACE, key, ttl=_sap_cache_ttl())
+    if cached is not None:
+        return SAPAnalysisResult.model_validate_json(cached)
+    
+    from abapify.sap import SAPConnection, MetadataAnalyzer
+    
+    with closing(SAPConnection(environment=environment)) as connection:
+        analysis_result = MetadataAnalyzer(connection).generate_full_analysis(
+            tables, include_custom_objects=True
+        )
+    
+    write_cache_entry(_SAP_CACHE_NAMESPACE, key, analysis_result.model_dump_json())
+    return analysis_result
 
 
 def _build_sap_context(analyzed_tables, related_tables, patterns) -> str:
     """Constrói contexto SAP para o prompt."""
-    context_parts = []
-    
+    return "\n".join(_sap_context_lines(analyzed_tables, related_tables, patterns))
+
+
+def _sap_context_lines(analyzed_tables, related_tables, patterns) -> Iterator[str]:
+    """Gera as linhas do contexto SAP para o prompt."""
     # Informações das tabelas
     if analyzed_tables:
-        context_parts.append("ESTRUTURAS DE TABELAS:")
+        yield "ESTRUTURAS DE TABELAS:"
         for table in analyzed_tables:
-            context_parts.append(f"Tabela {table.name}:")
-            context_parts.append(f"  - Descrição: {table.description}")
-            context_parts.append(f"  - Campos principais: {', '.join([f.name for f in table.fields[:10]])}")
-            context_parts.append(f"  - Campos chave: {', '.join([f.name for f in table.fields if f.key_field])}")
-        context_parts.append("")
+            yield f"Tabela {table.name}:"
+            yield f"  - Descrição: {table.description}"
+            yield f"  - Campos principais: {', '.join([f.name for f in table.fields[:10]])}"
+            yield f"  - Campos chave: {', '.join([f.name for f in table.fields if f.key_field])}"
+        yield ""
     
     # Tabelas relacionadas
     if related_tables:
-        context_parts.append(f"TABELAS RELACIONADAS: {', '.join(related_tables)}")
-        context_parts.append("")
+        yield f"TABELAS RELACIONADAS: {', '.join(related_tables)}"
+        yield ""
     
     # Padrões de nomenclatura
     if patterns.get('prefixes'):
-        top_prefixes = sorted(patterns['prefixes'].items(), key=lambda x: x[1], reverse=True)[:3]
-        context_parts.append(f"PADRÕES DE NOMENCLATURA: {', '.join([f'{p[0]} ({p[1]}x)' for p in top_prefixes])}")
-        context_parts.append("")
-    
-    return "\n".join(context_parts)
+        top_prefixes = heapq.nlargest(3, patterns['prefixes'].items(), key=itemgetter(1))
+        yield f"PADRÕES DE NOMENCLATURA: {', '.join([f'{p[0]} ({p[1]}x)' for p in top_prefixes])}"
+        yield ""
 
 
-def _build_comprehensive_sap_context(analysis_result: SAPAnalysisResult) -> str:
+def _build_comprehensive_sap_context(analysis_result: "SAPAnalysisResult") -> str:
     """Constrói contexto SAP abrangente."""
-    context_parts = []
-    
+    return "\n".join(_comprehensive_sap_context_lines(analysis_result))
+
+
+def _comprehensive_sap_context_lines(analysis_result: "SAPAnalysisResult") -> Iterator[str]:
+    """Gera as linhas do contexto SAP abrangente."""
     # Resumo da análise
-    context_parts.append("RESUMO DA ANÁLISE:")
-    context_parts.append(f"- Tabelas analisadas: {len(analysis_result.tables)}")
-    context_parts.append(f"- Relacionamentos: {len(analysis_result.relationships)}")
-    context_parts.append(f"- Objetos customizados: {len(analysis_result.custom_objects)}")
-    context_parts.append("")
+    yield "RESUMO DA ANÁLISE:"
+    yield f"- Tabelas analisadas: {len(analysis_result.tables)}"
+    yield f"- Relacionamentos: {len(analysis_result.relationships)}"
+    yield f"- Objetos customizados: {len(analysis_result.custom_objects)}"
+    yield ""
     
     # Detalhes das tabelas
-    context_parts.append("DETALHES DAS TABELAS:")
+    yield "DETALHES DAS TABELAS:"
     for table in analysis_result.tables:
-        context_parts.append(f"Tabela {table.name} ({table.description}):")
-        key_fields = [f.name for f in table.fields if f.key_field]
-        important_fields = [f.name for f in table.fields if not f.key_field][:5]
-        context_parts.append(f"  - Chaves: {', '.join(key_fields)}")
-        context_parts.append(f"  - Campos importantes: {', '.join(important_fields)}")
-    context_parts.append("")
+        yield f"Tabela {table.name} ({table.description}):"
+        # Separa chaves e até 5 demais campos em uma única passagem
+        key_fields, important_fields = [], []
+        for f in table.fields:
+            if f.key_field:
+                key_fields.append(f.name)
+            elif len(important_fields) < 5:
+                important_fields.append(f.name)
+        yield f"  - Chaves: {', '.join(key_fields)}"
+        yield f"  - Campos importantes: {', '.join(important_fields)}"
+    yield ""
     
     # Relacionamentos
     if analysis_result.relationships:
-        context_parts.append("RELACIONAMENTOS IDENTIFICADOS:")
+        yield "RELACIONAMENTOS IDENTIFICADOS:"
         for rel in analysis_result.relationships[:10]:  # Limita a 10 para não sobrecarregar
-            context_parts.append(f"- {rel.from_table} → {rel.to_table} ({rel.relationship_type})")
-        context_parts.append("")
+            yield f"- {rel.from_table} → {rel.to_table} ({rel.relationship_type})"
+        yield ""
     
     # Padrões detectados
     if analysis_result.patterns:
-        context_parts.append("PADRÕES DA EMPRESA:")
+        yield "PADRÕES DA EMPRESA:"
         if 'prefixes' in analysis_result.patterns:
-            top_prefixes = sorted(analysis_result.patterns['prefixes'].items(), 
-                                key=lambda x: x[1], reverse=True)[:3]
-            context_parts.append(f"- Prefixos comuns: {', '.join([f'{p[0]} ({p[1]}x)' for p in top_prefixes])}")
+            top_prefixes = heapq.nlargest(3, analysis_result.patterns['prefixes'].items(), key=itemgetter(1))
+            yield f"- Prefixos comuns: {', '.join([f'{p[0]} ({p[1]}x)' for p in top_prefixes])}"
         
         if 'package_patterns' in analysis_result.patterns:
             packages = list(analysis_result.patterns['package_patterns'].keys())[:5]
-            context_parts.append(f"- Pacotes utilizados: {', '.join(packages)}")
-        context_parts.append("")
-    
-    return "\n".join(context_parts)
+            yield f"- Pacotes utilizados: {', '.join(packages)}"
+        yield ""
 
 
 def _save_code(code: str, output_dir: str, filename: str) -> str:
@@ -349,8 +442,10 @@ def _save_code(code: str, output_dir: str, filename: str) -> str:
         return file_path
 
 
-def _display_analysis_summary(analysis_result: SAPAnalysisResult) -> None:
+def _display_analysis_summary(analysis_result: "SAPAnalysisResult") -> None:
         """Exibe resumo da análise SAP."""
+        from rich.table import Table
+        
         summary_table = Table(title="Resumo da Análise SAP", show_header=True)
         summary_table.add_column("Métrica", style="cyan")
         summary_table.add_column("Valor", style="white")
@@ -360,4 +455,4 @@ def _display_analysis_summary(analysis_result: SAPAnalysisResult) -> None:
         summary_table.add_row("Objetos customizados", str(len(analysis_result.custom_objects)))
         summary_table.add_row("Timestamp", analysis_result.analysis_timestamp.strftime("%Y-%m-%d %H:%M:%S"))
         
-        console.print(summary_table)
\ No newline at end of file
+        get_console().print(summary_table)
\ No newline at end of file
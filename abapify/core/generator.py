@@ -5,10 +5,17 @@
 Classe principal para geração de código ABAP.
 """
 
-from typing import Dict, List, Optional, Union
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from abapify.llm.client import LLMClient
-from abapify.prompts.enhanced_system_prompts import ENHANCED_SYSTEM_PROMPT, SIMPLE_SYSTEM_PROMPT
+from abapify.prompts.enhanced_system_prompts import (
+    COMPACT_SYSTEM_PROMPT,
+    ENHANCED_SYSTEM_PROMPT,
+    SIMPLE_SYSTEM_PROMPT,
+)
 from abapify.prompts.user_prompts import (
     ALV_PROMPT_TEMPLATE,
     CLASS_PROMPT_TEMPLATE,
@@ -22,22 +29,45 @@ from abapify.prompts.user_prompts import (
 from abapify.utils.config import get_config_value
 from abapify.utils.logger import get_logger
 
-# Importações SAP (opcionais)
-try:
+# Importações SAP (opcionais), carregadas apenas quando a análise SAP é habilitada
+if TYPE_CHECKING:
     from abapify.sap import SAPConnection, MetadataAnalyzer
     from abapify.sap.models import SAPAnalysisResult
-    SAP_INTEGRATION_AVAILABLE = True
-except ImportError:
-    SAP_INTEGRATION_AVAILABLE = False
 
 logger = get_logger(__name__)
 
+# Parâmetros de geração específicos por tipo de artefato
+_GENERATION_OPTIONS: Dict[str, Dict[str, Any]] = {
+    "custom_program": {"temperature": 0.8, "max_tokens": 8192},
+}
+
+
+@lru_cache(maxsize=256)
+def _format_prompt(template: str, **fields: Union[str, Tuple[str, ...]]) -> str:
+    """
+    Preenche um template de prompt, memoizando o resultado.
+
+    Campos em tupla (tabelas, métodos etc.) são unidos por vírgula.
+
+    Args:
+        template: Template do prompt.
+        **fields: Valores dos campos do template.
+
+    Returns:
+        str: Prompt formatado.
+    """
+    return template.format(**{
+        name: ", ".join(value) if isinstance(value, tuple) else value
+        for name, value in fields.items()
+    })
+
 
 class AbapGenerator:
     """Gerador de código ABAP usando modelos de linguagem."""
 
     def __init__(self, model_name: Optional[str] = None, use_enhanced_prompts: bool = True,
-                 sap_environment: Optional[str] = None, enable_sap_analysis: bool = False):
+                 sap_environment: Optional[str] = None, enable_sap_analysis: bool = False,
+                 compact_prompts: bool = False):
         """
         Inicializa o gerador de código ABAP.
 
@@ -46,16 +76,24 @@ class AbapGenerator:
             use_enhanced_prompts: Se deve usar prompts aprimorados (padrão: True).
             sap_environment: Ambiente SAP para análise (opcional).
             enable_sap_analysis: Se deve habilitar análise SAP automática.
+            compact_prompts: Se deve usar o prompt de sistema compacto, com menos tokens.
         """
         self.llm_client = LLMClient()
         self.model_name = model_name
-        self.system_prompt = ENHANCED_SYSTEM_PROMPT if use_enhanced_prompts else SIMPLE_SYSTEM_PROMPT
+        if compact_prompts:
+            self.system_prompt = COMPACT_SYSTEM_PROMPT
+        else:
+            self.system_prompt = ENHANCED_SYSTEM_PROMPT if use_enhanced_prompts else SIMPLE_SYSTEM_PROMPT
+        
+        # Parâmetros de geração padrão, lidos uma única vez
+        self._default_temp = float(get_config_value("DEFAULT_TEMPERATURE", "0.7"))
+        self._default_tokens = int(get_config_value("DEFAULT_MAX_TOKENS", "4096"))
         
         # Configuração SAP
         self.sap_environment = sap_environment or get_config_value("SAP_DEFAULT_ENVIRONMENT", "DEV")
-        self.enable_sap_analysis = enable_sap_analysis and SAP_INTEGRATION_AVAILABLE
-        self.sap_connection: Optional[SAPConnection] = None
-        self.metadata_analyzer: Optional[MetadataAnalyzer] = None
+        self.enable_sap_analysis = enable_sap_analysis
+        self.sap_connection: Optional["SAPConnection"] = None
+        self.metadata_analyzer: Optional["MetadataAnalyzer"] = None
         
         if self.enable_sap_analysis:
             self._initialize_sap_connection()
@@ -63,14 +101,18 @@ class AbapGenerator:
     def _initialize_sap_connection(self) -> None:
         """Inicializa conexão SAP se habilitada."""
         try:
-            if SAP_INTEGRATION_AVAILABLE:
-                self.sap_connection = SAPConnection(environment=self.sap_environment)
-                self.metadata_analyzer = MetadataAnalyzer(self.sap_connection)
-                logger.info(f"Conexão SAP inicializada para ambiente: {self.sap_environment}")
-            else:
-                logger.warning("Integração SAP não disponível - módulo sap não encontrado")
+            from abapify.sap import SAPConnection, MetadataAnalyzer
+        except ImportError:
+            logger.warning("Integração SAP não disponível - módulo sap não encontrado")
+            self.enable_sap_analysis = False
+            return
+        
+        try:
+            self.sap_connection = SAPConnection(environment=self.sap_environment)
+            self.metadata_analyzer = MetadataAnalyzer(self.sap_connection)
+            logger.info("Conexão SAP inicializada para ambiente: %s", self.sap_environment)
         except Exception as e:
-            logger.error(f"Erro ao inicializar conexão SAP: {str(e)}")
+            logger.error("Erro ao inicializar conexão SAP: %s", e)
             self.enable_sap_analysis = False
 
     def _generate_code(self, prompt: str, temperature: Optional[float] = None, max_tokens: Optional[int] = None) -> str:
@@ -87,8 +129,8 @@ class AbapGenerator:
         """
         try:
             # Usa configurações padrão se não especificado
-            temp = temperature or float(get_config_value("DEFAULT_TEMPERATURE", "0.7"))
-            tokens = max_tokens or int(get_config_value("DEFAULT_MAX_TOKENS", "4096"))
+            temp = temperature if temperature is not None else self._default_temp
+            tokens = max_tokens if max_tokens is not None else self._default_tokens
             
             response = self.llm_client.generate(
                 system_prompt=self.system_prompt,
@@ -99,8 +141,235 @@ class AbapGenerator:
             )
             return response
         except Exception as e:
-            logger.error(f"Erro ao gerar código: {str(e)}")
+            logger.error("Erro ao gerar código: %s", e)
+            raise
+
+    def _generate_codes(
+        self,
+        prompts: List[str],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[str, Exception]]:
+        """
+        Gera o código ABAP de vários prompts em um único lote.
+
+        Args:
+            prompts: Prompts para o modelo de linguagem.
+            temperature: Temperatura para geração (opcional).
+            max_tokens: Máximo de tokens (opcional).
+            return_exceptions: Se deve devolver as falhas na lista em vez de propagá-las.
+
+        Returns:
+            List[Union[str, Exception]]: Códigos gerados, na ordem dos prompts.
+        """
+        temp = temperature if temperature is not None else self._default_temp
+        tokens = max_tokens if max_tokens is not None else self._default_tokens
+        
+        return self.llm_client.generate_batch(
+            system_prompt=self.system_prompt,
+            user_prompts=prompts,
+            model_name=self.model_name,
+            temperature=temp,
+            max_tokens=tokens,
+            return_exceptions=return_exceptions,
+        )
+
+    def generate_bundle(
+        self, requests: List[Dict[str, Any]], return_exceptions: bool = False
+    ) -> List[Union[str, Exception]]:
+        """
+        Gera vários artefatos ABAP com chamadas simultâneas ao provedor.
+
+        Cada requisição é um dicionário com as chaves "kind" (ex.: "class",
+        "alv") e "args" (argumentos nomeados do método generate_* equivalente).
+        Artefatos com os mesmos parâmetros de geração são enviados no mesmo lote.
+
+        Args:
+            requests: Lista de requisições de geração.
+            return_exceptions: Se deve devolver as falhas na lista em vez de propagá-las.
+
+        Returns:
+            List[Union[str, Exception]]: Códigos gerados, na ordem das requisições.
+        """
+        results: List[Union[str, Exception, None]] = [None] * len(requests)
+        batches: Dict[Tuple, List[Tuple[int, str]]] = {}
+        
+        for index, request in enumerate(requests):
+            try:
+                prompt, temperature, max_tokens = self._prepare_request(
+                    request.get("kind"), request.get("args", {})
+                )
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results[index] = e
+                continue
+            
+            batches.setdefault((temperature, max_tokens), []).append((index, prompt))
+        
+        logger.info("Gerando %s artefatos em %s lote(s)", len(requests), len(batches))
+        for (temperature, max_tokens), items in batches.items():
+            codes = self._generate_codes(
+                [prompt for _, prompt in items], temperature, max_tokens, return_exceptions
+            )
+            for (index, _), code in zip(items, codes):
+                results[index] = code
+        
+        return results
+
+    def _prepare_request(self, kind: str, args: Dict[str, Any]) -> Tuple[str, float, int]:
+        """
+        Monta o prompt e os parâmetros de geração de um artefato.
+
+        Args:
+            kind: Tipo do artefato (ex.: "class", "alv").
+            args: Argumentos nomeados do método generate_* equivalente.
+
+        Returns:
+            Tuple[str, float, int]: Prompt, temperatura e máximo de tokens.
+
+        Raises:
+            ValueError: Se o tipo de artefato for inválido.
+        """
+        prompt_builder = getattr(self, f"_{kind}_prompt", None)
+        if prompt_builder is None:
+            raise ValueError(f"Tipo de artefato inválido: {kind}")
+        
+        prompt = prompt_builder(**args)
+        options = _GENERATION_OPTIONS.get(kind, {})
+        temp = options.get("temperature", self._default_temp)
+        tokens = options.get("max_tokens", self._default_tokens)
+        return prompt, temp, tokens
+
+    def generate_map(
+        self, method: str, args_iter: Iterable[Dict[str, Any]], max_workers: int = 16
+    ) -> List[str]:
+        """
+        Executa um método generate_* para vários conjuntos de argumentos em paralelo.
+
+        As chamadas aos provedores ficam bloqueadas em E/S de rede, então
+        threads sobrepõem as requisições sem exigir a API assíncrona.
+
+        Args:
+            method: Nome do método de geração (ex.: "generate_class").
+            args_iter: Argumentos nomeados de cada chamada.
+            max_workers: Número máximo de gerações simultâneas.
+
+        Returns:
+            List[str]: Códigos gerados, na ordem dos argumentos.
+        """
+        generate = getattr(self, method)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda args: generate(**args), args_iter))
+
+    def generate_variants(self, kind: str, n: int, **kwargs) -> List[str]:
+        """
+        Gera várias alternativas de um mesmo artefato ABAP.
+
+        O prompt é enviado uma única vez com o parâmetro n, evitando n chamadas
+        sequenciais ao provedor.
+
+        Args:
+            kind: Tipo do artefato (ex.: "class", "alv").
+            n: Número de alternativas.
+            **kwargs: Argumentos nomeados do método generate_* equivalente.
+
+        Returns:
+            List[str]: Alternativas de código ABAP geradas.
+
+        Raises:
+            ValueError: Se o tipo de artefato for inválido.
+        """
+        prompt, temp, tokens = self._prepare_request(kind, kwargs)
+        
+        logger.info("Gerando %s alternativa(s) de %s", n, kind)
+        try:
+            response = self.llm_client.generate(
+                system_prompt=self.system_prompt,
+                user_prompt=prompt,
+                model_name=self.model_name,
+                temperature=temp,
+                max_tokens=tokens,
+                n=n,
+            )
+        except Exception as e:
+            logger.error("Erro ao gerar código: %s", e)
             raise
+        
+        return response if isinstance(response, list) else [response]
+
+    def generate_stream(self, kind: str, **kwargs) -> Iterator[str]:
+        """
+        Gera um artefato ABAP devolvendo o código em trechos, à medida que é produzido.
+
+        Args:
+            kind: Tipo do artefato (ex.: "class", "alv").
+            **kwargs: Argumentos nomeados do método generate_* equivalente.
+
+        Returns:
+            Iterator[str]: Trechos do código ABAP gerado.
+
+        Raises:
+            ValueError: Se o tipo de artefato for inválido.
+        """
+        prompt, temp, tokens = self._prepare_request(kind, kwargs)
+        
+        logger.info("Gerando artefato %s em streaming", kind)
+        return self.llm_client.generate_stream(
+            system_prompt=self.system_prompt,
+            user_prompt=prompt,
+            model_name=self.model_name,
+            temperature=temp,
+            max_tokens=tokens,
+        )
+
+    async def agenerate(self, kind: str, **kwargs) -> str:
+        """
+        Gera um artefato ABAP sem bloquear o loop de eventos.
+
+        Args:
+            kind: Tipo do artefato (ex.: "class", "alv").
+            **kwargs: Argumentos nomeados do método generate_* equivalente.
+
+        Returns:
+            str: Código ABAP gerado.
+
+        Raises:
+            ValueError: Se o tipo de artefato for inválido.
+        """
+        prompt, temp, tokens = self._prepare_request(kind, kwargs)
+        
+        logger.info("Gerando artefato %s de forma assíncrona", kind)
+        try:
+            return await self.llm_client.agenerate(
+                system_prompt=self.system_prompt,
+                user_prompt=prompt,
+                model_name=self.model_name,
+                temperature=temp,
+                max_tokens=tokens,
+            )
+        except Exception as e:
+            logger.error("Erro ao gerar código: %s", e)
+            raise
+
+    async def generate_all(
+        self, requests: List[Dict[str, Any]], return_exceptions: bool = False
+    ) -> List[Union[str, BaseException]]:
+        """
+        Gera vários artefatos ABAP simultaneamente com asyncio.gather.
+
+        Args:
+            requests: Lista de dicionários com "kind" e "args" (como em generate_bundle).
+            return_exceptions: Se deve devolver as falhas na lista em vez de propagá-las.
+
+        Returns:
+            List[Union[str, BaseException]]: Códigos gerados, na ordem das requisições.
+        """
+        return await asyncio.gather(
+            *(self.agenerate(request.get("kind"), **request.get("args", {})) for request in requests),
+            return_exceptions=return_exceptions,
+        )
 
     def _enrich_prompt_with_sap_context(self, base_prompt: str, tables: List[str]) -> str:
         """
@@ -117,7 +386,7 @@ class AbapGenerator:
             return base_prompt
         
         try:
-            logger.info(f"Enriquecendo prompt com análise SAP das tabelas: {tables}")
+            logger.info("Enriquecendo prompt com análise SAP das tabelas: %s", tables)
             
             # Analisa tabelas no SAP
             analysis_result = self.metadata_analyzer.generate_full_analysis(
@@ -146,7 +415,7 @@ INSTRUÇÕES ADICIONAIS BASEADAS NA ANÁLISE SAP:
             return enriched_prompt
             
         except Exception as e:
-            logger.error(f"Erro ao enriquecer prompt com contexto SAP: {str(e)}")
+            logger.error("Erro ao enriquecer prompt com contexto SAP: %s", e)
             return base_prompt
 
     def _build_sap_context(self, analysis_result: "SAPAnalysisResult") -> str:
@@ -240,16 +509,20 @@ INSTRUÇÕES ADICIONAIS BASEADAS NA ANÁLISE SAP:
         Returns:
             str: Código ABAP do relatório ALV.
         """
-        prompt = ALV_PROMPT_TEMPLATE.format(
-            description=description, tables=", ".join(tables)
+        prompt = self._alv_prompt(description, tables)
+        logger.info("Gerando relatório ALV: %s", description)
+        return self._generate_code(prompt)
+
+    def _alv_prompt(self, description: str, tables: List[str]) -> str:
+        """Monta o prompt do relatório ALV, enriquecido com contexto SAP se habilitado."""
+        prompt = _format_prompt(
+            ALV_PROMPT_TEMPLATE, description=description, tables=tuple(tables)
         )
         
         # Enriquece com contexto SAP se habilitado
         if self.enable_sap_analysis:
             prompt = self._enrich_prompt_with_sap_context(prompt, tables)
-        
-        logger.info(f"Gerando relatório ALV: {description}")
-        return self._generate_code(prompt)
+        return prompt
 
     def generate_report(self, description: str, tables: List[str]) -> str:
         """
@@ -262,16 +535,20 @@ INSTRUÇÕES ADICIONAIS BASEADAS NA ANÁLISE SAP:
         Returns:
             str: Código ABAP do relatório.
         """
-        prompt = REPORT_PROMPT_TEMPLATE.format(
-            description=description, tables=", ".join(tables)
+        prompt = self._report_prompt(description, tables)
+        logger.info("Gerando relatório: %s", description)
+        return self._generate_code(prompt)
+
+    def _report_prompt(self, description: str, tables: List[str]) -> str:
+        """Monta o prompt do relatório, enriquecido com contexto SAP se habilitado."""
+        prompt = _format_prompt(
+            REPORT_PROMPT_TEMPLATE, description=description, tables=tuple(tables)
         )
         
         # Enriquece com contexto SAP se habilitado
         if self.enable_sap_analysis:
             prompt = self._enrich_prompt_with_sap_context(prompt, tables)
-        
-        logger.info(f"Gerando relatório: {description}")
-        return self._generate_code(prompt)
+        return prompt
 
     def generate_class(self, description: str, methods: List[str]) -> str:
         """
@@ -284,12 +561,16 @@ INSTRUÇÕES ADICIONAIS BASEADAS NA ANÁLISE SAP:
         Returns:
             str: Código ABAP da classe.
         """
-        prompt = CLASS_PROMPT_TEMPLATE.format(
-            description=description, methods=", ".join(methods)
-        )
-        logger.info(f"Gerando classe: {description}")
+        prompt = self._class_prompt(description, methods)
+        logger.info("Gerando classe: %s", description)
         return self._generate_code(prompt)
 
+    def _class_prompt(self, description: str, methods: List[str]) -> str:
+        """Monta o prompt da classe ABAP."""
+        return _format_prompt(
+            CLASS_PROMPT_TEMPLATE, description=description, methods=tuple(methods)
+        )
+
     def generate_function_module(self, description: str, params: List[str]) -> str:
         """
         Gera um módulo de função ABAP.
@@ -301,12 +582,16 @@ INSTRUÇÕES ADICIONAIS BASEADAS NA ANÁLISE SAP:
         Returns:
             str: Código ABAP do módulo de função.
         """
-        prompt = FUNCTION_MODULE_PROMPT_TEMPLATE.format(
-            description=description, params=", ".join(params)
-        )
-        logger.info(f"Gerando módulo de função: {description}")
+        prompt = self._function_module_prompt(description, params)
+        logger.info("Gerando módulo de função: %s", description)
         return self._generate_code(prompt)
 
+    def _function_module_prompt(self, description: str, params: List[str]) -> str:
+        """Monta o prompt do módulo de função ABAP."""
+        return _format_prompt(
+            FUNCTION_MODULE_PROMPT_TEMPLATE, description=description, params=tuple(params)
+        )
+
     def generate_structure(self, description: str, fields: List[str]) -> str:
         """
         Gera uma estrutura ABAP.
@@ -318,12 +603,16 @@ INSTRUÇÕES ADICIONAIS BASEADAS NA ANÁLISE SAP:
         Returns:
             str: Código ABAP da estrutura.
         """
-        prompt = STRUCTURE_PROMPT_TEMPLATE.format(
-            description=description, fields=", ".join(fields)
-        )
-        logger.info(f"Gerando estrutura: {description}")
+        prompt = self._structure_prompt(description, fields)
+        logger.info("Gerando estrutura: %s", description)
         return self._generate_code(prompt)
 
+    def _structure_prompt(self, description: str, fields: List[str]) -> str:
+        """Monta o prompt da estrutura ABAP."""
+        return _format_prompt(
+            STRUCTURE_PROMPT_TEMPLATE, description=description, fields=tuple(fields)
+        )
+
     def generate_test(self, target: str) -> str:
         """
         Gera um teste unitário ABAP.
@@ -334,10 +623,14 @@ INSTRUÇÕES ADICIONAIS BASEADAS NA ANÁLISE SAP:
         Returns:
             str: Código ABAP do teste unitário.
         """
-        prompt = TEST_PROMPT_TEMPLATE.format(target=target)
-        logger.info(f"Gerando teste unitário: {target}")
+        prompt = self._test_prompt(target)
+        logger.info("Gerando teste unitário: %s", target)
         return self._generate_code(prompt)
 
+    def _test_prompt(self, target: str) -> str:
+        """Monta o prompt do teste unitário ABAP."""
+        return _format_prompt(TEST_PROMPT_TEMPLATE, target=target)
+
     def generate_custom_program(
         self,
         specification: str,
@@ -367,7 +660,35 @@ INSTRUÇÕES ADICIONAIS BASEADAS NA ANÁLISE SAP:
         Returns:
             str: Código ABAP do programa customizado.
         """
-        prompt = CUSTOM_PROGRAM_PROMPT_TEMPLATE.format(
+        prompt = self._custom_program_prompt(
+            specification,
+            program_type=program_type,
+            main_features=main_features,
+            entities=entities,
+            integrations=integrations,
+            business_rules=business_rules,
+            performance_requirements=performance_requirements,
+            security_requirements=security_requirements,
+            usability_requirements=usability_requirements,
+        )
+        logger.info("Gerando programa customizado: %s", program_type)
+        return self._generate_code(prompt, **_GENERATION_OPTIONS["custom_program"])
+
+    def _custom_program_prompt(
+        self,
+        specification: str,
+        program_type: str = "Report",
+        main_features: str = "",
+        entities: str = "",
+        integrations: str = "Nenhuma",
+        business_rules: str = "",
+        performance_requirements: str = "Padrão",
+        security_requirements: str = "Verificações de autorização padrão",
+        usability_requirements: str = "Interface intuitiva",
+    ) -> str:
+        """Monta o prompt do programa customizado, enriquecido com contexto SAP se habilitado."""
+        prompt = _format_prompt(
+            CUSTOM_PROGRAM_PROMPT_TEMPLATE,
             specification=specification,
             program_type=program_type,
             main_features=main_features,
@@ -383,9 +704,7 @@ INSTRUÇÕES ADICIONAIS BASEADAS NA ANÁLISE SAP:
         if self.enable_sap_analysis and entities:
             table_names = [t.strip() for t in entities.split(',') if t.strip()]
             prompt = self._enrich_prompt_with_sap_context(prompt, table_names)
-        
-        logger.info(f"Gerando programa customizado: {program_type}")
-        return self._generate_code(prompt, temperature=0.8, max_tokens=8192)
+        return prompt
 
     def generate_enhancement(
         self,
@@ -406,14 +725,25 @@ INSTRUÇÕES ADICIONAIS BASEADAS NA ANÁLISE SAP:
         Returns:
             str: Código ABAP do enhancement.
         """
-        prompt = ENHANCEMENT_PROMPT_TEMPLATE.format(
+        prompt = self._enhancement_prompt(base_object, enhancement_type, functionality, enhancement_points)
+        logger.info("Gerando enhancement: %s para %s", enhancement_type, base_object)
+        return self._generate_code(prompt)
+
+    def _enhancement_prompt(
+        self,
+        base_object: str,
+        enhancement_type: str,
+        functionality: str,
+        enhancement_points: str = "",
+    ) -> str:
+        """Monta o prompt do enhancement ABAP."""
+        return _format_prompt(
+            ENHANCEMENT_PROMPT_TEMPLATE,
             base_object=base_object,
             enhancement_type=enhancement_type,
             functionality=functionality,
             enhancement_points=enhancement_points,
         )
-        logger.info(f"Gerando enhancement: {enhancement_type} para {base_object}")
-        return self._generate_code(prompt)
 
     def close_sap_connection(self) -> None:
         """Encerra conexão SAP se ativa."""
@@ -5,34 +5,76 @@
 Cliente para comunicação com LLMs como Arcee, Groq e OpenAI.
 """
 
+import functools
+import importlib
 import os
-from typing import Dict, List, Optional, Union
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Union
 
-from abapify.llm.providers.arcee_provider import ArceeProvider
-from abapify.llm.providers.groq_provider import GroqProvider
-from abapify.llm.providers.openai_provider import OpenAIProvider
+from abapify.utils.cache import cache_key, read_cache_entry, write_cache_entry
+from abapify.utils.config import MISSING_API_KEY_WARNING, get_config_value
 from abapify.utils.exceptions import LLMProviderNotFoundError
 from abapify.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Subdiretório do cache com as respostas dos modelos
+_RESPONSE_CACHE_NAMESPACE = "responses"
+
+# Provedores disponíveis: nome -> "módulo:classe", importados apenas quando usados
+_PROVIDER_FACTORIES: Dict[str, str] = {
+    "arcee": "abapify.llm.providers.arcee_provider:ArceeProvider",
+    "groq": "abapify.llm.providers.groq_provider:GroqProvider",
+    "openai": "abapify.llm.providers.openai_provider:OpenAIProvider",
+    "vllm": "abapify.llm.providers.vllm_provider:VLLMProvider",
+}
+
+
+@functools.cache
+def _shared_provider(provider_name: str) -> Any:
+    """
+    Obtém a instância do provedor compartilhada pelo processo.
+
+    Os clientes HTTP dos SDKs são seguros entre threads, então todos os
+    LLMClient reaproveitam as mesmas conexões.
+
+    Args:
+        provider_name: Nome do provedor registrado em _PROVIDER_FACTORIES.
+
+    Returns:
+        Instância do provedor.
+    """
+    module_name, class_name = _PROVIDER_FACTORIES[provider_name].split(":")
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+def clear_provider_cache() -> None:
+    """
+    Descarta as instâncias compartilhadas dos provedores.
+
+    Os provedores leem chaves, URLs e modelos do ambiente ao serem criados;
+    após uma mudança de configuração, os próximos LLMClient criam instâncias
+    novas com os valores atualizados.
+    """
+    _shared_provider.cache_clear()
+
 
 class LLMClient:
     """Cliente para comunicação com modelos de linguagem."""
 
     def __init__(self):
         """Inicializa o cliente LLM."""
-        self._providers = {
-            "arcee": ArceeProvider(),
-            "groq": GroqProvider(),
-            "openai": OpenAIProvider(),
-        }
+        self._providers: Dict[str, Any] = {}
+        # Gerações em andamento por chave de cache, compartilhadas por chamadas idênticas
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
         self._default_provider = self._get_default_provider()
 
     def _get_default_provider(self) -> str:
         """
         Determina o provedor padrão com base nas variáveis de ambiente disponíveis.
-        Prioridade: Arcee > Groq > OpenAI
+        Prioridade: Arcee > Groq > OpenAI > vLLM
 
         Returns:
             str: Nome do provedor padrão.
@@ -43,12 +85,55 @@ class LLMClient:
             return "groq"
         elif os.environ.get("OPENAI_API_KEY"):
             return "openai"
+        elif os.environ.get("VLLM_BASE_URL"):
+            return "vllm"
         else:
-            logger.warning(
-                "Nenhuma chave de API encontrada. Configure ARCEE_TOKEN, GROQ_API_KEY ou OPENAI_API_KEY."
-            )
+            logger.warning(MISSING_API_KEY_WARNING)
             return "arcee"  # Padrão para Arcee
 
+    def _get_provider(self, provider: Optional[str] = None):
+        """
+        Obtém a instância do provedor solicitado (ou do padrão), criada no primeiro uso.
+
+        Args:
+            provider: Nome do provedor a ser utilizado.
+
+        Returns:
+            Instância do provedor.
+
+        Raises:
+            LLMProviderNotFoundError: Se o provedor especificado não for encontrado.
+        """
+        provider_name = provider or self._default_provider
+        
+        provider_instance = self._providers.get(provider_name)
+        if provider_instance is None:
+            if provider_name not in _PROVIDER_FACTORIES:
+                raise LLMProviderNotFoundError(f"Provedor não encontrado: {provider_name}")
+            provider_instance = self._providers[provider_name] = _shared_provider(provider_name)
+        
+        logger.info("Usando provedor: %s", provider_name)
+        
+        return provider_instance
+
+    @staticmethod
+    def _use_response_cache(temperature: float) -> bool:
+        """
+        Indica se as respostas devem ser reaproveitadas do cache.
+
+        Gerações determinísticas (temperatura 0) sempre usam o cache; as demais
+        apenas quando ABAPIFY_CACHE estiver habilitado.
+
+        Args:
+            temperature: Temperatura da geração.
+
+        Returns:
+            bool: True se o cache de respostas deve ser usado.
+        """
+        if temperature == 0:
+            return True
+        return str(get_config_value("ABAPIFY_CACHE", "")).lower() in ("1", "true", "yes")
+
     def generate(
         self,
         system_prompt: str,
@@ -57,10 +142,14 @@ class LLMClient:
         model_name: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
-    ) -> str:
+        n: int = 1,
+    ) -> Union[str, List[str]]:
         """
         Gera texto usando o modelo de linguagem.
 
+        Com n > 1, as alternativas são pedidas em uma única requisição quando o
+        provedor suporta o parâmetro n, e em requisições simultâneas caso contrário.
+
         Args:
             system_prompt: Prompt de sistema para o modelo.
             user_prompt: Prompt do usuário.
@@ -68,26 +157,221 @@ class LLMClient:
             model_name: Nome do modelo a ser utilizado.
             temperature: Temperatura para geração de texto.
             max_tokens: Número máximo de tokens a serem gerados.
+            n: Número de alternativas geradas a partir do mesmo prompt.
 
         Returns:
-            str: Texto gerado pelo modelo.
+            Union[str, List[str]]: Texto gerado pelo modelo, ou a lista de alternativas se n > 1.
 
         Raises:
             LLMProviderNotFoundError: Se o provedor especificado não for encontrado.
         """
-        provider_name = provider or self._default_provider
+        provider_instance = self._get_provider(provider)
         
-        if provider_name not in self._providers:
-            raise LLMProviderNotFoundError(f"Provedor não encontrado: {provider_name}")
+        if n > 1:
+            if not getattr(provider_instance, "SUPPORTS_N", True):
+                # Chama o provedor diretamente: cache e coalescência devolveriam
+                # a mesma resposta para todas as alternativas
+                with ThreadPoolExecutor(max_workers=min(n, 4)) as executor:
+                    futures = [
+                        executor.submit(
+                            provider_instance.generate,
+                            system_prompt=system_prompt,
+                            user_prompt=user_prompt,
+                            model_name=model_name,
+                            temperature=temperature,
+                            max_tokens=max_tokens,
+                        )
+                        for _ in range(n)
+                    ]
+                    return [future.result() for future in futures]
+            return provider_instance.generate(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                model_name=model_name,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                n=n,
+            )
+        
+        if not self._use_response_cache(temperature):
+            return provider_instance.generate(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                model_name=model_name,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+        
+        # A chave usa o modelo efetivamente chamado e, no vLLM, também o servidor
+        key = cache_key(
+            provider or self._default_provider,
+            model_name or provider_instance.DEFAULT_MODEL,
+            getattr(provider_instance, "base_url", None),
+            temperature, max_tokens, system_prompt, user_prompt,
+        )
+        cached = read_cache_entry(_RESPONSE_CACHE_NAMESPACE, key, suffix=".txt")
+        if cached is not None:
+            logger.info("Resposta recuperada do cache: %s.txt", key)
+            return cached
         
-        provider_instance = self._providers[provider_name]
+        # Chamadas idênticas simultâneas aguardam a mesma requisição ao provedor
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[key] = Future()
+        if not is_owner:
+            return future.result()
+        
+        try:
+            response = provider_instance.generate(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                model_name=model_name,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+            if response:
+                write_cache_entry(_RESPONSE_CACHE_NAMESPACE, key, response, suffix=".txt")
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        provider: Optional[str] = None,
+        model_name: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> Iterator[str]:
+        """
+        Gera texto usando o modelo de linguagem, devolvendo os trechos à medida que chegam.
+
+        Args:
+            system_prompt: Prompt de sistema para o modelo.
+            user_prompt: Prompt do usuário.
+            provider: Nome do provedor a ser utilizado.
+            model_name: Nome do modelo a ser utilizado.
+            temperature: Temperatura para geração de texto.
+            max_tokens: Número máximo de tokens a serem gerados.
+
+        Returns:
+            Iterator[str]: Trechos do texto gerado.
+
+        Raises:
+            LLMProviderNotFoundError: Se o provedor especificado não for encontrado.
+        """
+        provider_instance = self._get_provider(provider)
         
-        logger.info(f"Usando provedor: {provider_name}")
+        return provider_instance.generate_stream(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            model_name=model_name,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+    async def agenerate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        provider: Optional[str] = None,
+        model_name: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> str:
+        """
+        Gera texto usando o modelo de linguagem, sem bloquear o loop de eventos.
+
+        Args:
+            system_prompt: Prompt de sistema para o modelo.
+            user_prompt: Prompt do usuário.
+            provider: Nome do provedor a ser utilizado.
+            model_name: Nome do modelo a ser utilizado.
+            temperature: Temperatura para geração de texto.
+            max_tokens: Número máximo de tokens a serem gerados.
+
+        Returns:
+            str: Texto gerado pelo modelo.
+
+        Raises:
+            LLMProviderNotFoundError: Se o provedor especificado não for encontrado.
+        """
+        provider_instance = self._get_provider(provider)
         
-        return provider_instance.generate(
+        return await provider_instance.agenerate(
             system_prompt=system_prompt,
             user_prompt=user_prompt,
             model_name=model_name,
             temperature=temperature,
             max_tokens=max_tokens,
-        )
\ No newline at end of file
+        )
+
+    def generate_batch(
+        self,
+        system_prompt: str,
+        user_prompts: List[str],
+        provider: Optional[str] = None,
+        model_name: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        return_exceptions: bool = False,
+        max_workers: int = 4,
+    ) -> List[Union[str, Exception]]:
+        """
+        Gera textos para vários prompts do usuário com o mesmo prompt de sistema.
+
+        As APIs de chat aceitam uma conversa por requisição, então os prompts
+        são enviados simultaneamente ao provedor, sobrepondo a latência de rede.
+
+        Args:
+            system_prompt: Prompt de sistema compartilhado pelo lote.
+            user_prompts: Prompts do usuário.
+            provider: Nome do provedor a ser utilizado.
+            model_name: Nome do modelo a ser utilizado.
+            temperature: Temperatura para geração de texto.
+            max_tokens: Número máximo de tokens a serem gerados.
+            return_exceptions: Se deve devolver as falhas na lista em vez de propagá-las.
+            max_workers: Número máximo de requisições simultâneas.
+
+        Returns:
+            List[Union[str, Exception]]: Textos gerados, na ordem dos prompts.
+
+        Raises:
+            LLMProviderNotFoundError: Se o provedor especificado não for encontrado.
+        """
+        self._get_provider(provider)
+        if not user_prompts:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(user_prompts))) as executor:
+            futures = [
+                executor.submit(
+                    self.generate,
+                    system_prompt=system_prompt,
+                    user_prompt=user_prompt,
+                    provider=provider,
+                    model_name=model_name,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+                for user_prompt in user_prompts
+            ]
+            
+            results: List[Union[str, Exception]] = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results.append(e)
+        
+        return results
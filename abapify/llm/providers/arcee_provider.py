@@ -5,9 +5,13 @@
 Implementação do provedor Arcee Conductor para geração de texto.
 """
 
+import asyncio
+import json
 import os
 import requests
-from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterator, List, Optional, Union
+from urllib3.util.retry import Retry
 
 from abapify.utils.exceptions import LLMAPIError
 from abapify.utils.logger import get_logger
@@ -20,6 +24,7 @@ class ArceeProvider:
 
     DEFAULT_MODEL = "auto"
     BASE_URL = "https://conductor.arcee.ai/v1"
+    POOL_SIZE = 32
 
     def __init__(self):
         """Inicializa o provedor Arcee."""
@@ -29,6 +34,21 @@ class ArceeProvider:
         
         self.api_key = api_key
         self.session = requests.Session()
+        
+        # Pool de conexões reutilizadas entre chamadas (inclusive simultâneas)
+        retry_strategy = Retry(
+            total=3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            backoff_factor=0.3,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_SIZE,
+            pool_maxsize=self.POOL_SIZE,
+            max_retries=retry_strategy,
+        )
+        self.session.mount("https://", adapter)
         if api_key:
             self.session.headers.update({
                 "Authorization": f"Bearer {api_key}",
@@ -42,7 +62,8 @@ class ArceeProvider:
         model_name: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
-    ) -> str:
+        n: int = 1,
+    ) -> Union[str, List[str]]:
         """
         Gera texto usando o modelo Arcee Conductor.
 
@@ -52,16 +73,17 @@ class ArceeProvider:
             model_name: Nome do modelo a ser utilizado.
             temperature: Temperatura para geração de texto.
             max_tokens: Número máximo de tokens a serem gerados.
+            n: Número de alternativas geradas a partir do mesmo prompt.
 
         Returns:
-            str: Texto gerado pelo modelo.
+            Union[str, List[str]]: Texto gerado pelo modelo, ou a lista de alternativas se n > 1.
 
         Raises:
             LLMAPIError: Se ocorrer um erro na API do Arcee.
         """
         try:
             model = model_name or self.DEFAULT_MODEL
-            logger.info(f"Usando modelo Arcee: {model}")
+            logger.info("Usando modelo Arcee: %s", model)
             
             # Monta os dados da requisição
             data = {
@@ -73,6 +95,8 @@ class ArceeProvider:
                 "temperature": temperature,
                 "max_tokens": max_tokens,
             }
+            if n > 1:
+                data["n"] = n
             
             # Faz a requisição para a API
             response = self.session.post(
@@ -90,11 +114,118 @@ class ArceeProvider:
             if "choices" not in result or not result["choices"]:
                 raise LLMAPIError("Resposta inválida da API do Arcee")
             
+            if n > 1:
+                return [choice["message"]["content"] for choice in result["choices"]]
             return result["choices"][0]["message"]["content"]
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Erro de rede na API do Arcee: {str(e)}")
+            logger.error("Erro de rede na API do Arcee: %s", e)
             raise LLMAPIError(f"Erro de rede na API do Arcee: {str(e)}")
         except Exception as e:
-            logger.error(f"Erro na API do Arcee: {str(e)}")
-            raise LLMAPIError(f"Erro na API do Arcee: {str(e)}")
\ No newline at end of file
+            logger.error("Erro na API do Arcee: %s", e)
+            raise LLMAPIError(f"Erro na API do Arcee: {str(e)}")
+
+    def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model_name: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> Iterator[str]:
+        """
+        Gera texto usando o modelo Arcee Conductor, devolvendo os trechos à medida que chegam.
+
+        Args:
+            system_prompt: Prompt de sistema para o modelo.
+            user_prompt: Prompt do usuário.
+            model_name: Nome do modelo a ser utilizado.
+            temperature: Temperatura para geração de texto.
+            max_tokens: Número máximo de tokens a serem gerados.
+
+        Yields:
+            str: Trechos do texto gerado.
+
+        Raises:
+            LLMAPIError: Se ocorrer um erro na API do Arcee.
+        """
+        try:
+            model = model_name or self.DEFAULT_MODEL
+            logger.info("Usando modelo Arcee (streaming): %s", model)
+            
+            data = {
+                "model": model,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "stream": True,
+            }
+            
+            with self.session.post(
+                f"{self.BASE_URL}/chat/completions",
+                json=data,
+                timeout=120,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                
+                # Eventos SSE: linhas "data: {...}" terminadas por "data: [DONE]".
+                # O text/event-stream chega sem charset e o requests assumiria
+                # ISO-8859-1, por isso cada linha é decodificada como UTF-8.
+                for raw_line in response.iter_lines():
+                    line = raw_line.decode("utf-8")
+                    if not line.startswith("data:"):
+                        continue
+                    payload = line[5:].strip()
+                    if payload == "[DONE]":
+                        break
+                    
+                    choices = json.loads(payload).get("choices")
+                    content = choices[0].get("delta", {}).get("content") if choices else None
+                    if content:
+                        yield content
+                        
+        except requests.exceptions.RequestException as e:
+            logger.error("Erro de rede na API do Arcee: %s", e)
+            raise LLMAPIError(f"Erro de rede na API do Arcee: {str(e)}")
+        except Exception as e:
+            logger.error("Erro na API do Arcee: %s", e)
+            raise LLMAPIError(f"Erro na API do Arcee: {str(e)}")
+
+    async def agenerate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model_name: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> str:
+        """
+        Gera texto usando o modelo Arcee Conductor, sem bloquear o loop de eventos.
+
+        A requisição reutiliza a sessão HTTP do provedor em uma thread auxiliar.
+
+        Args:
+            system_prompt: Prompt de sistema para o modelo.
+            user_prompt: Prompt do usuário.
+            model_name: Nome do modelo a ser utilizado.
+            temperature: Temperatura para geração de texto.
+            max_tokens: Número máximo de tokens a serem gerados.
+
+        Returns:
+            str: Texto gerado pelo modelo.
+
+        Raises:
+            LLMAPIError: Se ocorrer um erro na API do Arcee.
+        """
+        return await asyncio.to_thread(
+            self.generate,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            model_name=model_name,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
@@ -5,10 +5,12 @@
 Implementação do provedor Groq para geração de texto.
 """
 
+import asyncio
 import os
-from typing import Dict, List, Optional
+import weakref
+from typing import Dict, Iterator, List, Optional
 
-from groq import Groq
+from groq import AsyncGroq, Groq
 
 from abapify.utils.exceptions import LLMAPIError
 from abapify.utils.logger import get_logger
@@ -20,6 +22,10 @@ class GroqProvider:
     """Provedor Groq para geração de texto."""
 
     DEFAULT_MODEL = "meta-llama/llama-4-maverick-17b-128e-instruct"
+    # A API do Groq aceita apenas n=1; alternativas usam requisições separadas
+    SUPPORTS_N = False
+    # Novas tentativas do SDK (backoff exponencial) em 429, 5xx e falhas de conexão
+    MAX_RETRIES = 4
 
     def __init__(self):
         """Inicializa o provedor Groq."""
@@ -27,7 +33,22 @@ class GroqProvider:
         if not api_key:
             logger.warning("GROQ_API_KEY não encontrada no ambiente")
         
-        self.client = Groq(api_key=api_key)
+        self.api_key = api_key
+        self.client = Groq(api_key=api_key, max_retries=self.MAX_RETRIES)
+        # Um cliente assíncrono por loop de eventos: o cliente fica preso ao
+        # loop em que foi usado pela primeira vez
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncGroq]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def async_client(self) -> AsyncGroq:
+        """Cliente assíncrono do loop de eventos em execução, criado apenas quando necessário."""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = AsyncGroq(api_key=self.api_key, max_retries=self.MAX_RETRIES)
+        return client
 
     def generate(
         self,
@@ -55,7 +76,7 @@ class GroqProvider:
         """
         try:
             model = model_name or self.DEFAULT_MODEL
-            logger.info(f"Usando modelo Groq: {model}")
+            logger.info("Usando modelo Groq: %s", model)
             
             completion = self.client.chat.completions.create(
                 model=model,
@@ -69,5 +90,94 @@ class GroqProvider:
             
             return completion.choices[0].message.content
         except Exception as e:
-            logger.error(f"Erro na API do Groq: {str(e)}")
-            raise LLMAPIError(f"Erro na API do Groq: {str(e)}")
\ No newline at end of file
+            logger.error("Erro na API do Groq: %s", e)
+            raise LLMAPIError(f"Erro na API do Groq: {str(e)}")
+
+    def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model_name: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> Iterator[str]:
+        """
+        Gera texto usando o modelo Groq, devolvendo os trechos à medida que chegam.
+
+        Args:
+            system_prompt: Prompt de sistema para o modelo.
+            user_prompt: Prompt do usuário.
+            model_name: Nome do modelo a ser utilizado.
+            temperature: Temperatura para geração de texto.
+            max_tokens: Número máximo de tokens a serem gerados.
+
+        Yields:
+            str: Trechos do texto gerado.
+
+        Raises:
+            LLMAPIError: Se ocorrer um erro na API do Groq.
+        """
+        try:
+            model = model_name or self.DEFAULT_MODEL
+            logger.info("Usando modelo Groq (streaming): %s", model)
+            
+            stream = self.client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=temperature,
+                max_completion_tokens=max_tokens,
+                stream=True,
+            )
+            
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            logger.error("Erro na API do Groq: %s", e)
+            raise LLMAPIError(f"Erro na API do Groq: {str(e)}")
+
+    async def agenerate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model_name: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> str:
+        """
+        Gera texto usando o modelo Groq, sem bloquear o loop de eventos.
+
+        Args:
+            system_prompt: Prompt de sistema para o modelo.
+            user_prompt: Prompt do usuário.
+            model_name: Nome do modelo a ser utilizado.
+            temperature: Temperatura para geração de texto.
+            max_tokens: Número máximo de tokens a serem gerados.
+
+        Returns:
+            str: Texto gerado pelo modelo.
+
+        Raises:
+            LLMAPIError: Se ocorrer um erro na API do Groq.
+        """
+        try:
+            model = model_name or self.DEFAULT_MODEL
+            logger.info("Usando modelo Groq: %s", model)
+            
+            completion = await self.async_client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=temperature,
+                max_completion_tokens=max_tokens,
+            )
+            
+            return completion.choices[0].message.content
+        except Exception as e:
+            logger.error("Erro na API do Groq: %s", e)
+            raise LLMAPIError(f"Erro na API do Groq: {str(e)}")
@@ -5,10 +5,12 @@
 Implementação do provedor OpenAI para geração de texto.
 """
 
+import asyncio
 import os
-from typing import Dict, List, Optional
+import weakref
+from typing import Dict, Iterator, List, Optional, Union
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from abapify.utils.exceptions import LLMAPIError
 from abapify.utils.logger import get_logger
@@ -20,6 +22,9 @@ class OpenAIProvider:
     """Provedor OpenAI para geração de texto."""
 
     DEFAULT_MODEL = "gpt-4o"
+    API_NAME = "OpenAI"
+    # Novas tentativas do SDK (backoff exponencial) em 429, 5xx e falhas de conexão
+    MAX_RETRIES = 4
 
     def __init__(self):
         """Inicializa o provedor OpenAI."""
@@ -27,7 +32,26 @@ class OpenAIProvider:
         if not api_key:
             logger.warning("OPENAI_API_KEY não encontrada no ambiente")
         
-        self.client = OpenAI(api_key=api_key)
+        self.api_key = api_key
+        self.client = OpenAI(api_key=api_key, max_retries=self.MAX_RETRIES)
+        # Um cliente assíncrono por loop de eventos: o cliente fica preso ao
+        # loop em que foi usado pela primeira vez
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _create_async_client(self) -> AsyncOpenAI:
+        """Cria um cliente assíncrono do OpenAI."""
+        return AsyncOpenAI(api_key=self.api_key, max_retries=self.MAX_RETRIES)
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Cliente assíncrono do loop de eventos em execução, criado apenas quando necessário."""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = self._create_async_client()
+        return client
 
     def generate(
         self,
@@ -36,7 +60,8 @@ class OpenAIProvider:
         model_name: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
-    ) -> str:
+        n: int = 1,
+    ) -> Union[str, List[str]]:
         """
         Gera texto usando o modelo OpenAI.
 
@@ -46,16 +71,17 @@ class OpenAIProvider:
             model_name: Nome do modelo a ser utilizado.
             temperature: Temperatura para geração de texto.
             max_tokens: Número máximo de tokens a serem gerados.
+            n: Número de alternativas geradas a partir do mesmo prompt.
 
         Returns:
-            str: Texto gerado pelo modelo.
+            Union[str, List[str]]: Texto gerado pelo modelo, ou a lista de alternativas se n > 1.
 
         Raises:
             LLMAPIError: Se ocorrer um erro na API do OpenAI.
         """
         try:
             model = model_name or self.DEFAULT_MODEL
-            logger.info(f"Usando modelo OpenAI: {model}")
+            logger.info("Usando modelo %s: %s", self.API_NAME, model)
             
             completion = self.client.chat.completions.create(
                 model=model,
@@ -65,9 +91,101 @@ class OpenAIProvider:
                 ],
                 temperature=temperature,
                 max_tokens=max_tokens,
+                n=n,
+            )
+            
+            if n > 1:
+                return [choice.message.content for choice in completion.choices]
+            return completion.choices[0].message.content
+        except Exception as e:
+            logger.error("Erro na API do %s: %s", self.API_NAME, e)
+            raise LLMAPIError(f"Erro na API do {self.API_NAME}: {str(e)}")
+
+    def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model_name: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> Iterator[str]:
+        """
+        Gera texto usando o modelo OpenAI, devolvendo os trechos à medida que chegam.
+
+        Args:
+            system_prompt: Prompt de sistema para o modelo.
+            user_prompt: Prompt do usuário.
+            model_name: Nome do modelo a ser utilizado.
+            temperature: Temperatura para geração de texto.
+            max_tokens: Número máximo de tokens a serem gerados.
+
+        Yields:
+            str: Trechos do texto gerado.
+
+        Raises:
+            LLMAPIError: Se ocorrer um erro na API do OpenAI.
+        """
+        try:
+            model = model_name or self.DEFAULT_MODEL
+            logger.info("Usando modelo %s (streaming): %s", self.API_NAME, model)
+            
+            stream = self.client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+            )
+            
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            logger.error("Erro na API do %s: %s", self.API_NAME, e)
+            raise LLMAPIError(f"Erro na API do {self.API_NAME}: {str(e)}")
+
+    async def agenerate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model_name: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> str:
+        """
+        Gera texto usando o modelo OpenAI, sem bloquear o loop de eventos.
+
+        Args:
+            system_prompt: Prompt de sistema para o modelo.
+            user_prompt: Prompt do usuário.
+            model_name: Nome do modelo a ser utilizado.
+            temperature: Temperatura para geração de texto.
+            max_tokens: Número máximo de tokens a serem gerados.
+
+        Returns:
+            str: Texto gerado pelo modelo.
+
+        Raises:
+            LLMAPIError: Se ocorrer um erro na API do OpenAI.
+        """
+        try:
+            model = model_name or self.DEFAULT_MODEL
+            logger.info("Usando modelo %s: %s", self.API_NAME, model)
+            
+            completion = await self.async_client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens,
             )
             
             return completion.choices[0].message.content
         except Exception as e:
-            logger.error(f"Erro na API do OpenAI: {str(e)}")
-            raise LLMAPIError(f"Erro na API do OpenAI: {str(e)}")
\ No newline at end of file
+            logger.error("Erro na API do %s: %s", self.API_NAME, e)
+            raise LLMAPIError(f"Erro na API do {self.API_NAME}: {str(e)}")
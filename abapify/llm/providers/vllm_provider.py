@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Implementação do provedor vLLM (endpoint compatível com a API da OpenAI).
+"""
+
+import asyncio
+import os
+import weakref
+
+from openai import AsyncOpenAI, OpenAI
+
+from abapify.llm.providers.openai_provider import OpenAIProvider
+from abapify.utils.exceptions import ConfigError
+from abapify.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class VLLMProvider(OpenAIProvider):
+    """
+    Provedor para servidores vLLM locais ou privados.
+
+    O prompt de sistema é enviado sempre idêntico como primeira mensagem, o
+    que permite ao cache de prefixos do vLLM reaproveitar seu prefill entre
+    as requisições.
+    """
+
+    API_NAME = "vLLM"
+
+    def __init__(self):
+        """
+        Inicializa o provedor vLLM.
+
+        Raises:
+            ConfigError: Se VLLM_MODEL não estiver configurado.
+        """
+        base_url = os.environ.get("VLLM_BASE_URL")
+        if not base_url:
+            logger.warning("VLLM_BASE_URL não encontrada no ambiente")
+        
+        # O vLLM só exige chave quando iniciado com --api-key
+        self.api_key = os.environ.get("VLLM_API_KEY") or "EMPTY"
+        # Modelo servido pelo vLLM (o servidor costuma expor um único modelo)
+        self.DEFAULT_MODEL = os.environ.get("VLLM_MODEL", "").strip()
+        if not self.DEFAULT_MODEL:
+            raise ConfigError(
+                "VLLM_MODEL não configurado. Informe o modelo servido pelo vLLM "
+                "(abapify config setup ou VLLM_MODEL no .env)."
+            )
+        self.base_url = base_url
+        self.client = OpenAI(api_key=self.api_key, base_url=base_url, max_retries=self.MAX_RETRIES)
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _create_async_client(self) -> AsyncOpenAI:
+        """Cria um cliente assíncrono apontando para o servidor vLLM."""
+        return AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, max_retries=self.MAX_RETRIES)
@@ -4,68 +4,68 @@
 """
 Módulo de integração SAP para ABAPify.
 Fornece conectividade e análise de metadados SAP.
+
+As classes principais são importadas apenas no primeiro acesso (PEP 562),
+evitando carregar requests, cryptography e pyrfc em quem não usa o SAP.
 """
 
-try:
-    from .connection import SAPConnection
-    from .metadata_analyzer import MetadataAnalyzer
-    from .auth import SAPAuthenticator
-    from .exceptions import (
-        SAPConnectionError,
-        SAPAuthenticationError,
-        SAPMetadataError,
-        SAPRFCError,
-        SAPHTTPError,
-    )
-    
-    __all__ = [
-        "SAPConnection",
-        "MetadataAnalyzer", 
-        "SAPAuthenticator",
-        "SAPConnectionError",
-        "SAPAuthenticationError",
-        "SAPMetadataError",
-        "SAPRFCError",
-        "SAPHTTPError",
-    ]
-    
-except ImportError as e:
-    # Se algum módulo não existe, define versões básicas
-    import warnings
-    warnings.warn(f"Alguns módulos SAP não puderam ser carregados: {e}")
-    
-    # Define classes básicas para evitar erros de import
-    class SAPConnection:
-        def __init__(self, *args, **kwargs):
-            raise ImportError("Módulo SAP não configurado corretamente")
-    
-    class MetadataAnalyzer:
-        def __init__(self, *args, **kwargs):
-            raise ImportError("Módulo SAP não configurado corretamente")
-    
-    class SAPAuthenticator:
-        def __init__(self, *args, **kwargs):
-            raise ImportError("Módulo SAP não configurado corretamente")
+import importlib
+import warnings
+
+from .exceptions import (
+    SAPConnectionError,
+    SAPAuthenticationError,
+    SAPMetadataError,
+    SAPRFCError,
+    SAPHTTPError,
+)
+
+# Classes carregadas sob demanda: nome -> submódulo que a define
+_LAZY_EXPORTS = {
+    "SAPConnection": ".connection",
+    "MetadataAnalyzer": ".metadata_analyzer",
+    "SAPAuthenticator": ".auth",
+}
+
+__all__ = [
+    "SAPConnection",
+    "MetadataAnalyzer", 
+    "SAPAuthenticator",
+    "SAPConnectionError",
+    "SAPAuthenticationError",
+    "SAPMetadataError",
+    "SAPRFCError",
+    "SAPHTTPError",
+]
+
+__version__ = "1.0.0"
+
+
+def _unavailable(name: str, reason: str) -> type:
+    """Cria uma classe substituta que falha ao ser instanciada."""
+    def __init__(self, *args, **kwargs):
+        raise ImportError(f"Módulo SAP não configurado corretamente: {reason}")
     
-    # Exceções básicas
-    class SAPError(Exception):
-        pass
+    return type(name, (), {"__init__": __init__})
+
+
+def __getattr__(name: str):
+    """Importa as classes principais do SAP no primeiro acesso."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
     
-    SAPConnectionError = SAPError
-    SAPAuthenticationError = SAPError
-    SAPMetadataError = SAPError
-    SAPRFCError = SAPError
-    SAPHTTPError = SAPError
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except ImportError as e:
+        # Se algum módulo não existe, define uma versão básica
+        warnings.warn(f"Alguns módulos SAP não puderam ser carregados: {e}")
+        value = _unavailable(name, str(e))
     
-    __all__ = [
-        "SAPConnection",
-        "MetadataAnalyzer", 
-        "SAPAuthenticator",
-        "SAPConnectionError",
-        "SAPAuthenticationError",
-        "SAPMetadataError",
-        "SAPRFCError",
-        "SAPHTTPError",
-    ]
+    globals()[name] = value
+    return value
+
 
-__version__ = "1.0.0"
\ No newline at end of file
+def __dir__():
+    """Lista os nomes exportados, incluindo os carregados sob demanda."""
+    return sorted(set(globals()) | set(__all__))
@@ -5,50 +5,145 @@
 Sistema de autenticação para SAP.
 """
 
-import os
 import base64
+import functools
 from typing import Dict, Optional, Tuple
 from cryptography.fernet import Fernet
 
 from abapify.sap.exceptions import SAPAuthenticationError
 from abapify.sap.models import SAPConnectionConfig
-from abapify.utils.config import get_config_value
+from abapify.utils.config import get_config_section, get_config_value
 from abapify.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+# Início de todo token Fernet (byte de versão 0x80 em base64)
+_FERNET_PREFIX = b"gA"
+
+# Campos obrigatórios por tipo de conexão
+_REQUIRED_FIELDS = {
+    "RFC": ('ashost', 'sysnr', 'client', 'user', 'passwd'),
+    "HTTP": ('base_url', 'user', 'passwd'),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_or_create_encryption_key() -> bytes:
+    """
+    Obtém ou cria chave de criptografia.
+
+    O resultado é memoizado: a chave é lida (ou gerada) uma única vez por
+    processo.
+
+    Returns:
+        Chave de criptografia.
+    """
+    key_env = get_config_value("SAP_ENCRYPTION_KEY")
+    
+    if key_env:
+        try:
+            return base64.urlsafe_b64decode(key_env.encode())
+        except Exception:
+            logger.warning("Chave de criptografia inválida, gerando nova")
+    
+    # Gera nova chave
+    key = Fernet.generate_key()
+    key_b64 = base64.urlsafe_b64encode(key).decode()
+    
+    logger.info("Nova chave de criptografia gerada. Adicione ao .env:")
+    logger.info("SAP_ENCRYPTION_KEY=%s", key_b64)
+    
+    return key
+
+
+@functools.lru_cache(maxsize=1)
+def _get_cipher() -> Fernet:
+    """
+    Retorna o Fernet compartilhado por todos os autenticadores.
+
+    Returns:
+        Fernet: Cifra construída com a chave de criptografia do processo.
+    """
+    return Fernet(_get_or_create_encryption_key())
+
+
+def _decrypt(encrypted_password: str) -> str:
+    """
+    Descriptografa uma senha com a cifra compartilhada.
+
+    Args:
+        encrypted_password: Token Fernet, ou no formato antigo, codificado
+            novamente em base64.
+
+    Returns:
+        Senha em texto claro.
+    """
+    token = encrypted_password.encode("ascii")
+    if not token.startswith(_FERNET_PREFIX):
+        # Formato antigo: token Fernet codificado novamente em base64
+        token = base64.urlsafe_b64decode(token)
+    return _get_cipher().decrypt(token).decode()
+
+
+@functools.lru_cache(maxsize=8)
+def _build_connection_config(settings: Tuple[Tuple[str, str], ...]) -> SAPConnectionConfig:
+    """
+    Monta a configuração de conexão a partir das configurações de um ambiente.
+
+    O resultado é memoizado pelas próprias configurações: enquanto as
+    variáveis SAP_<ENV>_* não mudam, a senha não é descriptografada de novo
+    e o modelo não é revalidado.
+
+    Args:
+        settings: Pares (chave sem prefixo, valor) das configurações do ambiente.
+
+    Returns:
+        Configuração de conexão.
+    """
+    raw = dict(settings)
+    
+    config_data = {
+        key: raw.get(key)
+        for key in (
+            # RFC parameters
+            'ashost', 'sysnr', 'client', 'user',
+            'saprouter', 'mshost', 'msserv', 'group',
+            # HTTP parameters
+            'base_url',
+        )
+    }
+    config_data['use_ssl'] = raw.get('use_ssl', "true").lower() == "true"
+    config_data['verify_ssl'] = raw.get('verify_ssl', "true").lower() == "true"
+    
+    # Common parameters
+    config_data['language'] = raw.get('language', "EN")
+    config_data['connection_type'] = raw.get('connection_type', "RFC")
+    config_data['timeout'] = int(raw.get('timeout', "30"))
+    
+    # Senha criptografada
+    encrypted_password = raw.get('passwd_encrypted')
+    if encrypted_password:
+        try:
+            config_data['passwd'] = _decrypt(encrypted_password)
+        except Exception:
+            logger.error("Erro ao descriptografar senha SAP")
+            config_data['passwd'] = None
+    else:
+        config_data['passwd'] = raw.get('passwd')
+    
+    # Remove valores None
+    config_data = {k: v for k, v in config_data.items() if v is not None}
+    
+    return SAPConnectionConfig(**config_data)
+
+
 class SAPAuthenticator:
     """Gerenciador de autenticação SAP."""
     
     def __init__(self):
         """Inicializa o autenticador."""
-        self._encryption_key = self._get_or_create_encryption_key()
-        self._cipher_suite = Fernet(self._encryption_key)
-    
-    def _get_or_create_encryption_key(self) -> bytes:
-        """
-        Obtém ou cria chave de criptografia.
-        
-        Returns:
-            Chave de criptografia.
-        """
-        key_env = get_config_value("SAP_ENCRYPTION_KEY")
-        
-        if key_env:
-            try:
-                return base64.urlsafe_b64decode(key_env.encode())
-            except Exception:
-                logger.warning("Chave de criptografia inválida, gerando nova")
-        
-        # Gera nova chave
-        key = Fernet.generate_key()
-        key_b64 = base64.urlsafe_b64encode(key).decode()
-        
-        logger.info("Nova chave de criptografia gerada. Adicione ao .env:")
-        logger.info(f"SAP_ENCRYPTION_KEY={key_b64}")
-        
-        return key
+        self._cipher_suite = _get_cipher()
    
     def encrypt_password(self, password: str) -> str:
         """
@@ -58,13 +153,12 @@ class SAPAuthenticator:
             password: Senha em texto claro.
             
         Returns:
-            Senha criptografada em base64.
+            Senha criptografada (token Fernet).
         """
         try:
-            encrypted = self._cipher_suite.encrypt(password.encode())
-            return base64.urlsafe_b64encode(encrypted).decode()
+            return self._cipher_suite.encrypt(password.encode()).decode("ascii")
         except Exception as e:
-            logger.error(f"Erro ao criptografar senha: {str(e)}")
+            logger.error("Erro ao criptografar senha: %s", e)
             raise SAPAuthenticationError("Erro ao criptografar senha")
     
     def decrypt_password(self, encrypted_password: str) -> str:
@@ -72,17 +166,16 @@ class SAPAuthenticator:
         Descriptografa senha.
         
         Args:
-            encrypted_password: Senha criptografada em base64.
+            encrypted_password: Senha criptografada (token Fernet, ou no
+                formato antigo, codificado novamente em base64).
             
         Returns:
             Senha em texto claro.
         """
         try:
-            encrypted_bytes = base64.urlsafe_b64decode(encrypted_password.encode())
-            decrypted = self._cipher_suite.decrypt(encrypted_bytes)
-            return decrypted.decode()
+            return _decrypt(encrypted_password)
         except Exception as e:
-            logger.error(f"Erro ao descriptografar senha: {str(e)}")
+            logger.error("Erro ao descriptografar senha: %s", e)
             raise SAPAuthenticationError("Erro ao descriptografar senha")
     
     def validate_credentials(self, config: SAPConnectionConfig) -> bool:
@@ -95,16 +188,9 @@ class SAPAuthenticator:
         Returns:
             True se credenciais são válidas.
         """
-        required_fields = []
-        
-        if config.connection_type == "RFC":
-            required_fields = ['ashost', 'sysnr', 'client', 'user', 'passwd']
-        elif config.connection_type == "HTTP":
-            required_fields = ['base_url', 'user', 'passwd']
-        
-        for field in required_fields:
+        for field in _REQUIRED_FIELDS.get(config.connection_type, ()):
             if not getattr(config, field, None):
-                logger.error(f"Campo obrigatório ausente: {field}")
+                logger.error("Campo obrigatório ausente: %s", field)
                 return False
         
         return True
@@ -119,46 +205,11 @@ class SAPAuthenticator:
         Returns:
             Configuração de conexão.
         """
-        env_prefix = f"SAP_{environment}_"
-        
-        # Obtém configurações do ambiente
-        config_data = {}
-        
-        # RFC parameters
-        config_data['ashost'] = get_config_value(f"{env_prefix}ASHOST")
-        config_data['sysnr'] = get_config_value(f"{env_prefix}SYSNR")
-        config_data['client'] = get_config_value(f"{env_prefix}CLIENT")
-        config_data['user'] = get_config_value(f"{env_prefix}USER")
-        config_data['saprouter'] = get_config_value(f"{env_prefix}SAPROUTER")
-        config_data['mshost'] = get_config_value(f"{env_prefix}MSHOST")
-        config_data['msserv'] = get_config_value(f"{env_prefix}MSSERV")
-        config_data['group'] = get_config_value(f"{env_prefix}GROUP")
-        
-        # HTTP parameters
-        config_data['base_url'] = get_config_value(f"{env_prefix}BASE_URL")
-        config_data['use_ssl'] = get_config_value(f"{env_prefix}USE_SSL", "true").lower() == "true"
-        config_data['verify_ssl'] = get_config_value(f"{env_prefix}VERIFY_SSL", "true").lower() == "true"
-        
-        # Common parameters
-        config_data['language'] = get_config_value(f"{env_prefix}LANGUAGE", "EN")
-        config_data['connection_type'] = get_config_value(f"{env_prefix}CONNECTION_TYPE", "RFC")
-        config_data['timeout'] = int(get_config_value(f"{env_prefix}TIMEOUT", "30"))
-        
-        # Senha criptografada
-        encrypted_password = get_config_value(f"{env_prefix}PASSWD_ENCRYPTED")
-        if encrypted_password:
-            try:
-                config_data['passwd'] = self.decrypt_password(encrypted_password)
-            except Exception:
-                logger.error("Erro ao descriptografar senha SAP")
-                config_data['passwd'] = None
-        else:
-            config_data['passwd'] = get_config_value(f"{env_prefix}PASSWD")
-        
-        # Remove valores None
-        config_data = {k: v for k, v in config_data.items() if v is not None}
+        # Lê todas as configurações do ambiente em uma única varredura
+        settings = get_config_section(f"SAP_{environment}_")
         
-        return SAPConnectionConfig(**config_data)
+        # Cópia, para que alterações do chamador não afetem o valor memoizado
+        return _build_connection_config(tuple(sorted(settings.items()))).model_copy()
     
     def save_encrypted_password(self, environment: str, password: str) -> str:
         """
@@ -3,25 +3,47 @@
 
 """
 Clientes de conectividade SAP.
+
+Cada cliente é importado apenas no primeiro acesso (PEP 562), de modo que
+usar o RFC não carrega requests e usar o HTTP não carrega pyrfc.
 """
 
-try:
-    from .rfc_client import RFCClient
-    from .http_client import HTTPClient
-    
-    __all__ = ["RFCClient", "HTTPClient"]
-    
-except ImportError as e:
-    import warnings
-    warnings.warn(f"Clientes SAP não puderam ser carregados: {e}")
+import importlib
+import warnings
+
+# Clientes carregados sob demanda: nome -> submódulo que o define
+_LAZY_EXPORTS = {
+    "RFCClient": ".rfc_client",
+    "HTTPClient": ".http_client",
+}
+
+__all__ = ["RFCClient", "HTTPClient"]
+
+
+def _unavailable(name: str, reason: str) -> type:
+    """Cria uma classe substituta que falha ao ser instanciada."""
+    def __init__(self, *args, **kwargs):
+        raise ImportError(f"Cliente {name} não disponível: {reason}")
     
-    # Classes básicas para evitar erros
-    class RFCClient:
-        def __init__(self, *args, **kwargs):
-            raise ImportError("Cliente RFC não disponível")
+    return type(name, (), {"__init__": __init__})
+
+
+def __getattr__(name: str):
+    """Importa os clientes SAP no primeiro acesso."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
     
-    class HTTPClient:
-        def __init__(self, *args, **kwargs):
-            raise ImportError("Cliente HTTP não disponível")
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except ImportError as e:
+        warnings.warn(f"Clientes SAP não puderam ser carregados: {e}")
+        value = _unavailable(name, str(e))
     
-    __all__ = ["RFCClient", "HTTPClient"]
\ No newline at end of file
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Lista os nomes exportados, incluindo os carregados sob demanda."""
+    return sorted(set(globals()) | set(__all__))
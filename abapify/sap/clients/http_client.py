@@ -7,7 +7,10 @@ Cliente HTTP para APIs SAP (OData, REST, etc.).
 
 import json
 import base64
-from typing import Dict, List, Any, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple, Union
 from urllib.parse import urljoin
 
 import requests
@@ -15,12 +18,117 @@ from requests.auth import HTTPBasicAuth
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:  # orjson é opcional; sem ele usa-se o parser json padrão
+    orjson = None
+
 from abapify.sap.exceptions import SAPHTTPError, SAPConnectionError, SAPAuthenticationError
 from abapify.sap.models import SAPConnectionConfig
 from abapify.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Estratégia de retry e adaptador compartilhados por todas as sessões. O pool
+# mantém até 64 conexões keep-alive por host e não bloqueia quando cheio.
+_RETRY = Retry(
+    total=3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    backoff_factor=1
+)
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=_RETRY)
+
+# Headers padrão das sessões (somente leitura, compartilhado entre clientes)
+_DEFAULT_HEADERS = MappingProxyType({
+    'Content-Type': 'application/json',
+    'Accept': 'application/json',
+    'User-Agent': 'ABAPify-SAP-Client/1.0'
+})
+
+# Quantidade máxima de bytes do corpo incluídos nas mensagens de erro HTTP
+_ERROR_BODY_LIMIT = 2048
+
+
+@lru_cache(maxsize=512)
+def _join(base_url: str, endpoint: str) -> str:
+    """
+    Monta a URL completa de um endpoint.
+
+    O resultado é memoizado, já que os mesmos endpoints (inclusive os de
+    $metadata de cada serviço) são requisitados repetidamente.
+
+    Args:
+        base_url: URL base do servidor SAP.
+        endpoint: Endpoint da API.
+
+    Returns:
+        str: URL completa.
+    """
+    return urljoin(base_url, endpoint)
+
+
+def _raise_http_error(response: requests.Response, endpoint: str) -> None:
+    """
+    Levanta o erro correspondente a uma resposta HTTP de erro.
+
+    Apenas o início do corpo é decodificado e incluído na mensagem, já que
+    as falhas OData do SAP podem trazer documentos XML extensos.
+
+    Args:
+        response: Resposta HTTP com status >= 400.
+        endpoint: Endpoint requisitado.
+
+    Raises:
+        SAPHTTPError: Sempre.
+    """
+    body = response.content[:_ERROR_BODY_LIMIT].decode(response.encoding or "utf-8", errors="replace")
+    raise SAPHTTPError(
+        f"Erro HTTP {response.status_code}: {body}",
+        status_code=response.status_code,
+        endpoint=endpoint
+    )
+
+
+def _raise_authentication_error(response: requests.Response, endpoint: str) -> None:
+    """
+    Levanta o erro de autenticação de uma resposta 401.
+
+    Args:
+        response: Resposta HTTP com status 401.
+        endpoint: Endpoint requisitado.
+
+    Raises:
+        SAPAuthenticationError: Sempre.
+    """
+    raise SAPAuthenticationError("Falha na autenticação HTTP")
+
+
+# Tratadores de status com erro específico; os demais usam _raise_http_error
+_STATUS_HANDLERS = {
+    401: _raise_authentication_error,
+}
+
+
+def _parse_json(response: requests.Response) -> Dict[str, Any]:
+    """
+    Interpreta o corpo de uma resposta como JSON.
+
+    Com orjson instalado, os bytes do corpo são interpretados diretamente,
+    sem decodificá-los antes para texto.
+
+    Args:
+        response: Resposta HTTP.
+
+    Returns:
+        Dict[str, Any]: Corpo interpretado ou {'content': texto} se não for JSON.
+    """
+    try:
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+    except json.JSONDecodeError:
+        return {'content': response.text}
+
 
 class HTTPClient:
     """Cliente HTTP para APIs SAP."""
@@ -35,22 +143,12 @@ class HTTPClient:
         self.config = config
         self.session = requests.Session()
         
-        # Configuração de retry
-        retry_strategy = Retry(
-            total=3,
-            status_forcelist=[429, 500, 502, 503, 504],
-            backoff_factor=1
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # Retry e pool de conexões compartilhados entre os clientes
+        self.session.mount("http://", _ADAPTER)
+        self.session.mount("https://", _ADAPTER)
         
         # Headers padrão
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-            'User-Agent': 'ABAPify-SAP-Client/1.0'
-        })
+        self.session.headers.update(_DEFAULT_HEADERS)
         
         # Configuração SSL
         self.session.verify = config.verify_ssl
@@ -61,6 +159,9 @@ class HTTPClient:
         # Base URL
         self.base_url = config.base_url or ""
         
+        # Metadados OData por serviço: (ETag, metadados interpretados)
+        self._metadata_cache: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        
     def authenticate(self, username: str, password: str) -> None:
         """
         Configura autenticação básica.
@@ -70,7 +171,7 @@ class HTTPClient:
             password: Senha.
         """
         self.session.auth = HTTPBasicAuth(username, password)
-        logger.info(f"Autenticação HTTP configurada para usuário: {username}")
+        logger.info("Autenticação HTTP configurada para usuário: %s", username)
     
     def authenticate_oauth(self, token: str) -> None:
         """
@@ -99,10 +200,10 @@ class HTTPClient:
         Raises:
             SAPHTTPError: Se falhar na requisição.
         """
-        url = urljoin(self.base_url, endpoint)
+        url = _join(self.base_url, endpoint)
         
         try:
-            logger.debug(f"Fazendo requisição {method} para: {url}")
+            logger.debug("Fazendo requisição %s para: %s", method, url)
             
             response = self.session.request(
                 method=method,
@@ -111,17 +212,11 @@ class HTTPClient:
                 **kwargs
             )
             
-            logger.debug(f"Resposta recebida: {response.status_code}")
+            logger.debug("Resposta recebida: %s", response.status_code)
             
             # Verifica erros HTTP
-            if response.status_code == 401:
-                raise SAPAuthenticationError("Falha na autenticação HTTP")
-            elif response.status_code >= 400:
-                raise SAPHTTPError(
-                    f"Erro HTTP {response.status_code}: {response.text}",
-                    status_code=response.status_code,
-                    endpoint=endpoint
-                )
+            if response.status_code >= 400:
+                _STATUS_HANDLERS.get(response.status_code, _raise_http_error)(response, endpoint)
             
             return response
             
@@ -144,11 +239,27 @@ class HTTPClient:
             Resposta em formato JSON.
         """
         response = self._make_request('GET', endpoint, params=params)
+        return _parse_json(response)
+    
+    def get_many(self, endpoints: List[str], max_workers: int = 16) -> List[Dict[str, Any]]:
+        """
+        Faz várias requisições GET simultaneamente.
         
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            return {'content': response.text}
+        As requisições compartilham a sessão (e o pool de conexões) do
+        cliente. Se alguma falhar, a exceção é propagada.
+        
+        Args:
+            endpoints: Endpoints da API.
+            max_workers: Número máximo de requisições simultâneas.
+            
+        Returns:
+            Respostas em formato JSON, na mesma ordem dos endpoints.
+        """
+        if not endpoints:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(endpoints))) as executor:
+            return list(executor.map(self.get, endpoints))
     
     def post(self, endpoint: str, data: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -162,11 +273,7 @@ class HTTPClient:
             Resposta em formato JSON.
         """
         response = self._make_request('POST', endpoint, json=data)
-        
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            return {'content': response.text}
+        return _parse_json(response)
     
     def put(self, endpoint: str, data: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -180,11 +287,7 @@ class HTTPClient:
             Resposta em formato JSON.
         """
         response = self._make_request('PUT', endpoint, json=data)
-        
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            return {'content': response.text}
+        return _parse_json(response)
     
     def delete(self, endpoint: str) -> Dict[str, Any]:
         """
@@ -197,16 +300,16 @@ class HTTPClient:
             Resposta em formato JSON.
         """
         response = self._make_request('DELETE', endpoint)
-        
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            return {'content': response.text}
+        return _parse_json(response)
     
     def get_metadata(self, service_name: str) -> Dict[str, Any]:
         """
         Obtém metadados de um serviço OData.
         
+        Os metadados interpretados são guardados com o ETag devolvido pelo
+        servidor; nas chamadas seguintes a requisição é condicional
+        (If-None-Match) e uma resposta 304 reaproveita o valor guardado.
+        
         Args:
             service_name: Nome do serviço OData.
             
@@ -214,18 +317,30 @@ class HTTPClient:
             Metadados do serviço.
         """
         endpoint = f"/sap/opu/odata/sap/{service_name}/$metadata"
+        cached = self._metadata_cache.get(service_name)
         
         # Para metadados, aceita XML
         headers = {'Accept': 'application/xml'}
+        if cached:
+            headers['If-None-Match'] = cached[0]
         response = self._make_request('GET', endpoint, headers=headers)
         
+        if cached and response.status_code == 304:
+            logger.debug("Metadados de %s não mudaram (ETag)", service_name)
+            return cached[1]
+        
         # Converte XML para dict se necessário
         try:
             import xmltodict
-            return xmltodict.parse(response.text)
+            metadata = xmltodict.parse(response.content)
         except ImportError:
             logger.warning("xmltodict não disponível, retornando XML como texto")
-            return {'content': response.text}
+            metadata = {'content': response.text}
+        
+        etag = response.headers.get('ETag')
+        if etag:
+            self._metadata_cache[service_name] = (etag, metadata)
+        return metadata
     
     def test_connection(self) -> bool:
         """
@@ -239,5 +354,5 @@ class HTTPClient:
             self.get('/sap/bc/ping')
             return True
         except Exception as e:
-            logger.debug(f"Teste de conexão HTTP falhou: {str(e)}")
+            logger.debug("Teste de conexão HTTP falhou: %s", e)
             return False
\ No newline at end of file
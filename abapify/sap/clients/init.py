@@ -1,11 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-Clientes de conectividade SAP.
-"""
-
-from .rfc_client import RFCClient
-from .http_client import HTTPClient
-
-__all__ = ["RFCClient", "HTTPClient"]
\ No newline at end of file
@@ -7,8 +7,11 @@ NOTA: PyRFC foi descontinuado. Esta implementação usa simulação/fallback par
 """
 
 import os
+import threading
+import time
 import warnings
-from typing import Dict, List, Any, Optional, Union
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple, Union
 from contextlib import contextmanager
 
 from abapify.sap.exceptions import SAPRFCError, SAPConnectionError, SAPAuthenticationError
@@ -23,6 +26,10 @@ PYRFC_AVAILABLE = False
 class RFCClient:
     """Cliente RFC para comunicação com SAP (Fallback para HTTP quando PyRFC não disponível)."""
     
+    # Estruturas de tabela (DDIF_TABL_GET) mantidas em memória
+    STRUCT_CACHE_SIZE = 512
+    STRUCT_CACHE_TTL = 300.0
+    
     def __init__(self, config: SAPConnectionConfig):
         """
         Inicializa o cliente RFC.
@@ -42,6 +49,16 @@ class RFCClient:
         self._connection: Optional[Any] = None
         self._http_fallback = None
         
+        # Contextos de conexão ativos; a conexão é compartilhada entre threads
+        # e só é encerrada quando o último contexto termina
+        self._context_lock = threading.Lock()
+        self._context_users = 0
+        
+        # Estruturas já obtidas: (tabela, idioma) -> (instante, resultado),
+        # da menos para a mais recentemente usada
+        self._struct_cache: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._struct_cache_lock = threading.Lock()
+        
         # Se não tem PyRFC, prepara fallback HTTP
         if not PYRFC_AVAILABLE and config.base_url:
             from .http_client import HTTPClient
@@ -130,15 +147,24 @@ class RFCClient:
         """
         Context manager para conexão RFC.
         
+        Contextos aninhados ou simultâneos (em várias threads) reaproveitam a
+        mesma conexão, encerrada quando o último deles termina.
+        
         Yields:
             RFCClient: Cliente RFC conectado.
         """
+        with self._context_lock:
+            self._context_users += 1
         try:
-            if not self._connection:
-                self.connect()
+            with self._context_lock:
+                if not self._connection:
+                    self.connect()
             yield self
         finally:
-            self.disconnect()
+            with self._context_lock:
+                self._context_users -= 1
+                if not self._context_users:
+                    self.disconnect()
     
     def call_function(self, function_name: str, **kwargs) -> Dict[str, Any]:
         """
@@ -340,12 +366,24 @@ class RFCClient:
         """
         Obtém estrutura de uma tabela SAP.
         
+        As estruturas ficam em cache por STRUCT_CACHE_TTL segundos (até
+        STRUCT_CACHE_SIZE tabelas); use invalidate() para descartá-las antes.
+        
         Args:
             table_name: Nome da tabela.
             
         Returns:
             Dict com estrutura da tabela.
         """
+        key = (table_name, self.config.language)
+        now = time.monotonic()
+        
+        with self._struct_cache_lock:
+            cached = self._struct_cache.get(key)
+            if cached and now - cached[0] < self.STRUCT_CACHE_TTL:
+                self._struct_cache.move_to_end(key)
+                return cached[1]
+        
         try:
             # RFC para obter estrutura de tabela
             result = self.call_function(
@@ -355,11 +393,32 @@ class RFCClient:
                 LANGU=self.config.language
             )
             
-            return result
-            
         except Exception as e:
             logger.error(f"Erro ao obter estrutura da tabela {table_name}: {str(e)}")
             raise SAPRFCError(f"Erro ao obter estrutura da tabela {table_name}: {str(e)}")
+        
+        with self._struct_cache_lock:
+            self._struct_cache[key] = (now, result)
+            self._struct_cache.move_to_end(key)
+            if len(self._struct_cache) > self.STRUCT_CACHE_SIZE:
+                self._struct_cache.popitem(last=False)
+        
+        return result
+    
+    def invalidate(self, table_name: Optional[str] = None) -> None:
+        """
+        Descarta estruturas de tabela em cache.
+        
+        Args:
+            table_name: Tabela a descartar (em todos os idiomas); se omitida,
+                descarta todo o cache.
+        """
+        with self._struct_cache_lock:
+            if table_name is None:
+                self._struct_cache.clear()
+                return
+            for key in [key for key in self._struct_cache if key[0] == table_name]:
+                del self._struct_cache[key]
     
     def search_objects(self, object_name_pattern: str, object_type: str = "*") -> List[Dict[str, Any]]:
         """
@@ -54,42 +54,65 @@ class SAPConnection:
             if self.config.user and self.config.passwd:
                 self.http_client.authenticate(self.config.user, self.config.passwd)
     
-    def test_connection(self) -> Dict[str, bool]:
+    def test_connection(self, parallel: bool = False) -> Dict[str, bool]:
         """
         Testa conectividade SAP.
         
+        Args:
+            parallel: Testa RFC e HTTP simultaneamente (clientes independentes).
+        
         Returns:
-            Dict com status de cada tipo de conexão.
+            Dict com status de cada tipo de conexão (vazio se nenhum estiver configurado).
         """
+        tests = {}
+        if self.rfc_client:
+            tests['rfc'] = self._test_rfc
+        if self.http_client:
+            tests['http'] = self._test_http
+        
+        if not tests:
+            return {}
+        
         results = {
             'rfc': False,
             'http': False
         }
         
-        # Teste RFC
-        if self.rfc_client:
-            try:
-                with self.rfc_client.connection_context():
-                    results['rfc'] = self.rfc_client.is_connected()
-                logger.info("Teste de conexão RFC: sucesso")
-            except Exception as e:
-                logger.error(f"Teste de conexão RFC falhou: {str(e)}")
-                results['rfc'] = False
-        
-        # Teste HTTP
-        if self.http_client:
-            try:
-                results['http'] = self.http_client.test_connection()
-                if results['http']:
-                    logger.info("Teste de conexão HTTP: sucesso")
-                else:
-                    logger.warning("Teste de conexão HTTP: falhou")
-            except Exception as e:
-                logger.error(f"Teste de conexão HTTP falhou: {str(e)}")
-                results['http'] = False
+        if parallel and len(tests) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            
+            with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+                futures = {conn_type: executor.submit(test) for conn_type, test in tests.items()}
+                results.update({conn_type: future.result() for conn_type, future in futures.items()})
+        else:
+            results.update({conn_type: test() for conn_type, test in tests.items()})
         
         return results
     
+    def _test_rfc(self) -> bool:
+        """Testa a conexão RFC."""
+        try:
+            with self.rfc_client.connection_context():
+                status = self.rfc_client.is_connected()
+            logger.info("Teste de conexão RFC: sucesso")
+            return status
+        except Exception as e:
+            logger.error(f"Teste de conexão RFC falhou: {str(e)}")
+            return False
+    
+    def _test_http(self) -> bool:
+        """Testa a conexão HTTP."""
+        try:
+            status = self.http_client.test_connection()
+            if status:
+                logger.info("Teste de conexão HTTP: sucesso")
+            else:
+                logger.warning("Teste de conexão HTTP: falhou")
+            return status
+        except Exception as e:
+            logger.error(f"Teste de conexão HTTP falhou: {str(e)}")
+            return False
+    
     @contextmanager
     def rfc_connection(self):
         """
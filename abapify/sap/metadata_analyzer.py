@@ -6,6 +6,8 @@ Analisador de metadados SAP.
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Set, Tuple
 
@@ -110,27 +112,42 @@ class MetadataAnalyzer:
             logger.error(f"Erro ao analisar tabela {table_name}: {str(e)}")
             raise SAPMetadataError(f"Erro ao analisar tabela {table_name}: {str(e)}")
     
-    def analyze_multiple_tables(self, table_names: List[str]) -> List[SAPTable]:
+    def analyze_multiple_tables(self, table_names: List[str], max_workers: int = 8) -> List[SAPTable]:
         """
         Analisa múltiplas tabelas.
         
+        As tabelas são analisadas em paralelo sobre uma única conexão RFC,
+        mantida aberta durante todo o lote; a ordem da lista é preservada.
+        
         Args:
             table_names: Lista de nomes de tabelas.
+            max_workers: Número máximo de análises simultâneas.
             
         Returns:
             Lista de tabelas analisadas.
         """
-        tables = []
-        for table_name in table_names:
-            try:
-                table = self.analyze_table(table_name)
-                tables.append(table)
-            except SAPTableNotFoundError:
-                logger.warning(f"Tabela {table_name} não encontrada, ignorando")
-            except Exception as e:
-                logger.error(f"Erro ao analisar tabela {table_name}: {str(e)}")
+        if not table_names:
+            return []
+        
+        session = self.connection.rfc_connection() if self.connection.rfc_client else nullcontext()
+        try:
+            with session, ThreadPoolExecutor(max_workers=min(max_workers, len(table_names))) as executor:
+                results = list(executor.map(self._try_analyze_table, table_names))
+        except Exception as e:
+            logger.error(f"Erro ao analisar tabelas: {str(e)}")
+            return []
         
-        return tables
+        return [table for table in results if table is not None]
+    
+    def _try_analyze_table(self, table_name: str) -> Optional[SAPTable]:
+        """Analisa uma tabela, registrando a falha em vez de propagá-la."""
+        try:
+            return self.analyze_table(table_name)
+        except SAPTableNotFoundError:
+            logger.warning(f"Tabela {table_name} não encontrada, ignorando")
+        except Exception as e:
+            logger.error(f"Erro ao analisar tabela {table_name}: {str(e)}")
+        return None
     
     def _analyze_table_relationships(self, table_name: str) -> List[SAPRelationship]:
         """
@@ -217,16 +234,22 @@ class MetadataAnalyzer:
         
         return list(related_tables)
     
-    def search_custom_tables(self, name_pattern: str = "Z*") -> List[str]:
+    def search_custom_tables(self, name_pattern: str = "Z*", limit: Optional[int] = None) -> List[str]:
         """
         Busca tabelas customizadas.
         
         Args:
             name_pattern: Padrão do nome.
+            limit: Número máximo de tabelas retornadas pelo SAP (padrão: 1000).
+                Valores menores que 1 não consultam o SAP, pois o
+                RFC_READ_TABLE trata ROWCOUNT=0 como "sem limite".
             
         Returns:
             Lista de nomes de tabelas customizadas.
         """
+        if limit is not None and limit < 1:
+            return []
+        
         try:
             with self.connection.rfc_connection() as rfc:
                 # Busca tabelas por padrão
@@ -242,7 +265,7 @@ class MetadataAnalyzer:
                         {'TEXT': "AND TABCLASS = 'TRANSP'"},
                         {'TEXT': "AND AS4LOCAL = 'A'"}
                     ],
-                    ROWCOUNT=1000
+                    ROWCOUNT=1000 if limit is None else limit
                 )
                 
                 tables = []
@@ -355,22 +378,28 @@ class MetadataAnalyzer:
         """
         logger.info(f"Iniciando análise completa de {len(table_names)} tabelas")
         
-        # Analisa tabelas
-        tables = self.analyze_multiple_tables(table_names)
-        
-        # Coleta todos os relacionamentos
-        all_relationships = []
-        for table in tables:
-            relationships = self._analyze_table_relationships(table.name)
-            all_relationships.extend(relationships)
-        
-        # Analisa objetos customizados se solicitado
-        custom_objects = []
-        patterns = {}
-        
-        if include_custom_objects:
-            custom_objects = self.analyze_custom_objects()
-            patterns = self.detect_naming_patterns(custom_objects)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Busca objetos customizados em paralelo com a análise das tabelas
+            custom_objects_future = (
+                executor.submit(self.analyze_custom_objects) if include_custom_objects else None
+            )
+            
+            # Analisa tabelas
+            tables = self.analyze_multiple_tables(table_names)
+            
+            # Coleta todos os relacionamentos
+            all_relationships = []
+            for table in tables:
+                relationships = self._analyze_table_relationships(table.name)
+                all_relationships.extend(relationships)
+            
+            # Analisa objetos customizados se solicitado
+            custom_objects = []
+            patterns = {}
+            
+            if custom_objects_future is not None:
+                custom_objects = custom_objects_future.result()
+                patterns = self.detect_naming_patterns(custom_objects)
         
         # Cria resultado
         result = SAPAnalysisResult(
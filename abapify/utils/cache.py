@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Cache em disco para respostas dos modelos de linguagem e análises SAP.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+from hashlib import blake2b
+from pathlib import Path
+from typing import Optional
+
+from abapify.utils.config import get_config_value
+from abapify.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def get_cache_dir() -> Path:
+    """
+    Obtém o diretório base do cache.
+
+    Usa ABAPIFY_CACHE_DIR se definido, caso contrário ~/.cache/abapify.
+
+    Returns:
+        Path: Diretório do cache.
+    """
+    cache_dir = get_config_value("ABAPIFY_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+    return Path.home() / ".cache" / "abapify"
+
+
+def _write_atomic(path: Path, data: str) -> None:
+    """Grava o arquivo de forma atômica (arquivo temporário + rename)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def cache_key(*parts) -> str:
+    """
+    Calcula a chave de cache de um conjunto de valores serializáveis em JSON.
+
+    Args:
+        *parts: Valores que identificam a entrada.
+
+    Returns:
+        str: Hash hexadecimal da combinação.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return blake2b(payload.encode("utf-8")).hexdigest()
+
+
+def read_cache_entry(
+    namespace: str, key: str, suffix: str = ".json", ttl: Optional[float] = None
+) -> Optional[str]:
+    """
+    Lê uma entrada do cache.
+
+    Args:
+        namespace: Subdiretório do cache.
+        key: Chave da entrada.
+        suffix: Extensão do arquivo.
+        ttl: Idade máxima da entrada em segundos (sem limite se None).
+
+    Returns:
+        Optional[str]: Conteúdo armazenado, ou None se ausente, expirado ou ilegível.
+    """
+    cache_file = get_cache_dir() / namespace / f"{key}{suffix}"
+    try:
+        if ttl is not None and time.time() - cache_file.stat().st_mtime > ttl:
+            return None
+        return cache_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Não foi possível ler o cache: {str(e)}")
+        return None
+
+
+def write_cache_entry(namespace: str, key: str, data: str, suffix: str = ".json") -> None:
+    """
+    Grava uma entrada do cache; falhas de gravação são apenas registradas.
+
+    Args:
+        namespace: Subdiretório do cache.
+        key: Chave da entrada.
+        data: Conteúdo a armazenar.
+        suffix: Extensão do arquivo.
+    """
+    try:
+        _write_atomic(get_cache_dir() / namespace / f"{key}{suffix}", data)
+    except OSError as e:
+        logger.warning(f"Não foi possível gravar o cache: {str(e)}")
+
+
+def clear_cache(namespace: Optional[str] = None) -> int:
+    """
+    Remove entradas do cache.
+
+    Args:
+        namespace: Subdiretório a limpar (todos se None).
+
+    Returns:
+        int: Número de arquivos removidos.
+    """
+    target = get_cache_dir()
+    if namespace:
+        target = target / namespace
+
+    if not target.exists():
+        return 0
+
+    removed = sum(1 for p in target.rglob("*") if p.is_file())
+    for entry in target.iterdir():
+        if entry.is_dir():
+            shutil.rmtree(entry)
+        else:
+            entry.unlink()
+    return removed
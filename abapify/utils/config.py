@@ -5,10 +5,15 @@
 Utilitário para configuração do sistema.
 """
 
+import functools
 import json
 import os
+import stat
+import sys
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Iterator, Optional, List
 
 import dotenv
 
@@ -17,6 +22,41 @@ from abapify.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Ambientes SAP suportados
+SAP_ENVIRONMENTS = ("DEV", "QAS", "PRD")
+
+# Provedores de IA suportados
+LLM_PROVIDERS = ("arcee", "groq", "openai", "vllm")
+
+# Aviso exibido quando nenhum provedor de IA está configurado
+MISSING_API_KEY_WARNING = (
+    "Nenhuma chave de API encontrada! Configure ARCEE_TOKEN, GROQ_API_KEY, OPENAI_API_KEY "
+    "ou VLLM_BASE_URL (com VLLM_MODEL)."
+)
+
+# Atualizações acumuladas enquanto um config_batch() está ativo
+_pending_updates: Optional[Dict[str, str]] = None
+
+
+@functools.lru_cache(maxsize=8)
+def _read_env_file(path: str, mtime_ns: int, size: int) -> Dict[str, Optional[str]]:
+    """
+    Lê e interpreta um arquivo .env.
+
+    O resultado é memoizado pela combinação de caminho, data de modificação
+    e tamanho, de modo que o arquivo só é reinterpretado quando muda.
+
+    Args:
+        path: Caminho absoluto do arquivo.
+        mtime_ns: Data de modificação do arquivo em nanossegundos.
+        size: Tamanho do arquivo em bytes.
+
+    Returns:
+        Dict[str, Optional[str]]: Valores definidos no arquivo.
+    """
+    logger.info(f"Carregando configurações do arquivo: {path}")
+    return dotenv.dotenv_values(path)
+
 
 def load_config() -> Dict[str, str]:
     """
@@ -31,19 +71,24 @@ def load_config() -> Dict[str, str]:
     try:
         # Tenta carregar o arquivo .env se existir
         env_path = Path(".") / ".env"
-        if env_path.exists():
-            logger.info(f"Carregando configurações do arquivo: {env_path}")
-            dotenv.load_dotenv(env_path)
+        try:
+            env_stat = env_path.stat()
+        except FileNotFoundError:
+            env_stat = None
+        if env_stat is not None:
+            values = _read_env_file(str(env_path.resolve()), env_stat.st_mtime_ns, env_stat.st_size)
+            for key, value in values.items():
+                if value is not None:
+                    os.environ.setdefault(key, value)
         
         # Verifica se pelo menos uma chave de API está disponível
         if not any([
             os.environ.get("ARCEE_TOKEN"),
             os.environ.get("GROQ_API_KEY"),
-            os.environ.get("OPENAI_API_KEY")
+            os.environ.get("OPENAI_API_KEY"),
+            os.environ.get("VLLM_BASE_URL")
         ]):
-            logger.warning(
-                "Nenhuma chave de API encontrada! Configure ARCEE_TOKEN, GROQ_API_KEY ou OPENAI_API_KEY."
-            )
+            logger.warning(MISSING_API_KEY_WARNING)
         
         # Retorna um dicionário com as configurações relevantes
         config = {
@@ -140,10 +185,77 @@ def get_config_value(key: str, default: Optional[str] = None) -> Optional[str]:
     return os.environ.get(key, default)
 
 
+def get_config_section(prefix: str) -> Dict[str, str]:
+    """
+    Obtém, em uma única varredura, todas as configurações com um prefixo.
+
+    Args:
+        prefix: Prefixo das chaves (ex.: "SAP_DEV_").
+
+    Returns:
+        Dict[str, str]: Valores indexados pela chave sem o prefixo, em minúsculas.
+    """
+    size = len(prefix)
+    return {
+        key[size:].lower(): value
+        for key, value in os.environ.items()
+        if key.startswith(prefix)
+    }
+
+
+@contextmanager
+def config_batch() -> Iterator[None]:
+    """
+    Agrupa as chamadas a save_config em uma única gravação do arquivo .env.
+
+    Dentro do bloco, save_config apenas acumula as atualizações em memória;
+    a gravação ocorre uma vez na saída do bloco. Blocos aninhados são
+    incorporados ao mais externo. Se o bloco terminar com exceção, as
+    atualizações acumuladas são descartadas.
+
+    Também pode ser usado como decorador: ``@config_batch()``.
+    """
+    global _pending_updates
+    
+    if _pending_updates is not None:
+        yield
+        return
+    
+    _pending_updates = {}
+    try:
+        yield
+        updates = _pending_updates
+    finally:
+        _pending_updates = None
+    
+    if updates:
+        _write_config(updates)
+
+
 def save_config(config: Dict[str, str]) -> None:
     """
     Salva configurações no arquivo .env.
 
+    Dentro de um config_batch(), as configurações são apenas acumuladas e
+    gravadas ao final do bloco.
+
+    Args:
+        config: Dicionário com as configurações a serem salvas.
+
+    Raises:
+        ConfigError: Se ocorrer um erro ao salvar as configurações.
+    """
+    if _pending_updates is not None:
+        _pending_updates.update(config)
+        return
+    
+    _write_config(config)
+
+
+def _write_config(config: Dict[str, str]) -> None:
+    """
+    Mescla as configurações ao arquivo .env e o substitui atomicamente.
+
     Args:
         config: Dicionário com as configurações a serem salvas.
 
@@ -153,9 +265,14 @@ def save_config(config: Dict[str, str]) -> None:
     try:
         env_path = Path(".") / ".env"
         
-        # Carrega configurações existentes
+        # Carrega configurações existentes sem interpretá-las, preservando
+        # aspas, comentários e referências ${VAR} exatamente como escritas
         existing_config = {}
-        if env_path.exists():
+        try:
+            env_stat = env_path.stat()
+        except FileNotFoundError:
+            env_stat = None
+        if env_stat is not None:
             with open(env_path, "r", encoding="utf-8") as f:
                 for line in f:
                     line = line.strip()
@@ -166,56 +283,72 @@ def save_config(config: Dict[str, str]) -> None:
         # Atualiza com novas configurações
         existing_config.update(config)
         
-        # Salva no arquivo
-        with open(env_path, "w", encoding="utf-8") as f:
-            f.write("# Configurações do ABAPify\n")
-            f.write("# =========================\n\n")
-            
-            # LLM Configuration
-            f.write("# LLM Configuration\n")
-            llm_keys = ["ARCEE_TOKEN", "GROQ_API_KEY", "OPENAI_API_KEY", "DEFAULT_PROVIDER", 
-                        "DEFAULT_MODEL_ARCEE", "DEFAULT_MODEL_GROQ", "DEFAULT_MODEL_OPENAI",
-                        "OUTPUT_DIR", "DEFAULT_TEMPERATURE", "DEFAULT_MAX_TOKENS"]
-            for key in llm_keys:
-                if key in existing_config:
-                    f.write(f"{key}={existing_config[key]}\n")
-            f.write("\n")
+        # Grava em um arquivo temporário e substitui o .env de uma só vez
+        fd, tmp_path = tempfile.mkstemp(dir=env_path.parent, prefix=".env.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("# Configurações do ABAPify\n")
+                f.write("# =========================\n\n")
             
-            # SAP Configuration
-            f.write("# SAP Configuration\n")
-            sap_general_keys = ["SAP_ENCRYPTION_KEY", "SAP_DEFAULT_ENVIRONMENT"]
-            for key in sap_general_keys:
-                if key in existing_config:
-                    f.write(f"{key}={existing_config[key]}\n")
-            f.write("\n")
+                # LLM Configuration
+                f.write("# LLM Configuration\n")
+                llm_keys = ["ARCEE_TOKEN", "GROQ_API_KEY", "OPENAI_API_KEY", "DEFAULT_PROVIDER", 
+                            "DEFAULT_MODEL_ARCEE", "DEFAULT_MODEL_GROQ", "DEFAULT_MODEL_OPENAI",
+                            "VLLM_BASE_URL", "VLLM_MODEL", "VLLM_API_KEY",
+                            "OUTPUT_DIR", "DEFAULT_TEMPERATURE", "DEFAULT_MAX_TOKENS"]
+                for key in llm_keys:
+                    if key in existing_config:
+                        f.write(f"{key}={existing_config[key]}\n")
+                f.write("\n")
             
-            # SAP Environments
-            for env in ["DEV", "QAS", "PRD"]:
-                f.write(f"# SAP {env} Environment\n")
-                env_keys = [
-                    f"SAP_{env}_ASHOST", f"SAP_{env}_SYSNR", f"SAP_{env}_CLIENT", 
-                    f"SAP_{env}_USER", f"SAP_{env}_PASSWD", f"SAP_{env}_PASSWD_ENCRYPTED",
-                    f"SAP_{env}_SAPROUTER", f"SAP_{env}_MSHOST", f"SAP_{env}_MSSERV", 
-                    f"SAP_{env}_GROUP", f"SAP_{env}_BASE_URL", f"SAP_{env}_USE_SSL",
-                    f"SAP_{env}_VERIFY_SSL", f"SAP_{env}_LANGUAGE", f"SAP_{env}_CONNECTION_TYPE",
-                    f"SAP_{env}_TIMEOUT"
-                ]
-                for key in env_keys:
+                # SAP Configuration
+                f.write("# SAP Configuration\n")
+                sap_general_keys = ["SAP_ENCRYPTION_KEY", "SAP_DEFAULT_ENVIRONMENT"]
+                for key in sap_general_keys:
                     if key in existing_config:
                         f.write(f"{key}={existing_config[key]}\n")
                 f.write("\n")
             
-            # Outras configurações
-            other_keys = set(existing_config.keys()) - set(llm_keys) - set(sap_general_keys)
-            for env in ["DEV", "QAS", "PRD"]:
-                env_keys = [k for k in existing_config.keys() if k.startswith(f"SAP_{env}_")]
-                other_keys -= set(env_keys)
+                # SAP Environments
+                for env in SAP_ENVIRONMENTS:
+                    f.write(f"# SAP {env} Environment\n")
+                    env_keys = [
+                        f"SAP_{env}_ASHOST", f"SAP_{env}_SYSNR", f"SAP_{env}_CLIENT", 
+                        f"SAP_{env}_USER", f"SAP_{env}_PASSWD", f"SAP_{env}_PASSWD_ENCRYPTED",
+                        f"SAP_{env}_SAPROUTER", f"SAP_{env}_MSHOST", f"SAP_{env}_MSSERV", 
+                        f"SAP_{env}_GROUP", f"SAP_{env}_BASE_URL", f"SAP_{env}_USE_SSL",
+                        f"SAP_{env}_VERIFY_SSL", f"SAP_{env}_LANGUAGE", f"SAP_{env}_CONNECTION_TYPE",
+                        f"SAP_{env}_TIMEOUT"
+                    ]
+                    for key in env_keys:
+                        if key in existing_config:
+                            f.write(f"{key}={existing_config[key]}\n")
+                    f.write("\n")
             
-            if other_keys:
-                f.write("# Other Configuration\n")
-                for key in sorted(other_keys):
-                    f.write(f"{key}={existing_config[key]}\n")
+                # Outras configurações
+                other_keys = set(existing_config.keys()) - set(llm_keys) - set(sap_general_keys)
+                for env in SAP_ENVIRONMENTS:
+                    env_keys = [k for k in existing_config.keys() if k.startswith(f"SAP_{env}_")]
+                    other_keys -= set(env_keys)
+            
+                if other_keys:
+                    f.write("# Other Configuration\n")
+                    for key in sorted(other_keys):
+                        f.write(f"{key}={existing_config[key]}\n")
+        
+            if env_stat is not None:
+                os.chmod(tmp_path, stat.S_IMODE(env_stat.st_mode))
+            os.replace(tmp_path, env_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
         
+        _read_env_file.cache_clear()
+        # Provedores LLM já criados guardam as credenciais antigas; o módulo
+        # só é consultado se já tiver sido importado
+        llm_client = sys.modules.get("abapify.llm.client")
+        if llm_client is not None:
+            llm_client.clear_provider_cache()
         logger.info(f"Configurações salvas em: {env_path}")
     except Exception as e:
         logger.error(f"Erro ao salvar configurações: {str(e)}")
@@ -254,7 +387,7 @@ def get_sap_environments() -> List[str]:
     """
     environments = []
     
-    for env in ["DEV", "QAS", "PRD"]:
+    for env in SAP_ENVIRONMENTS:
         # Verifica se tem configuração mínima para o ambiente
         ashost = get_config_value(f"SAP_{env}_ASHOST")
         if ashost:
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Acesso compartilhado ao console Rich.
+"""
+
+import functools
+import sys
+
+
+@functools.cache
+def get_console():
+    """
+    Obtém o console Rich compartilhado, criado sob demanda.
+
+    A importação do Rich é adiada até o primeiro uso para reduzir o
+    tempo de inicialização da CLI. Quando a saída não é um terminal
+    (ex.: redirecionada para arquivo), desativa o realce automático e a
+    quebra de linhas para reduzir o processamento por chamada.
+
+    Returns:
+        Console: Instância do console Rich.
+    """
+    from rich.console import Console
+
+    if sys.stdout.isatty():
+        return Console()
+    return Console(force_terminal=False, highlight=False, soft_wrap=True)
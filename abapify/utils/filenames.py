@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Geração de nomes de arquivo padrão para o código gerado.
+"""
+
+# Converte espaços em "_" nos nomes de arquivo gerados a partir de texto livre
+_SPACE_TABLE = str.maketrans(" ", "_")
+
+
+def default_filename(prefix: str, text: str, length: int = 20) -> str:
+    """
+    Monta o nome de arquivo padrão a partir de um texto livre.
+
+    Apenas o trecho inicial do texto é processado, em vez da string inteira.
+
+    Args:
+        prefix: Prefixo do nome (ex.: "z_alv_").
+        text: Texto livre (descrição, objeto alvo etc.).
+        length: Quantidade máxima de caracteres do texto usados no nome.
+
+    Returns:
+        str: Nome do arquivo com extensão .abap.
+    """
+    return f"{prefix}{text[:length].lower().translate(_SPACE_TABLE)[:length]}.abap"
@@ -32,6 +32,7 @@ from abapify.cli.commands import (
     generate_enhancement,
 )
 from abapify.utils.config import load_config, list_config, get_sap_environments
+from abapify.utils.filenames import default_filename
 from abapify.utils.logger import setup_logger
 
 # Inicializa o console e logger
@@ -140,8 +141,8 @@ def handle_alv_generation():
         console.print("[yellow]Aviso: Nenhuma tabela especificada[/yellow]")
     
     output_dir = Prompt.ask("[cyan]Diretório de saída[/cyan]", default="./output")
-    default_filename = f"z_alv_{description.lower().replace(' ', '_')[:20]}.abap"
-    filename = Prompt.ask("[cyan]Nome do arquivo[/cyan]", default=default_filename)
+    suggested_filename = default_filename("z_alv_", description)
+    filename = Prompt.ask("[cyan]Nome do arquivo[/cyan]", default=suggested_filename)
     
     with console.status("[cyan]Gerando código ABAP...[/cyan]"):
         generate_alv(description, tuple(tables), output_dir, filename)
@@ -166,8 +167,8 @@ def handle_report_generation():
         console.print("[yellow]Aviso: Nenhuma tabela especificada[/yellow]")
     
     output_dir = Prompt.ask("[cyan]Diretório de saída[/cyan]", default="./output")
-    default_filename = f"z_report_{description.lower().replace(' ', '_')[:20]}.abap"
-    filename = Prompt.ask("[cyan]Nome do arquivo[/cyan]", default=default_filename)
+    suggested_filename = default_filename("z_report_", description)
+    filename = Prompt.ask("[cyan]Nome do arquivo[/cyan]", default=suggested_filename)
     
     with console.status("[cyan]Gerando código ABAP...[/cyan]"):
         generate_report(description, tuple(tables), output_dir, filename)
@@ -193,8 +194,8 @@ def handle_class_generation():
         console.print("[yellow]Adicionando método constructor por padrão[/yellow]")
     
     output_dir = Prompt.ask("[cyan]Diretório de saída[/cyan]", default="./output")
-    default_filename = f"zcl_{description.lower().replace(' ', '_')[:20]}.abap"
-    filename = Prompt.ask("[cyan]Nome do arquivo[/cyan]", default=default_filename)
+    suggested_filename = default_filename("zcl_", description)
+    filename = Prompt.ask("[cyan]Nome do arquivo[/cyan]", default=suggested_filename)
     
     with console.status("[cyan]Gerando código ABAP...[/cyan]"):
         generate_class(description, tuple(methods), output_dir, filename)
@@ -220,8 +221,8 @@ def handle_function_generation():
         console.print("[yellow]Aviso: Nenhum parâmetro especificado[/yellow]")
     
     output_dir = Prompt.ask("[cyan]Diretório de saída[/cyan]", default="./output")
-    default_filename = f"z_fm_{description.lower().replace(' ', '_')[:20]}.abap"
-    filename = Prompt.ask("[cyan]Nome do arquivo[/cyan]", default=default_filename)
+    suggested_filename = default_filename("z_fm_", description)
+    filename = Prompt.ask("[cyan]Nome do arquivo[/cyan]", default=suggested_filename)
     
     with console.status("[cyan]Gerando código ABAP...[/cyan]"):
         generate_function_module(description, tuple(params), output_dir, filename)
@@ -247,8 +248,8 @@ def handle_structure_generation():
         console.print("[yellow]Aviso: Nenhum campo especificado[/yellow]")
     
     output_dir = Prompt.ask("[cyan]Diretório de saída[/cyan]", default="./output")
-    default_filename = f"zstruct_{description.lower().replace(' ', '_')[:20]}.abap"
-    filename = Prompt.ask("[cyan]Nome do arquivo[/cyan]", default=default_filename)
+    suggested_filename = default_filename("zstruct_", description)
+    filename = Prompt.ask("[cyan]Nome do arquivo[/cyan]", default=suggested_filename)
     
     with console.status("[cyan]Gerando código ABAP...[/cyan]"):
         generate_structure(description, tuple(fields), output_dir, filename)
@@ -261,8 +262,8 @@ def handle_test_generation():
    target = Prompt.ask("[cyan]Nome da classe ou módulo a ser testado[/cyan]")
    
    output_dir = Prompt.ask("[cyan]Diretório de saída[/cyan]", default="./output")
-   default_filename = f"zcl_test_{target.lower().replace(' ', '_')[:20]}.abap"
-   filename = Prompt.ask("[cyan]Nome do arquivo[/cyan]", default=default_filename)
+   suggested_filename = default_filename("zcl_test_", target)
+   filename = Prompt.ask("[cyan]Nome do arquivo[/cyan]", default=suggested_filename)
    
    with console.status("[cyan]Gerando código ABAP...[/cyan]"):
        generate_test(target, output_dir, filename)
@@ -296,8 +297,8 @@ def handle_enhancement_generation():
    enhancement_points = Prompt.ask("[cyan]Pontos específicos de enhancement[/cyan]", default="")
    
    output_dir = Prompt.ask("[cyan]Diretório de saída[/cyan]", default="./output")
-   default_filename = f"z_enh_{base_object.lower().replace(' ', '_')[:15]}.abap"
-   filename = Prompt.ask("[cyan]Nome do arquivo[/cyan]", default=default_filename)
+   suggested_filename = default_filename("z_enh_", base_object, 15)
+   filename = Prompt.ask("[cyan]Nome do arquivo[/cyan]", default=suggested_filename)
    
    with console.status("[cyan]Gerando código ABAP...[/cyan]"):
        generate_enhancement(
@@ -352,8 +353,8 @@ def handle_sap_aware_generation():
        return
    
    output_dir = Prompt.ask("[cyan]Diretório de saída[/cyan]", default="./output")
-   default_filename = f"z_sap_{code_type}_{description.lower().replace(' ', '_')[:15]}.abap"
-   filename = Prompt.ask("[cyan]Nome do arquivo[/cyan]", default=default_filename)
+   suggested_filename = default_filename(f"z_sap_{code_type}_", description, 15)
+   filename = Prompt.ask("[cyan]Nome do arquivo[/cyan]", default=suggested_filename)
    
    try:
        from abapify.cli.sap_commands import generate_sap_aware_code
@@ -5,13 +5,21 @@
 Testes para a interface de linha de comando.
 """
 
+import io
+import json
 import os
+import shutil
 import tempfile
 from unittest import TestCase, mock
 
+import click
 from click.testing import CliRunner
 
-from abapify.cli.main import main
+from abapify.cli.commands import _get_generator
+from abapify.cli.launcher import run
+from abapify.cli.main import _LAZY_COMMANDS, _is_help_request, main
+from abapify.utils.cache import write_cache_entry
+from abapify.utils.exceptions import ConfigError
 
 
 class TestCLI(TestCase):
@@ -21,15 +29,23 @@ class TestCLI(TestCase):
         """Configuração dos testes."""
         self.runner = CliRunner()
         self.temp_dir = tempfile.mkdtemp()
+        # Isola o cache de geração em um diretório temporário
+        self.cache_dir = tempfile.mkdtemp()
+        self.env_patcher = mock.patch.dict(os.environ, {"ABAPIFY_CACHE_DIR": self.cache_dir})
+        self.env_patcher.start()
+        # Garante que cada teste crie o gerador com o mock ativo
+        _get_generator.cache_clear()
 
     def tearDown(self):
         """Limpeza após os testes."""
+        self.env_patcher.stop()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
         # Limpa arquivos temporários
         for file in os.listdir(self.temp_dir):
             os.remove(os.path.join(self.temp_dir, file))
         os.rmdir(self.temp_dir)
 
-    @mock.patch("abapify.cli.commands.AbapGenerator")
+    @mock.patch("abapify.core.generator.AbapGenerator")
     def test_generate_alv(self, mock_generator):
         """Testa o comando generate-alv."""
         # Configura o mock
@@ -63,7 +79,7 @@ class TestCLI(TestCase):
         # Verifica se o arquivo foi criado
         self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "test_alv.abap")))
 
-    @mock.patch("abapify.cli.commands.AbapGenerator")
+    @mock.patch("abapify.core.generator.AbapGenerator")
     def test_generate_class(self, mock_generator):
         """Testa o comando generate-class."""
         # Configura o mock
@@ -97,4 +113,227 @@ class TestCLI(TestCase):
         )
         
         # Verifica se o arquivo foi criado
-        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "test_class.abap")))
\ No newline at end of file
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "test_class.abap")))
+
+    @mock.patch("rich.prompt.Confirm.ask", return_value=False)
+    @mock.patch("rich.prompt.Prompt.ask", return_value="Programa")
+    @mock.patch("abapify.core.generator.AbapGenerator")
+    def test_generate_program_streams_output(self, mock_generator, mock_prompt, mock_confirm):
+        """Testa se o --stream exibe os trechos gerados e grava o programa completo."""
+        instance = mock_generator.return_value
+        instance.generate_stream.return_value = iter(["REPORT ", "zstream."])
+
+        result = self.runner.invoke(
+            main,
+            ["generate-program", "--stream", "--output", self.temp_dir, "--filename", "zstream.abap"],
+        )
+
+        self.assertEqual(0, result.exit_code)
+        self.assertIn("REPORT zstream.", result.output)
+        instance.generate_stream.assert_called_once()
+        self.assertEqual("custom_program", instance.generate_stream.call_args.args[0])
+        instance.generate_custom_program.assert_not_called()
+        with open(os.path.join(self.temp_dir, "zstream.abap"), encoding="utf-8") as f:
+            self.assertEqual("REPORT zstream.", f.read())
+
+    @mock.patch("abapify.core.generator.AbapGenerator")
+    def test_generate_alv_is_not_cached_by_cli(self, mock_generator):
+        """Testa se a CLI repassa cada geração ao gerador (o cache fica no LLMClient)."""
+        instance = mock_generator.return_value
+        instance.generate_alv.side_effect = ["REPORT Z_V1.", "REPORT Z_V2."]
+
+        args = [
+            "generate-alv",
+            "--description",
+            "Relatório de teste",
+            "--tables",
+            "MARA",
+            "--output",
+            self.temp_dir,
+        ]
+        for filename in ("first.abap", "second.abap"):
+            result = self.runner.invoke(main, args + ["--filename", filename])
+            self.assertEqual(0, result.exit_code)
+
+        self.assertEqual(2, instance.generate_alv.call_count)
+        with open(os.path.join(self.temp_dir, "second.abap"), encoding="utf-8") as f:
+            self.assertEqual("REPORT Z_V2.", f.read())
+
+    def test_cache_clear_empties_cache_dir(self):
+        """Testa se cache clear remove as entradas em cache."""
+        write_cache_entry("responses", "chave", "REPORT Z_TEST.")
+
+        result = self.runner.invoke(main, ["cache", "clear"])
+        self.assertEqual(0, result.exit_code)
+        self.assertFalse(os.listdir(self.cache_dir))
+
+    @mock.patch("abapify.cli.config_commands.save_config")
+    def test_config_set_skips_unchanged_values(self, mock_save_config):
+        """Testa se config set não regrava valores que já estão configurados."""
+        with mock.patch.dict(os.environ, {"DEFAULT_PROVIDER": "groq", "DEFAULT_TEMPERATURE": "0.5"}):
+            result = self.runner.invoke(
+                main, ["config", "set", "--provider", "groq", "--temperature", "0.5"]
+            )
+            self.assertEqual(0, result.exit_code)
+            mock_save_config.assert_not_called()
+
+            result = self.runner.invoke(
+                main, ["config", "set", "--provider", "openai", "--temperature", "0.5"]
+            )
+            self.assertEqual(0, result.exit_code)
+            mock_save_config.assert_called_once_with({"DEFAULT_PROVIDER": "openai"})
+
+    @mock.patch("abapify.utils.config._write_config", side_effect=ConfigError("disco cheio"))
+    @mock.patch("abapify.cli.config_commands.setup_sap_environment")
+    def test_config_sap_reports_save_error(self, mock_setup, mock_write):
+        """Testa se uma falha ao gravar o .env é reportada antes da mensagem de sucesso."""
+        mock_setup.side_effect = lambda env, updates: updates.update({"SAP_DEV_ASHOST": "sapdev"})
+
+        result = self.runner.invoke(main, ["config", "sap", "--environment", "DEV"])
+
+        self.assertEqual(0, result.exit_code)
+        mock_write.assert_called_once_with({"SAP_DEV_ASHOST": "sapdev"})
+        self.assertIn("disco cheio", result.output)
+        self.assertNotIn("salva", result.output)
+
+    @mock.patch("abapify.sap.SAPConnection")
+    def test_failed_sap_connection_is_closed(self, mock_connection):
+        """Testa se uma conexão que falha no teste é encerrada sem buscar informações do sistema."""
+        mock_connection.return_value.test_connection.return_value = {"rfc": False}
+
+        result = self.runner.invoke(main, ["config", "test-sap", "--environment", "DEV"])
+
+        self.assertEqual(0, result.exit_code)
+        mock_connection.return_value.close.assert_called_once()
+        mock_connection.return_value.get_system_info.assert_not_called()
+
+    @mock.patch("abapify.sap.SAPConnection")
+    def test_sap_connection_shows_system_info(self, mock_connection):
+        """Testa se o teste de conexão exibe as informações do sistema quando conecta."""
+        mock_connection.return_value.test_connection.return_value = {"rfc": True}
+        mock_connection.return_value.get_system_info.return_value = {"system_id": "DEV"}
+
+        result = self.runner.invoke(main, ["config", "test-sap", "--environment", "DEV"])
+
+        self.assertEqual(0, result.exit_code)
+        self.assertIn("System Id", result.output)
+        mock_connection.return_value.close.assert_called_once()
+
+    @mock.patch("abapify.sap.SAPConnection")
+    def test_list_sap_tables_rejects_non_positive_limit(self, mock_connection):
+        """Testa se --limit menor que 1 é rejeitado antes de conectar ao SAP."""
+        result = self.runner.invoke(
+            main, ["config", "list-sap-tables", "--environment", "DEV", "--limit", "0"]
+        )
+
+        self.assertEqual(2, result.exit_code)
+        mock_connection.assert_not_called()
+
+    @mock.patch("abapify.core.generator.AbapGenerator")
+    def test_batch(self, mock_generator):
+        """Testa o comando batch."""
+        instance = mock_generator.return_value
+        instance.generate_bundle.return_value = [
+            "CLASS ZCL_TEST DEFINITION.", "CLASS LTCL_TEST DEFINITION."
+        ]
+
+        specs = [
+            {"kind": "class", "args": {"description": "Classe", "methods": ["run"]},
+             "filename": "zcl_batch.abap"},
+            {"kind": "test", "args": {"target": "ZCL_BATCH"}},
+            {"kind": "invalid", "args": {}},
+        ]
+        spec_file = os.path.join(self.cache_dir, "batch.json")
+        with open(spec_file, "w", encoding="utf-8") as f:
+            json.dump(specs, f)
+
+        result = self.runner.invoke(main, ["batch", spec_file, "--output", self.temp_dir])
+
+        self.assertEqual(0, result.exit_code)
+        self.assertIn("2 de 3", result.output)
+        instance.generate_bundle.assert_called_once_with(
+            [
+                {"kind": "class", "args": {"description": "Classe", "methods": ["run"]}},
+                {"kind": "test", "args": {"target": "ZCL_BATCH"}},
+            ],
+            return_exceptions=True,
+        )
+        self.assertEqual(
+            ["z_test_2.abap", "zcl_batch.abap"], sorted(os.listdir(self.temp_dir))
+        )
+
+    @mock.patch("abapify.core.generator.AbapGenerator")
+    def test_batch_skips_malformed_items(self, mock_generator):
+        """Testa se itens malformados ou com falha são reportados sem interromper os demais."""
+        instance = mock_generator.return_value
+        instance.generate_bundle.return_value = [
+            ValueError("falha"), "CLASS LTCL_TEST DEFINITION."
+        ]
+
+        specs = [
+            "class",
+            ["test"],
+            {"kind": ["test"]},
+            {"kind": "test", "args": {"target": "ZCL_A"}, "filename": "../fora.abap"},
+            {"kind": "test", "args": {"target": "ZCL_C"}, "filename": "falha.abap"},
+            {"kind": "test", "args": {"target": "ZCL_B"}, "filename": "ok.abap"},
+        ]
+        spec_file = os.path.join(self.cache_dir, "batch.json")
+        with open(spec_file, "w", encoding="utf-8") as f:
+            json.dump(specs, f)
+
+        result = self.runner.invoke(main, ["batch", spec_file, "--output", self.temp_dir])
+
+        self.assertEqual(0, result.exit_code)
+        self.assertIn("1 de 6", result.output)
+        instance.generate_bundle.assert_called_once_with(
+            [
+                {"kind": "test", "args": {"target": "ZCL_C"}},
+                {"kind": "test", "args": {"target": "ZCL_B"}},
+            ],
+            return_exceptions=True,
+        )
+        self.assertEqual(["ok.abap"], os.listdir(self.temp_dir))
+        self.assertFalse(os.path.exists(os.path.join(os.path.dirname(self.temp_dir), "fora.abap")))
+
+    @mock.patch("abapify.cli.main.load_config")
+    def test_help_skips_config_loading(self, mock_load_config):
+        """Testa se pedidos de ajuda não carregam as configurações."""
+        result = self.runner.invoke(main, ["generate-class", "--help"])
+
+        self.assertEqual(0, result.exit_code)
+        mock_load_config.assert_not_called()
+
+    def test_help_request_ignores_option_values(self):
+        """Testa se "--help" usado como valor de uma opção não é tratado como pedido de ajuda."""
+        cases = {
+            ("generate-class", "--help"): True,
+            ("config", "sap", "--help"): True,
+            ("generate-class", "-d", "--help"): False,
+            ("generate-class", "--description", "--help", "--methods", "run"): False,
+            ("generate-class", "--", "--help"): False,
+        }
+        for args, expected in cases.items():
+            ctx = click.Context(main)
+            ctx.meta["abapify.args"] = args
+            self.assertEqual(expected, _is_help_request(ctx), args)
+
+    @mock.patch("abapify.cli.main.main")
+    def test_launcher_version_fast_path(self, mock_main):
+        """Testa se --version é respondido sem carregar a CLI completa."""
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            run(["--version"])
+
+        self.assertEqual("abapify, version 2.0.0\n", stdout.getvalue())
+        mock_main.assert_not_called()
+
+    def test_lazy_command_help_matches_commands(self):
+        """Testa se a ajuda curta registrada corresponde à de cada comando."""
+        ctx = click.Context(main)
+        for name, (_, short_help) in _LAZY_COMMANDS.items():
+            command = main.get_command(ctx, name)
+            self.assertEqual(
+                command.get_short_help_str(limit=200),
+                click.Command(name, help=short_help).get_short_help_str(limit=200),
+                name,
+            )
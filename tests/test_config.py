@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o utilitário de configuração.
+"""
+
+import os
+import shutil
+import tempfile
+from unittest import TestCase, mock
+
+from abapify.utils import config
+
+
+class TestConfig(TestCase):
+    """Testes para o carregamento e gravação de configurações."""
+
+    def setUp(self):
+        """Configuração dos testes."""
+        self.cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+        self.env_patcher = mock.patch.dict(os.environ, {}, clear=True)
+        self.env_patcher.start()
+        config._read_env_file.cache_clear()
+
+    def tearDown(self):
+        """Limpeza após os testes."""
+        self.env_patcher.stop()
+        os.chdir(self.cwd)
+        shutil.rmtree(self.temp_dir)
+
+    def test_load_config_reuses_parsed_env_file(self):
+        """Testa se o .env só é reinterpretado quando o arquivo muda."""
+        with open(".env", "w", encoding="utf-8") as f:
+            f.write("DEFAULT_PROVIDER=groq\n")
+
+        with mock.patch.object(config.dotenv, "dotenv_values", wraps=config.dotenv.dotenv_values) as parse:
+            self.assertEqual("groq", config.load_config()["DEFAULT_PROVIDER"])
+            config.load_config()
+            self.assertEqual(1, parse.call_count)
+
+    def test_save_config_invalidates_cache(self):
+        """Testa se save_config descarta o .env interpretado anteriormente."""
+        config.save_config({"OUTPUT_DIR": "./saida"})
+        config.load_config()
+        self.assertEqual("./saida", os.environ["OUTPUT_DIR"])
+
+        config.save_config({"DEFAULT_MAX_TOKENS": "2048"})
+        config.load_config()
+        self.assertEqual("2048", os.environ["DEFAULT_MAX_TOKENS"])
+
+    def test_config_batch_writes_once(self):
+        """Testa se config_batch agrupa várias gravações em uma só."""
+        with mock.patch.object(config, "_write_config", wraps=config._write_config) as write:
+            with config.config_batch():
+                config.save_config({"OUTPUT_DIR": "./saida"})
+                with config.config_batch():
+                    config.save_config({"DEFAULT_MAX_TOKENS": "2048"})
+                self.assertFalse(os.path.exists(".env"))
+
+            write.assert_called_once_with({"OUTPUT_DIR": "./saida", "DEFAULT_MAX_TOKENS": "2048"})
+
+        with open(".env", encoding="utf-8") as f:
+            content = f.read()
+        self.assertIn("OUTPUT_DIR=./saida", content)
+        self.assertIn("DEFAULT_MAX_TOKENS=2048", content)
+        self.assertEqual([".env"], os.listdir("."))
+
+    def test_config_batch_discards_on_error(self):
+        """Testa se config_batch descarta as atualizações quando ocorre erro."""
+        with self.assertRaises(RuntimeError):
+            with config.config_batch():
+                config.save_config({"OUTPUT_DIR": "./saida"})
+                raise RuntimeError("falha")
+
+        self.assertFalse(os.path.exists(".env"))
+
+    def test_save_config_preserves_raw_values(self):
+        """Testa se save_config mantém os demais valores do .env exatamente como escritos."""
+        with open(".env", "w", encoding="utf-8") as f:
+            f.write("DEFAULT_PROVIDER=groq\n")
+            f.write("SAP_DEV_PASSWD='p${X}w'\n")
+            f.write('OTHER="a # b"\n')
+
+        config.load_config()
+        config.save_config({"OUTPUT_DIR": "./saida"})
+
+        with open(".env", encoding="utf-8") as f:
+            content = f.read()
+        self.assertIn("DEFAULT_PROVIDER=groq\n", content)
+        self.assertIn("OUTPUT_DIR=./saida\n", content)
+        self.assertIn("SAP_DEV_PASSWD='p${X}w'\n", content)
+        self.assertIn('OTHER="a # b"\n', content)
+        self.assertEqual("a # b", config.dotenv.dotenv_values(".env")["OTHER"])
+
+    def test_save_config_clears_shared_providers(self):
+        """Testa se save_config descarta os provedores LLM criados com a configuração antiga."""
+        with mock.patch("abapify.llm.client.clear_provider_cache") as clear:
+            config.save_config({"GROQ_API_KEY": "nova"})
+
+        clear.assert_called_once()
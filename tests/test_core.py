@@ -6,11 +6,13 @@ Testes para a interface de linha de comando.
 """
 
 import os
+import shutil
 import tempfile
 from unittest import TestCase, mock
 
 from click.testing import CliRunner
 
+from abapify.cli.commands import _get_generator
 from abapify.cli.main import main
 
 
@@ -21,15 +23,23 @@ class TestCLI(TestCase):
         """Configuração dos testes."""
         self.runner = CliRunner()
         self.temp_dir = tempfile.mkdtemp()
+        # Isola o cache de geração em um diretório temporário
+        self.cache_dir = tempfile.mkdtemp()
+        self.env_patcher = mock.patch.dict(os.environ, {"ABAPIFY_CACHE_DIR": self.cache_dir})
+        self.env_patcher.start()
+        # Garante que cada teste crie o gerador com o mock ativo
+        _get_generator.cache_clear()
 
     def tearDown(self):
         """Limpeza após os testes."""
+        self.env_patcher.stop()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
         # Limpa arquivos temporários
         for file in os.listdir(self.temp_dir):
             os.remove(os.path.join(self.temp_dir, file))
         os.rmdir(self.temp_dir)
 
-    @mock.patch("abapify.cli.commands.AbapGenerator")
+    @mock.patch("abapify.core.generator.AbapGenerator")
     def test_generate_alv(self, mock_generator):
         """Testa o comando generate-alv."""
         # Configura o mock
@@ -63,7 +73,7 @@ class TestCLI(TestCase):
         # Verifica se o arquivo foi criado
         self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "test_alv.abap")))
 
-    @mock.patch("abapify.cli.commands.AbapGenerator")
+    @mock.patch("abapify.core.generator.AbapGenerator")
     def test_generate_class(self, mock_generator):
         """Testa o comando generate-class."""
         # Configura o mock
@@ -97,4 +107,48 @@ class TestCLI(TestCase):
         )
         
         # Verifica se o arquivo foi criado
-        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "test_class.abap")))
\ No newline at end of file
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "test_class.abap")))
+
+
+class TestAbapGenerator(TestCase):
+    """Testes para o gerador de código ABAP."""
+
+    @mock.patch("abapify.core.generator.LLMClient")
+    def test_generate_code_keeps_zero_temperature(self, mock_llm_client):
+        """Testa se uma temperatura 0 explícita não é trocada pelo padrão."""
+        from abapify.core.generator import AbapGenerator
+
+        mock_llm_client.return_value.generate.return_value = "REPORT Z_TEST."
+        generator = AbapGenerator()
+
+        generator._generate_code("Prompt", temperature=0.0)
+
+        self.assertEqual(0.0, mock_llm_client.return_value.generate.call_args.kwargs["temperature"])
+
+    @mock.patch("abapify.core.generator.LLMClient")
+    def test_compact_prompts(self, mock_llm_client):
+        """Testa se o prompt compacto é usado e mantém o cabeçalho obrigatório."""
+        from abapify.core.generator import AbapGenerator
+        from abapify.prompts.enhanced_system_prompts import COMPACT_SYSTEM_PROMPT, ENHANCED_SYSTEM_PROMPT
+
+        generator = AbapGenerator(compact_prompts=True)
+
+        self.assertIs(COMPACT_SYSTEM_PROMPT, generator.system_prompt)
+        self.assertIn("Programa gerado pelo ABAPify", COMPACT_SYSTEM_PROMPT)
+        self.assertLess(len(COMPACT_SYSTEM_PROMPT) * 3, len(ENHANCED_SYSTEM_PROMPT))
+
+    @mock.patch("abapify.core.generator.LLMClient")
+    def test_generate_map_keeps_order(self, mock_llm_client):
+        """Testa se a geração em paralelo devolve os códigos na ordem dos argumentos."""
+        from abapify.core.generator import AbapGenerator
+
+        mock_llm_client.return_value.generate.side_effect = lambda **kwargs: kwargs["user_prompt"]
+        generator = AbapGenerator()
+
+        result = generator.generate_map(
+            "generate_test", [{"target": "ZCL_A"}, {"target": "ZCL_B"}], max_workers=2
+        )
+
+        self.assertEqual(2, len(result))
+        self.assertIn("ZCL_A", result[0])
+        self.assertIn("ZCL_B", result[1])
@@ -5,17 +5,30 @@
 Testes para o módulo LLM.
 """
 
+import asyncio
 import os
+import shutil
+import tempfile
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
-from abapify.llm.client import LLMClient
-from abapify.utils.exceptions import LLMProviderNotFoundError
+from abapify.llm.client import LLMClient, clear_provider_cache
+from abapify.llm.providers.arcee_provider import ArceeProvider
+from abapify.utils.exceptions import ConfigError, LLMAPIError, LLMProviderNotFoundError
 
 
 class TestLLMClient(unittest.TestCase):
     """Testes para o cliente LLM."""
 
+    def setUp(self):
+        """Configuração dos testes."""
+        # Os testes alteram chaves e URLs lidas na criação dos provedores
+        clear_provider_cache()
+        self.addCleanup(clear_provider_cache)
+
     @mock.patch.dict(os.environ, {"GROQ_API_KEY": "test_key"})
     def test_default_provider_groq(self):
         """Testa se o provedor padrão é Groq quando a chave está disponível."""
@@ -75,4 +88,242 @@ class TestLLMClient(unittest.TestCase):
                 system_prompt="Sistema",
                 user_prompt="Usuário",
                 provider="provider_inexistente",
-            )
\ No newline at end of file
+            )
+
+    @mock.patch.dict(os.environ, {"GROQ_API_KEY": "test_key", "OPENAI_API_KEY": "test_key"})
+    def test_generate_batch_keeps_order(self):
+        """Testa se a geração em lote devolve os textos na ordem dos prompts."""
+        provider = mock.MagicMock()
+        provider.generate.side_effect = lambda **kwargs: kwargs["user_prompt"].upper()
+
+        client = LLMClient()
+        client._providers["groq"] = provider
+
+        result = client.generate_batch(
+            system_prompt="Sistema",
+            user_prompts=["classe", "teste", "estrutura"],
+            provider="groq",
+        )
+
+        self.assertEqual(["CLASSE", "TESTE", "ESTRUTURA"], result)
+        self.assertEqual(3, provider.generate.call_count)
+
+    @mock.patch.dict(os.environ, {"GROQ_API_KEY": "test_key", "OPENAI_API_KEY": "test_key"})
+    def test_generate_batch_return_exceptions(self):
+        """Testa se as falhas do lote podem ser devolvidas junto aos resultados."""
+        error = LLMAPIError("falha")
+        provider = mock.MagicMock()
+        provider.generate.side_effect = [error, "Código ABAP gerado"]
+
+        client = LLMClient()
+        client._providers["groq"] = provider
+
+        result = client.generate_batch(
+            system_prompt="Sistema",
+            user_prompts=["a", "b"],
+            provider="groq",
+            max_workers=1,
+            return_exceptions=True,
+        )
+
+        self.assertEqual([error, "Código ABAP gerado"], result)
+
+    @mock.patch.dict(os.environ, {"GROQ_API_KEY": "test_key", "OPENAI_API_KEY": "test_key"})
+    def test_agenerate_uses_async_provider(self):
+        """Testa se a geração assíncrona aguarda o método agenerate do provedor."""
+        provider = mock.MagicMock()
+        provider.agenerate = mock.AsyncMock(return_value="Código ABAP gerado")
+
+        client = LLMClient()
+        client._providers["groq"] = provider
+
+        result = asyncio.run(
+            client.agenerate(system_prompt="Sistema", user_prompt="Usuário", provider="groq")
+        )
+
+        self.assertEqual("Código ABAP gerado", result)
+        provider.agenerate.assert_awaited_once_with(
+            system_prompt="Sistema",
+            user_prompt="Usuário",
+            model_name=None,
+            temperature=0.7,
+            max_tokens=4096,
+        )
+
+    @mock.patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"})
+    @mock.patch("abapify.llm.providers.openai_provider.AsyncOpenAI")
+    def test_agenerate_survives_consecutive_event_loops(self, mock_async_openai):
+        """Testa se cada asyncio.run usa um cliente assíncrono próprio do seu loop."""
+        from abapify.llm.providers.openai_provider import OpenAIProvider
+
+        def create_client(**kwargs):
+            async_client = mock.MagicMock()
+            message = mock.MagicMock(content="ok")
+            async_client.chat.completions.create = mock.AsyncMock(
+                return_value=mock.MagicMock(choices=[mock.MagicMock(message=message)])
+            )
+            return async_client
+
+        mock_async_openai.side_effect = create_client
+        provider = OpenAIProvider()
+
+        first = asyncio.run(provider.agenerate("Sistema", "Usuário"))
+        second = asyncio.run(provider.agenerate("Sistema", "Usuário"))
+
+        self.assertEqual(["ok", "ok"], [first, second])
+        self.assertEqual(2, mock_async_openai.call_count)
+
+    def test_generate_caches_deterministic_responses(self):
+        """Testa se respostas com temperatura 0 são reaproveitadas do cache."""
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir, ignore_errors=True)
+        provider = mock.MagicMock()
+        provider.generate.return_value = "Código ABAP gerado"
+
+        with mock.patch.dict(os.environ, {
+            "GROQ_API_KEY": "test_key", "OPENAI_API_KEY": "test_key", "ABAPIFY_CACHE_DIR": cache_dir
+        }):
+            client = LLMClient()
+            client._providers["groq"] = provider
+            first = client.generate("Sistema", "Usuário", provider="groq", temperature=0)
+            second = client.generate("Sistema", "Usuário", provider="groq", temperature=0)
+
+        self.assertEqual("Código ABAP gerado", first)
+        self.assertEqual(first, second)
+        provider.generate.assert_called_once()
+
+    def test_response_cache_is_keyed_on_served_model(self):
+        """Testa se trocar o VLLM_MODEL não reaproveita respostas do modelo anterior."""
+        from abapify.llm.providers.vllm_provider import VLLMProvider
+
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir, ignore_errors=True)
+        env = {
+            "ARCEE_TOKEN": "", "GROQ_API_KEY": "", "OPENAI_API_KEY": "",
+            "VLLM_BASE_URL": "http://localhost:8000/v1", "VLLM_MODEL": "modelo-a",
+            "ABAPIFY_CACHE_DIR": cache_dir,
+        }
+
+        with mock.patch.dict(os.environ, env), \
+             mock.patch.object(VLLMProvider, "generate", autospec=True,
+                               side_effect=lambda provider, **kwargs: provider.DEFAULT_MODEL):
+            first = LLMClient().generate("Sistema", "Usuário", temperature=0)
+            os.environ["VLLM_MODEL"] = "modelo-b"
+            clear_provider_cache()
+            second = LLMClient().generate("Sistema", "Usuário", temperature=0)
+
+        self.assertEqual(["modelo-a", "modelo-b"], [first, second])
+
+    @mock.patch.dict(os.environ, {"ARCEE_TOKEN": "test_token"})
+    def test_arcee_generate_stream_parses_sse(self):
+        """Testa se o streaming do Arcee extrai os trechos dos eventos SSE."""
+        provider = ArceeProvider()
+        response = mock.MagicMock()
+        response.iter_lines.return_value = [
+            b'data: {"choices": [{"delta": {"role": "assistant"}}]}',
+            b"",
+            b'data: {"choices": [{"delta": {"content": "REPORT "}}]}',
+            b'data: {"choices": [{"delta": {"content": "ztest."}}]}',
+            b"data: [DONE]",
+        ]
+
+        with mock.patch.object(provider.session, "post") as mock_post:
+            mock_post.return_value.__enter__.return_value = response
+            chunks = list(provider.generate_stream("Sistema", "Usuário"))
+
+        self.assertEqual(["REPORT ", "ztest."], chunks)
+        self.assertTrue(mock_post.call_args.kwargs["stream"])
+
+    @mock.patch.dict(os.environ, {"ARCEE_TOKEN": "test_token"})
+    def test_arcee_generate_stream_decodes_utf8(self):
+        """Testa se trechos não ASCII do streaming do Arcee são decodificados como UTF-8."""
+        provider = ArceeProvider()
+        response = mock.MagicMock()
+        response.iter_lines.return_value = [
+            'data: {"choices": [{"delta": {"content": "relatório"}}]}'.encode("utf-8"),
+            b"data: [DONE]",
+        ]
+
+        with mock.patch.object(provider.session, "post") as mock_post:
+            mock_post.return_value.__enter__.return_value = response
+            chunks = list(provider.generate_stream("Sistema", "Usuário"))
+
+        self.assertEqual(["relatório"], chunks)
+
+    @mock.patch.dict(os.environ, {"GROQ_API_KEY": "test_key", "OPENAI_API_KEY": "test_key"})
+    def test_generate_variants_without_native_n(self):
+        """Testa se provedores sem suporte a n recebem uma requisição por alternativa."""
+        provider = mock.MagicMock(SUPPORTS_N=False)
+        provider.generate.return_value = "Código ABAP gerado"
+
+        client = LLMClient()
+        client._providers["groq"] = provider
+
+        result = client.generate("Sistema", "Usuário", provider="groq", n=3)
+
+        self.assertEqual(["Código ABAP gerado"] * 3, result)
+        self.assertEqual(3, provider.generate.call_count)
+        self.assertNotIn("n", provider.generate.call_args.kwargs)
+
+    def test_generate_variants_without_native_n_skip_cache(self):
+        """Testa se as alternativas continuam distintas com o cache de respostas ativo."""
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir, ignore_errors=True)
+        provider = mock.MagicMock(SUPPORTS_N=False)
+        provider.generate.side_effect = ["draft0", "draft1", "draft2"]
+
+        with mock.patch.dict(os.environ, {"ABAPIFY_CACHE": "1", "ABAPIFY_CACHE_DIR": cache_dir}):
+            client = LLMClient()
+            client._providers["groq"] = provider
+            result = client.generate("s", "u", provider="groq", temperature=0.7, n=3)
+
+        self.assertEqual(["draft0", "draft1", "draft2"], sorted(result))
+        self.assertEqual(3, provider.generate.call_count)
+        self.assertFalse(os.listdir(cache_dir))
+
+    def test_clear_provider_cache_picks_up_new_settings(self):
+        """Testa se provedores criados após clear_provider_cache usam a configuração nova."""
+        with mock.patch.dict(os.environ, {"VLLM_BASE_URL": "http://localhost:8000/v1", "VLLM_MODEL": "modelo-a"}):
+            self.assertEqual("modelo-a", LLMClient()._get_provider("vllm").DEFAULT_MODEL)
+
+            os.environ["VLLM_MODEL"] = "modelo-b"
+            self.assertEqual("modelo-a", LLMClient()._get_provider("vllm").DEFAULT_MODEL)
+
+            clear_provider_cache()
+            self.assertEqual("modelo-b", LLMClient()._get_provider("vllm").DEFAULT_MODEL)
+
+    def test_vllm_requires_model(self):
+        """Testa se o provedor vLLM exige VLLM_MODEL configurado."""
+        with mock.patch.dict(os.environ, {"VLLM_BASE_URL": "http://localhost:8000/v1", "VLLM_MODEL": ""}):
+            with self.assertRaises(ConfigError):
+                LLMClient()._get_provider("vllm")
+
+    def test_generate_coalesces_inflight_requests(self):
+        """Testa se chamadas idênticas simultâneas compartilham uma única requisição."""
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir, ignore_errors=True)
+        started, release = threading.Event(), threading.Event()
+
+        def slow_generate(**kwargs):
+            started.set()
+            release.wait(5)
+            return "Código ABAP gerado"
+
+        provider = mock.MagicMock()
+        provider.generate.side_effect = slow_generate
+
+        with mock.patch.dict(os.environ, {
+            "GROQ_API_KEY": "test_key", "OPENAI_API_KEY": "test_key", "ABAPIFY_CACHE_DIR": cache_dir
+        }):
+            client = LLMClient()
+            client._providers["groq"] = provider
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                first = executor.submit(client.generate, "Sistema", "Usuário", provider="groq", temperature=0)
+                started.wait(5)
+                second = executor.submit(client.generate, "Sistema", "Usuário", provider="groq", temperature=0)
+                time.sleep(0.1)
+                release.set()
+
+            self.assertEqual(first.result(), second.result())
+
+        provider.generate.assert_called_once()
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para os clientes e o analisador de metadados SAP.
+"""
+
+import base64
+import json
+import os
+import subprocess
+import sys
+import warnings
+from unittest import TestCase, mock
+
+from abapify.sap import auth as auth_module
+from abapify.sap.auth import SAPAuthenticator
+from abapify.sap.clients import http_client
+from abapify.sap.clients.http_client import HTTPClient, _join
+from abapify.sap.clients.rfc_client import RFCClient
+from abapify.sap.exceptions import SAPAuthenticationError, SAPHTTPError
+from abapify.sap.metadata_analyzer import MetadataAnalyzer
+from abapify.sap.models import SAPConnectionConfig, SAPTable
+
+
+class TestRFCClient(TestCase):
+    """Testes para o cliente RFC."""
+
+    def setUp(self):
+        """Configuração dos testes."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            self.client = RFCClient(SAPConnectionConfig())
+
+    def test_nested_contexts_share_connection(self):
+        """Testa se contextos aninhados reaproveitam uma única conexão."""
+        def connect():
+            self.client._connection = "http_fallback"
+
+        with mock.patch.object(self.client, "connect", side_effect=connect) as mock_connect:
+            with self.client.connection_context():
+                with self.client.connection_context():
+                    self.assertEqual("http_fallback", self.client._connection)
+                self.assertEqual("http_fallback", self.client._connection)
+
+        mock_connect.assert_called_once()
+        self.assertIsNone(self.client._connection)
+
+    def test_table_structure_is_cached_until_invalidated(self):
+        """Testa se estruturas de tabela são reaproveitadas até expirar ou serem descartadas."""
+        with mock.patch.object(self.client, "call_function", side_effect=lambda *a, **kw: {"NAME": kw["NAME"]}) as call:
+            first = self.client.get_table_structure("MARA")
+            self.assertIs(first, self.client.get_table_structure("MARA"))
+            self.assertEqual(1, call.call_count)
+
+            self.client.invalidate("MARA")
+            self.client.get_table_structure("MARA")
+            self.assertEqual(2, call.call_count)
+
+            with mock.patch.object(self.client, "STRUCT_CACHE_TTL", 0):
+                self.client.get_table_structure("MARA")
+            self.assertEqual(3, call.call_count)
+
+    def test_table_structure_cache_is_bounded(self):
+        """Testa se o cache descarta a estrutura usada há mais tempo quando cheio."""
+        with mock.patch.object(self.client, "STRUCT_CACHE_SIZE", 2), \
+             mock.patch.object(self.client, "call_function", side_effect=lambda *a, **kw: {}):
+            for table in ("MARA", "MAKT", "MARA", "MCHB"):
+                self.client.get_table_structure(table)
+
+        self.assertEqual(
+            [("MARA", "EN"), ("MCHB", "EN")],
+            list(self.client._struct_cache)
+        )
+
+
+class TestHTTPClient(TestCase):
+    """Testes para o cliente HTTP."""
+
+    def setUp(self):
+        """Configuração dos testes."""
+        self.client = HTTPClient(SAPConnectionConfig(connection_type="HTTP", base_url="https://sap.local"))
+
+    def _response(self, status_code=200, payload=None):
+        """Cria uma resposta HTTP simulada."""
+        response = mock.Mock(status_code=status_code, encoding="utf-8")
+        response.json.return_value = payload or {}
+        response.content = json.dumps(payload or {}).encode()
+        return response
+
+    def test_requests_reuse_joined_url(self):
+        """Testa se a URL de um endpoint repetido é montada uma única vez."""
+        _join.cache_clear()
+        with mock.patch.object(self.client.session, "request", return_value=self._response()) as request:
+            self.client.get("/sap/bc/ping")
+            self.client.get("/sap/bc/ping")
+
+        self.assertEqual("https://sap.local/sap/bc/ping", request.call_args.kwargs["url"])
+        self.assertEqual(1, _join.cache_info().misses)
+        self.assertEqual(1, _join.cache_info().hits)
+
+    def test_clients_share_sized_adapter(self):
+        """Testa se os clientes compartilham um adaptador dimensionado para rajadas."""
+        other = HTTPClient(SAPConnectionConfig(connection_type="HTTP", base_url="https://sap.local"))
+        adapter = self.client.session.get_adapter("https://sap.local")
+
+        self.assertIs(adapter, other.session.get_adapter("http://sap.local"))
+        self.assertEqual(64, adapter._pool_maxsize)
+        self.assertEqual(32, adapter._pool_connections)
+
+    def test_get_many_keeps_endpoint_order(self):
+        """Testa se get_many devolve as respostas na ordem dos endpoints."""
+        def request(method, url, **kwargs):
+            return self._response(payload={"url": url})
+
+        with mock.patch.object(self.client.session, "request", side_effect=request):
+            results = self.client.get_many(["/a", "/b", "/c"])
+
+        self.assertEqual(
+            ["https://sap.local/a", "https://sap.local/b", "https://sap.local/c"],
+            [result["url"] for result in results]
+        )
+        self.assertEqual([], self.client.get_many([]))
+
+    def test_json_body_parsed_from_bytes(self):
+        """Testa se, com orjson disponível, o corpo é lido direto dos bytes."""
+        response = self._response(payload={"d": {"results": []}})
+        response.json.side_effect = AssertionError("response.json() não deveria ser usado")
+
+        with mock.patch.object(http_client, "orjson", json):
+            with mock.patch.object(self.client.session, "request", return_value=response):
+                self.assertEqual({"d": {"results": []}}, self.client.get("/odata"))
+
+    def test_non_json_body_returned_as_text(self):
+        """Testa se corpos que não são JSON são devolvidos como texto."""
+        response = self._response()
+        response.content = b"<html/>"
+        response.text = "<html/>"
+        response.json.side_effect = json.JSONDecodeError("inválido", "<html/>", 0)
+
+        for parser in (None, json):
+            with mock.patch.object(http_client, "orjson", parser):
+                with mock.patch.object(self.client.session, "request", return_value=response):
+                    self.assertEqual({"content": "<html/>"}, self.client.get("/ping"))
+
+    def test_error_status_raises_matching_exception(self):
+        """Testa se respostas de erro levantam a exceção correspondente ao status."""
+        with mock.patch.object(self.client.session, "request", return_value=self._response(401)):
+            with self.assertRaises(SAPAuthenticationError):
+                self.client.get("/sap/bc/ping")
+
+        with mock.patch.object(self.client.session, "request", return_value=self._response(503)):
+            with self.assertRaises(SAPHTTPError) as ctx:
+                self.client.get("/sap/bc/ping")
+        self.assertEqual(503, ctx.exception.status_code)
+        self.assertEqual("/sap/bc/ping", ctx.exception.endpoint)
+
+    def test_error_message_truncates_large_body(self):
+        """Testa se apenas o início de corpos de erro grandes entra na mensagem."""
+        response = self._response(500)
+        response.content = "é".encode() + b"x" * 1_000_000
+
+        with mock.patch.object(self.client.session, "request", return_value=response):
+            with self.assertRaises(SAPHTTPError) as ctx:
+                self.client.get("/odata")
+
+        message = str(ctx.exception)
+        self.assertTrue(message.startswith("Erro HTTP 500: éx"))
+        self.assertLess(len(message), 2100)
+
+    def test_get_metadata_revalidates_with_etag(self):
+        """Testa se os metadados em cache são reaproveitados quando o servidor responde 304."""
+        first = self._response()
+        first.headers = {"ETag": 'W/"v1"'}
+        first.text = "<edmx/>"
+        not_modified = self._response(304)
+        metadata = {"edmx": None}
+
+        with mock.patch.dict(sys.modules, {"xmltodict": mock.Mock(parse=mock.Mock(return_value=metadata))}):
+            with mock.patch.object(self.client.session, "request", side_effect=[first, not_modified]) as request:
+                self.assertEqual(metadata, self.client.get_metadata("ZSRV"))
+                self.assertIs(metadata, self.client.get_metadata("ZSRV"))
+
+        self.assertNotIn("If-None-Match", request.call_args_list[0].kwargs["headers"])
+        self.assertEqual('W/"v1"', request.call_args_list[1].kwargs["headers"]["If-None-Match"])
+
+
+class TestSAPAuthenticator(TestCase):
+    """Testes para o autenticador SAP."""
+
+    def test_authenticators_share_cipher(self):
+        """Testa se instâncias diferentes reaproveitam a mesma cifra."""
+        first, second = SAPAuthenticator(), SAPAuthenticator()
+
+        self.assertIs(first._cipher_suite, second._cipher_suite)
+        self.assertEqual("segredo", second.decrypt_password(first.encrypt_password("segredo")))
+
+    def test_decrypt_accepts_legacy_double_base64(self):
+        """Testa se senhas salvas no formato antigo continuam legíveis."""
+        auth = SAPAuthenticator()
+        token = auth.encrypt_password("segredo")
+        legacy = base64.urlsafe_b64encode(token.encode()).decode()
+
+        self.assertTrue(token.startswith("gAAAAA"))
+        with mock.patch.object(auth_module._get_cipher(), "decrypt", wraps=auth_module._get_cipher().decrypt) as decrypt:
+            self.assertEqual("segredo", auth.decrypt_password(legacy))
+            self.assertEqual("segredo", auth.decrypt_password(token))
+        self.assertEqual(2, decrypt.call_count)
+
+    def test_validate_credentials_checks_fields_per_type(self):
+        """Testa se os campos obrigatórios dependem do tipo de conexão."""
+        auth = SAPAuthenticator()
+        http = SAPConnectionConfig(connection_type="HTTP", base_url="https://sap.local", user="u", passwd="p")
+
+        self.assertTrue(auth.validate_credentials(http))
+        self.assertFalse(auth.validate_credentials(SAPConnectionConfig(connection_type="RFC", user="u", passwd="p")))
+
+    def test_get_connection_config_reads_environment_prefix(self):
+        """Testa se a configuração do ambiente é montada a partir das variáveis SAP_<ENV>_."""
+        env = {
+            "SAP_QAS_ASHOST": "sapqas",
+            "SAP_QAS_CLIENT": "200",
+            "SAP_QAS_TIMEOUT": "60",
+            "SAP_QAS_USE_SSL": "false",
+            "SAP_DEV_ASHOST": "sapdev",
+        }
+        with mock.patch.dict(os.environ, env, clear=True):
+            config = SAPAuthenticator().get_connection_config("QAS")
+
+        self.assertEqual("sapqas", config.ashost)
+        self.assertEqual("200", config.client)
+        self.assertEqual(60, config.timeout)
+        self.assertFalse(config.use_ssl)
+        self.assertEqual("RFC", config.connection_type)
+
+    def test_get_connection_config_reuses_decrypted_config(self):
+        """Testa se a configuração só é remontada quando as variáveis do ambiente mudam."""
+        auth = SAPAuthenticator()
+        env = {"SAP_DEV_ASHOST": "sapdev", "SAP_DEV_PASSWD_ENCRYPTED": auth.encrypt_password("segredo")}
+
+        with mock.patch.dict(os.environ, env, clear=True):
+            with mock.patch("abapify.sap.auth._decrypt", wraps=auth_module._decrypt) as decrypt:
+                first = auth.get_connection_config("DEV")
+                second = SAPAuthenticator().get_connection_config("DEV")
+                os.environ["SAP_DEV_ASHOST"] = "sapdev2"
+                third = auth.get_connection_config("DEV")
+
+        self.assertEqual("segredo", first.passwd)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual("sapdev2", third.ashost)
+        self.assertEqual(2, decrypt.call_count)
+
+
+class TestMetadataAnalyzer(TestCase):
+    """Testes para o analisador de metadados."""
+
+    def test_analyze_multiple_tables_keeps_order_and_skips_failures(self):
+        """Testa se a análise em lote preserva a ordem e ignora tabelas com erro."""
+        connection = mock.MagicMock()
+        analyzer = MetadataAnalyzer(connection)
+
+        def analyze(table_name):
+            if table_name == "ZERRO":
+                raise RuntimeError("falha")
+            return SAPTable(name=table_name)
+
+        with mock.patch.object(analyzer, "analyze_table", side_effect=analyze):
+            tables = analyzer.analyze_multiple_tables(["MARA", "ZERRO", "MAKT", "MCHB"])
+
+        self.assertEqual(["MARA", "MAKT", "MCHB"], [table.name for table in tables])
+        connection.rfc_connection.assert_called_once()
+
+    def test_generate_full_analysis_collects_all_phases(self):
+        """Testa se a análise completa reúne tabelas e objetos customizados."""
+        from abapify.sap.models import SAPObject
+
+        analyzer = MetadataAnalyzer(mock.MagicMock())
+        custom_object = SAPObject(name="ZCL_PEDIDOS", object_type="CLAS", package="ZSD")
+
+        with mock.patch.object(analyzer, "analyze_multiple_tables", return_value=[SAPTable(name="MARA")]), \
+             mock.patch.object(analyzer, "_analyze_table_relationships", return_value=[]), \
+             mock.patch.object(analyzer, "analyze_custom_objects", return_value=[custom_object]):
+            result = analyzer.generate_full_analysis(["MARA"])
+
+        self.assertEqual(["MARA"], [table.name for table in result.tables])
+        self.assertEqual([custom_object], result.custom_objects)
+        self.assertEqual({"ZC": 1}, result.patterns["prefixes"])
+
+    def test_search_custom_tables_skips_rfc_without_limit(self):
+        """Testa se um limite menor que 1 não consulta o SAP (ROWCOUNT=0 é "sem limite")."""
+        connection = mock.MagicMock()
+        analyzer = MetadataAnalyzer(connection)
+
+        self.assertEqual([], analyzer.search_custom_tables("Z*", limit=0))
+        self.assertEqual([], analyzer.search_custom_tables("Z*", limit=-5))
+        connection.rfc_connection.assert_not_called()
+
+
+class TestSAPPackage(TestCase):
+    """Testes para as importações do pacote SAP."""
+
+    def test_package_import_is_lazy(self):
+        """Testa se importar abapify.sap não carrega conexão, clientes ou cryptography."""
+        code = (
+            "import sys, abapify.sap; "
+            "print(any(m in sys.modules for m in "
+            "('abapify.sap.connection', 'abapify.sap.auth', 'cryptography')))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        self.assertEqual("False", result.stdout.strip())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para os comandos de integração SAP.
+"""
+
+import os
+import shutil
+import tempfile
+from unittest import TestCase, mock
+
+from abapify.cli import sap_commands
+from abapify.sap.models import SAPAnalysisResult, SAPTable
+
+
+class TestSapCommands(TestCase):
+    """Testes para os comandos de integração SAP."""
+
+    def setUp(self):
+        """Configuração dos testes."""
+        self.cache_dir = tempfile.mkdtemp()
+        self.env_patcher = mock.patch.dict(os.environ, {"ABAPIFY_CACHE_DIR": self.cache_dir})
+        self.env_patcher.start()
+
+    def tearDown(self):
+        """Limpeza após os testes."""
+        self.env_patcher.stop()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    @mock.patch("abapify.sap.MetadataAnalyzer")
+    @mock.patch("abapify.sap.SAPConnection")
+    def test_full_analysis_uses_cache(self, mock_connection, mock_analyzer):
+        """Testa se a análise completa recente é reaproveitada sem conectar ao SAP."""
+        mock_analyzer.return_value.generate_full_analysis.return_value = SAPAnalysisResult(
+            tables=[SAPTable(name="MARA", description="Dados gerais de material")]
+        )
+
+        first = sap_commands._full_analysis(["MARA"], "DEV")
+        second = sap_commands._full_analysis(["MARA"], "DEV")
+
+        self.assertEqual(first, second)
+        mock_connection.assert_called_once_with(environment="DEV")
+        mock_connection.return_value.close.assert_called_once()
+
+    @mock.patch("abapify.sap.MetadataAnalyzer")
+    @mock.patch("abapify.sap.SAPConnection")
+    def test_full_analysis_cache_expires(self, mock_connection, mock_analyzer):
+        """Testa se uma análise em cache mais antiga que o TTL é refeita."""
+        mock_analyzer.return_value.generate_full_analysis.return_value = SAPAnalysisResult()
+
+        with mock.patch.dict(os.environ, {"ABAPIFY_SAP_CACHE_TTL": "-1"}):
+            sap_commands._full_analysis(["MARA"], "DEV")
+            sap_commands._full_analysis(["MARA"], "DEV")
+
+        self.assertEqual(2, mock_connection.call_count)
+
+    @mock.patch("abapify.sap.MetadataAnalyzer")
+    @mock.patch("abapify.sap.SAPConnection")
+    def test_invalid_cache_ttl_falls_back_to_default(self, mock_connection, mock_analyzer):
+        """Testa se um ABAPIFY_SAP_CACHE_TTL malformado usa o TTL padrão em vez de falhar."""
+        mock_analyzer.return_value.generate_full_analysis.return_value = SAPAnalysisResult()
+
+        with mock.patch.dict(os.environ, {"ABAPIFY_SAP_CACHE_TTL": "uma hora"}):
+            self.assertEqual(3600.0, sap_commands._sap_cache_ttl())
+            sap_commands._full_analysis(["MARA"], "DEV")
+            sap_commands._full_analysis(["MARA"], "DEV")
+
+        mock_connection.assert_called_once_with(environment="DEV")
+
+    @mock.patch("abapify.sap.MetadataAnalyzer")
+    @mock.patch("abapify.sap.SAPConnection")
+    def test_unreadable_cache_entry_is_a_miss(self, mock_connection, mock_analyzer):
+        """Testa se uma entrada de cache ilegível é tratada como ausente."""
+        mock_analyzer.return_value.generate_full_analysis.return_value = SAPAnalysisResult()
+
+        sap_commands._full_analysis(["MARA"], "DEV")
+        with mock.patch("pathlib.Path.read_text", side_effect=PermissionError("sem permissão")):
+            sap_commands._full_analysis(["MARA"], "DEV")
+
+        self.assertEqual(2, mock_connection.call_count)